@@ -0,0 +1,56 @@
+"""Benchmark: bulk post creation throughput versus concurrency.
+
+Runs ``GhostClient.post_many`` against an in-process stand-in for Ghost that
+answers each request after a fixed latency and serves at most
+``SERVER_LIMIT`` requests at once.
+
+    python benchmarks/bench_bulk.py
+"""
+
+import asyncio
+import time
+
+import httpx
+
+from ghost_mcp.client import GhostClient
+from ghost_mcp.tools.posts import _new_post_data
+
+KEY = "testid1234567890:aabbccddee112233445566778899aabb"
+POSTS = 64
+LATENCY = 0.02
+SERVER_LIMIT = 8
+
+
+def stand_in_server() -> httpx.MockTransport:
+    slots = asyncio.Semaphore(SERVER_LIMIT)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        async with slots:
+            await asyncio.sleep(LATENCY)
+        return httpx.Response(201, json={"posts": [{"id": "x", "slug": "x", "status": "draft"}]})
+
+    return httpx.MockTransport(handler)
+
+
+async def run(concurrency: int) -> float:
+    client = GhostClient("http://bench.ghost.io", KEY)
+    client._client = httpx.AsyncClient(transport=stand_in_server())
+    payloads = [
+        _new_post_data(client, f"Post {i}", f"# Post {i}\n\n" + "Paragraph text. " * 200)
+        for i in range(POSTS)
+    ]
+    started = time.perf_counter()
+    await client.post_many("posts/?source=html", payloads, concurrency=concurrency)
+    elapsed = time.perf_counter() - started
+    await client.close()
+    return POSTS / elapsed
+
+
+async def main():
+    print(f"{POSTS} posts, {LATENCY * 1e3:.0f} ms server latency, server limit {SERVER_LIMIT}")
+    for concurrency in (1, 2, 4, 8, 16):
+        print(f"  concurrency {concurrency:>2}: {await run(concurrency):7.1f} posts/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
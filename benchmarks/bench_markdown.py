@@ -0,0 +1,109 @@
+"""Benchmark: Markdown conversion cost and event-loop stalls.
+
+Compares building a fresh ``markdown.Markdown`` per call (the previous
+behaviour) with the per-thread reusable converter, the content-hash cache,
+and how long the event loop is blocked while a tool converts a document.
+
+    python benchmarks/bench_markdown.py
+"""
+
+import asyncio
+import time
+import timeit
+
+import markdown
+
+from ghost_mcp import converters
+from ghost_mcp.converters import EXTENSIONS, markdown_to_html, markdown_to_html_async
+
+SECTION = """## Section {n}
+
+Some *emphasis*, some **bold** text and a [link](https://example.com/{n}).
+
+- item one
+- item two
+
+| A | B |
+|---|---|
+| {n} | {n} |
+
+```python
+print({n})
+```
+
+"""
+
+
+def corpus(sections: int) -> str:
+    return "# Title\n\n" + "".join(SECTION.format(n=n) for n in range(sections))
+
+
+CORPORA = {
+    "small": corpus(2),
+    "medium": corpus(50),
+    "very large": corpus(2000),
+}
+
+
+def bench_conversion():
+    print(f"{'corpus':<12}{'chars':>10}{'fresh':>12}{'pooled':>12}{'cached':>12}")
+    for name, text in CORPORA.items():
+        number = max(1, 200_000 // len(text))
+
+        def fresh():
+            markdown.markdown(text, extensions=EXTENSIONS)
+
+        def pooled():
+            converters.clear_cache()
+            markdown_to_html(text)
+
+        fresh_t = min(timeit.repeat(fresh, number=number, repeat=3)) / number
+        pooled_t = min(timeit.repeat(pooled, number=number, repeat=3)) / number
+        markdown_to_html(text)
+        cached_t = min(timeit.repeat(lambda: markdown_to_html(text), number=number, repeat=3)) / number
+        print(
+            f"{name:<12}{len(text):>10}"
+            f"{fresh_t * 1e3:>10.3f}ms{pooled_t * 1e3:>10.3f}ms{cached_t * 1e3:>10.3f}ms"
+        )
+
+
+async def max_loop_stall(convert) -> float:
+    """Longest gap between 1 ms ticks of a heartbeat task while ``convert`` runs."""
+    worst = 0.0
+    running = True
+
+    async def heartbeat():
+        nonlocal worst
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            worst = max(worst, now - last)
+            last = now
+
+    task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    await convert()
+    running = False
+    await task
+    return worst
+
+
+async def bench_loop_stall():
+    text = CORPORA["very large"]
+
+    async def inline():
+        markdown.markdown(text, extensions=EXTENSIONS)
+
+    async def offloaded():
+        converters.clear_cache()
+        await markdown_to_html_async(text)
+
+    print(f"\nevent loop stall converting {len(text)} chars:")
+    print(f"  inline:    {await max_loop_stall(inline) * 1e3:8.1f} ms")
+    print(f"  offloaded: {await max_loop_stall(offloaded) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    bench_conversion()
+    asyncio.run(bench_loop_stall())
@@ -0,0 +1,86 @@
+"""Benchmark: upload bytes and time with and without image optimization.
+
+Uploads a set of photo-like PNGs through ``ghost_upload_images`` to an
+in-process stand-in for Ghost whose link runs at ``BANDWIDTH`` bytes/s.
+Requires the ``images`` extra.
+
+    python benchmarks/bench_optimize.py
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from mcp.server.fastmcp import FastMCP
+from PIL import Image
+
+from ghost_mcp.client import GhostClient
+from ghost_mcp.imaging import ImageOptimizer, ImageOptions
+from ghost_mcp.tools.images import register_image_tools
+
+KEY = "testid1234567890:aabbccddee112233445566778899aabb"
+FILES = 8
+SIZE = (2400, 1600)
+BANDWIDTH = 5 * 1024 * 1024  # 40 Mbit/s uplink
+
+
+class SlowLinkTransport(httpx.AsyncBaseTransport):
+    def __init__(self):
+        self.sent = 0
+        self._link = asyncio.Lock()  # concurrent uploads share the uplink
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async for chunk in request.stream:
+            self.sent += len(chunk)
+            async with self._link:
+                await asyncio.sleep(len(chunk) / BANDWIDTH)
+        return httpx.Response(201, json={"images": [{"url": "http://bench.ghost.io/content/images/x"}]})
+
+
+def make_photo(path: Path, seed: int) -> None:
+    noise = Image.effect_noise(SIZE, 30 + seed).convert("RGB")
+    gradient = Image.linear_gradient("L").resize(SIZE).convert("RGB")
+    Image.blend(noise, gradient, 0.6).save(path)
+
+
+async def run(directory: str, optimizer: ImageOptimizer | None) -> tuple[int, float]:
+    transport = SlowLinkTransport()
+    client = GhostClient("http://bench.ghost.io", KEY)
+    client._client = httpx.AsyncClient(transport=transport)
+    client.image_optimizer = optimizer
+    mcp = FastMCP("bench")
+    register_image_tools(mcp, client)
+    upload_images = mcp._tool_manager._tools["ghost_upload_images"].fn
+
+    started = time.perf_counter()
+    result = await upload_images(pattern=f"{directory}/*.png", concurrency=4)
+    elapsed = time.perf_counter() - started
+    await client.close()
+    assert result.startswith(f"Uploaded images: {FILES}/{FILES}"), result
+    return transport.sent, elapsed
+
+
+async def main():
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(FILES):
+            make_photo(Path(directory, f"{i}.png"), i)
+        total = sum(p.stat().st_size for p in Path(directory).glob("*.png"))
+        print(f"{FILES} PNGs of {SIZE[0]}x{SIZE[1]}, {total / 2**20:.1f} MiB, {BANDWIDTH * 8 / 2**20:.0f} Mbit/s link")
+
+        sent, elapsed = await run(directory, None)
+        print(f"  {'original':>22}: {sent / 2**20:6.1f} MiB sent, {elapsed:5.2f} s")
+        for options in (ImageOptions(format="webp"), ImageOptions(format="jpeg"), ImageOptions(format="avif")):
+            optimizer = ImageOptimizer(options)
+            await optimizer.optimize(Path(directory, "0.png"))  # start the worker pool outside the timing
+            sent, elapsed = await run(directory, optimizer)
+            optimizer.close()
+            label = f"{options.format}, max {options.max_dimension}px"
+            print(f"  {label:>22}: {sent / 2**20:6.1f} MiB sent, {elapsed:5.2f} s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+"""Micro-benchmark: per-request auth header overhead.
+
+Compares signing a fresh JWT for every request (the previous behaviour)
+with the cached, time-windowed token used by ``GhostClient._headers``.
+
+    python benchmarks/bench_token.py
+"""
+
+import timeit
+
+from ghost_mcp.client import GhostClient
+
+KEY = "testid1234567890:aabbccddee112233445566778899aabb"
+N = 20_000
+
+
+def main():
+    client = GhostClient("http://bench.ghost.io", KEY)
+
+    def fresh_headers():
+        return {
+            "Authorization": f"Ghost {client._generate_token()}",
+            "Accept-Version": "v5.0",
+            "Content-Type": "application/json",
+        }
+
+    fresh = min(timeit.repeat(fresh_headers, number=N, repeat=3)) / N
+    cached = min(timeit.repeat(client._headers, number=N, repeat=3)) / N
+
+    print(f"fresh token per request: {fresh * 1e6:8.2f} us")
+    print(f"cached token:            {cached * 1e6:8.2f} us")
+    print(f"speedup:                 {fresh / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: peak memory of concurrent image uploads, buffered versus streamed.
+
+Each mode runs in its own subprocess so ``ru_maxrss`` reflects only that
+mode. The stand-in for Ghost drains the request body chunk by chunk, like a
+real socket would, instead of collecting it.
+
+    python benchmarks/bench_upload.py
+"""
+
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from ghost_mcp.client import GhostClient
+
+KEY = "testid1234567890:aabbccddee112233445566778899aabb"
+UPLOADS = 32
+FILE_SIZE = 10 * 1024 * 1024
+LATENCY = 0.05
+
+
+class DrainingTransport(httpx.AsyncBaseTransport):
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async for _ in request.stream:
+            await asyncio.sleep(0)  # give the other uploads a turn, as socket writes would
+        await asyncio.sleep(LATENCY)
+        return httpx.Response(201, json={"images": [{"url": "http://bench.ghost.io/x.png"}]})
+
+
+async def upload_buffered(client: GhostClient, path: str) -> dict:
+    # What ghost_upload_image did before uploads were streamed.
+    with open(path, "rb") as f:
+        files = {"file": (os.path.basename(path), f.read(), "image/png")}
+    return await client.post("images/upload/", files=files)
+
+
+async def upload_streamed(client: GhostClient, path: str) -> dict:
+    return await client.upload("images/upload/", path, "image/png")
+
+
+async def run(mode: str, path: str) -> None:
+    client = GhostClient("http://bench.ghost.io", KEY)
+    client._client = httpx.AsyncClient(transport=DrainingTransport())
+    upload = upload_streamed if mode == "streamed" else upload_buffered
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    await asyncio.gather(*(upload(client, path) for _ in range(UPLOADS)))
+    elapsed = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    await client.close()
+    scale = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is KiB on Linux, bytes on macOS
+    print(f"  {mode:>8}: peak RSS +{(peak - baseline) * scale / 2**20:7.1f} MiB, {elapsed:5.2f} s")
+
+
+def main():
+    print(f"{UPLOADS} concurrent uploads of a {FILE_SIZE // 2**20} MiB file")
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+        f.write(os.urandom(FILE_SIZE))
+    try:
+        for mode in ("buffered", "streamed"):
+            subprocess.run([sys.executable, __file__, mode, f.name], check=True)
+    finally:
+        os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        asyncio.run(run(sys.argv[1], sys.argv[2]))
+    else:
+        main()
@@ -0,0 +1,67 @@
+"""Benchmark: ghost_upload_images throughput versus concurrency.
+
+Uploads a directory of images through the tool against an in-process
+stand-in for Ghost that answers each upload after a fixed latency and
+serves at most ``SERVER_LIMIT`` uploads at once.
+
+    python benchmarks/bench_upload_batch.py
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from mcp.server.fastmcp import FastMCP
+
+from ghost_mcp.client import GhostClient
+from ghost_mcp.tools.images import register_image_tools
+
+KEY = "testid1234567890:aabbccddee112233445566778899aabb"
+FILES = 40
+FILE_SIZE = 512 * 1024
+LATENCY = 0.05
+SERVER_LIMIT = 8
+
+
+def stand_in_server() -> httpx.MockTransport:
+    slots = asyncio.Semaphore(SERVER_LIMIT)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        async with slots:
+            await asyncio.sleep(LATENCY)
+        return httpx.Response(201, json={"images": [{"url": "http://bench.ghost.io/content/images/x.png"}]})
+
+    return httpx.MockTransport(handler)
+
+
+async def run(directory: str, concurrency: int) -> float:
+    client = GhostClient("http://bench.ghost.io", KEY)
+    client._client = httpx.AsyncClient(transport=stand_in_server())
+    mcp = FastMCP("bench")
+    register_image_tools(mcp, client)
+    upload_images = mcp._tool_manager._tools["ghost_upload_images"].fn
+
+    started = time.perf_counter()
+    result = await upload_images(pattern=f"{directory}/*.png", concurrency=concurrency)
+    elapsed = time.perf_counter() - started
+    await client.close()
+    assert result.startswith(f"Uploaded images: {FILES}/{FILES}"), result
+    return FILES / elapsed
+
+
+async def main():
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # FastMCP logs every request at INFO
+    print(f"{FILES} images of {FILE_SIZE // 1024} KiB, {LATENCY * 1e3:.0f} ms server latency, server limit {SERVER_LIMIT}")
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(FILES):
+            Path(directory, f"{i:03d}.png").write_bytes(os.urandom(FILE_SIZE))
+        for concurrency in (1, 2, 4, 8, 16):
+            print(f"  concurrency {concurrency:>2}: {await run(directory, concurrency):7.1f} images/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
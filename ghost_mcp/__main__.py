@@ -1,18 +1,142 @@
 """Entry point for Ghost MCP server."""
 
 import argparse
+import asyncio
 import os
 import sys
 
-from ghost_mcp.server import create_server, resolve_config
+from ghost_mcp.cache import ResponseCache
+from ghost_mcp.imaging import ImageOptimizer, ImageOptions
+from ghost_mcp.ratelimit import RateLimiter
+from ghost_mcp.retry import RetryPolicy
+from ghost_mcp.server import (
+    TRANSPORT_OPTIONS,
+    TRANSPORTS,
+    TRUE_VALUES,
+    create_server,
+    resolve_config,
+    resolve_transport,
+    serve,
+)
+from ghost_mcp.sites import DEFAULT_IDLE_TIMEOUT, load_sites
+from ghost_mcp.tracing import build_tracer
+
+
+def build_rate_limiter(max_rps: str | None, max_in_flight: str | None) -> RateLimiter | None:
+    """Adaptive rate limiter from CLI/env values; enabled by default."""
+    limiter = RateLimiter()
+    if max_rps:
+        max_rate = float(max_rps)
+        if max_rate <= 0:
+            return None
+        limiter.max_rate = max_rate
+        limiter.min_rate = min(limiter.min_rate, max_rate)
+        limiter.rate = min(limiter.rate, max_rate)
+    if max_in_flight:
+        limiter.max_in_flight = int(max_in_flight)
+        if limiter.max_in_flight < 1:
+            raise ValueError(f"max in-flight requests must be at least 1, got {limiter.max_in_flight}")
+    return limiter
 
 
 def main():
     parser = argparse.ArgumentParser(description="Ghost CMS MCP Server")
     parser.add_argument("--url", help="Ghost blog URL (or env GHOST_URL)")
     parser.add_argument("--key", help="Admin API key id:secret (or env GHOST_ADMIN_KEY)")
-    parser.add_argument("--tools", help="Tool groups to enable: posts,pages,tags,images (or env GHOST_TOOLS)")
+    parser.add_argument("--tools", help="Tool groups to enable: posts,pages,tags,images,search (or env GHOST_TOOLS)")
     parser.add_argument("--preset", help="Preset: all, writer, content, readonly (or env GHOST_PRESET)")
+    parser.add_argument("--max-connections", help="Connection pool size (or env GHOST_MAX_CONNECTIONS)")
+    parser.add_argument(
+        "--max-keepalive-connections",
+        help="Idle connections kept open (or env GHOST_MAX_KEEPALIVE_CONNECTIONS)",
+    )
+    parser.add_argument("--keepalive-expiry", help="Seconds an idle connection is kept (or env GHOST_KEEPALIVE_EXPIRY)")
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        default=None,
+        help="Enable HTTP/2, requires the http2 extra (or env GHOST_HTTP2)",
+    )
+    parser.add_argument("--connect-timeout", help="Connect timeout in seconds (or env GHOST_CONNECT_TIMEOUT)")
+    parser.add_argument("--read-timeout", help="Read timeout in seconds (or env GHOST_READ_TIMEOUT)")
+    parser.add_argument("--write-timeout", help="Write timeout in seconds (or env GHOST_WRITE_TIMEOUT)")
+    parser.add_argument("--pool-timeout", help="Seconds to wait for a free connection (or env GHOST_POOL_TIMEOUT)")
+    parser.add_argument(
+        "--warm-connections",
+        help="Connections to open at startup (or env GHOST_WARM_CONNECTIONS)",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        help="Attempts per request on 429/5xx/network errors, 1 disables retries (or env GHOST_MAX_ATTEMPTS)",
+    )
+    parser.add_argument(
+        "--max-rps",
+        help="Upper bound for the adaptive request rate, 0 disables limiting (or env GHOST_MAX_RPS)",
+    )
+    parser.add_argument("--max-in-flight", help="Concurrent API requests (or env GHOST_MAX_IN_FLIGHT)")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=None,
+        help="Cache GET responses in memory for a short TTL (or env GHOST_CACHE)",
+    )
+    parser.add_argument("--cache-size", help="Maximum cached responses (or env GHOST_CACHE_SIZE)")
+    parser.add_argument(
+        "--mirror",
+        help="SQLite file (or :memory:) for a local copy of posts, pages and tags (or env GHOST_MIRROR)",
+    )
+    parser.add_argument(
+        "--mirror-staleness",
+        help="Seconds mirrored content may lag behind Ghost, default 60 (or env GHOST_MIRROR_STALENESS)",
+    )
+    parser.add_argument(
+        "--image-index",
+        help="JSON file remembering uploaded images by content hash (or env GHOST_IMAGE_INDEX)",
+    )
+    parser.add_argument(
+        "--optimize-images",
+        help="Re-encode images before upload: webp, avif, jpeg or original; requires the images extra "
+        "(or env GHOST_OPTIMIZE_IMAGES)",
+    )
+    parser.add_argument(
+        "--image-max-dimension",
+        help="Downscale optimized images to at most this many pixels per side, default 2000 "
+        "(or env GHOST_IMAGE_MAX_DIMENSION)",
+    )
+    parser.add_argument(
+        "--image-quality",
+        help="Encoder quality for optimized images, default 82 (or env GHOST_IMAGE_QUALITY)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        help="Serve OpenMetrics at http://<metrics-host>:<port>/metrics (or env GHOST_METRICS_PORT)",
+    )
+    parser.add_argument(
+        "--metrics-host",
+        help="Interface for the metrics endpoint, default 127.0.0.1 (or env GHOST_METRICS_HOST)",
+    )
+    parser.add_argument(
+        "--trace",
+        help="Record a span tree per tool call: 'stderr' prints it, any other value is a JSON lines file "
+        "(or env GHOST_TRACE)",
+    )
+    parser.add_argument(
+        "--transport",
+        help="stdio (default), sse, or http (streamable HTTP); sse and http serve many sessions from one process "
+        "(or env GHOST_TRANSPORT)",
+    )
+    parser.add_argument("--host", help="Interface for sse/http, default 127.0.0.1 (or env GHOST_HOST)")
+    parser.add_argument("--port", help="Port for sse/http, default 8000 (or env GHOST_PORT)")
+    parser.add_argument(
+        "--sites",
+        help="TOML file of Ghost sites to serve instead of --url/--key; tools take a site argument "
+        "(or env GHOST_SITES)",
+    )
+    parser.add_argument(
+        "--site-idle-timeout",
+        help="Seconds before an unused site's client is closed, default 300 (or env GHOST_SITE_IDLE_TIMEOUT)",
+    )
+    parser.add_argument("--max-open-sites", help="Site clients kept open at once (or env GHOST_MAX_OPEN_SITES)")
 
     args = parser.parse_args()
 
@@ -20,22 +144,89 @@ def main():
     key = args.key or os.environ.get("GHOST_ADMIN_KEY")
     tools_arg = args.tools or os.environ.get("GHOST_TOOLS")
     preset_arg = args.preset or os.environ.get("GHOST_PRESET")
+    attempts_arg = args.max_attempts or os.environ.get("GHOST_MAX_ATTEMPTS")
+    max_rps_arg = args.max_rps or os.environ.get("GHOST_MAX_RPS")
+    in_flight_arg = args.max_in_flight or os.environ.get("GHOST_MAX_IN_FLIGHT")
+    cache_arg = args.cache or os.environ.get("GHOST_CACHE", "").strip().lower() in TRUE_VALUES
+    cache_size_arg = args.cache_size or os.environ.get("GHOST_CACHE_SIZE")
+    mirror_arg = args.mirror or os.environ.get("GHOST_MIRROR")
+    staleness_arg = args.mirror_staleness or os.environ.get("GHOST_MIRROR_STALENESS")
+    image_index_arg = args.image_index or os.environ.get("GHOST_IMAGE_INDEX")
+    optimize_arg = args.optimize_images or os.environ.get("GHOST_OPTIMIZE_IMAGES")
+    max_dimension_arg = args.image_max_dimension or os.environ.get("GHOST_IMAGE_MAX_DIMENSION")
+    quality_arg = args.image_quality or os.environ.get("GHOST_IMAGE_QUALITY")
+    metrics_port_arg = args.metrics_port or os.environ.get("GHOST_METRICS_PORT")
+    metrics_host_arg = args.metrics_host or os.environ.get("GHOST_METRICS_HOST")
+    trace_arg = args.trace or os.environ.get("GHOST_TRACE")
+    transport_arg = (args.transport or os.environ.get("GHOST_TRANSPORT") or "stdio").strip().lower()
+    host_arg = args.host or os.environ.get("GHOST_HOST")
+    port_arg = args.port or os.environ.get("GHOST_PORT")
+    sites_arg = args.sites or os.environ.get("GHOST_SITES")
+    idle_timeout_arg = args.site_idle_timeout or os.environ.get("GHOST_SITE_IDLE_TIMEOUT")
+    max_open_arg = args.max_open_sites or os.environ.get("GHOST_MAX_OPEN_SITES")
+    transport_args = {
+        name: getattr(args, name) or os.environ.get(f"GHOST_{name.upper()}")
+        for name in TRANSPORT_OPTIONS
+    }
 
-    if not url:
-        print("Error: provide URL via --url or GHOST_URL env variable", file=sys.stderr)
+    if not url and not sites_arg:
+        print("Error: provide URL via --url or GHOST_URL env variable, or a sites file via --sites", file=sys.stderr)
         sys.exit(1)
-    if not key:
+    if not key and not sites_arg:
         print("Error: provide key via --key or GHOST_ADMIN_KEY env variable", file=sys.stderr)
         sys.exit(1)
 
+    if transport_arg == "http":
+        transport_arg = "streamable-http"
+    if transport_arg not in TRANSPORTS:
+        print(f"Error: unknown transport '{transport_arg}'. Available: stdio, sse, http", file=sys.stderr)
+        sys.exit(1)
+
     try:
         tools, readonly = resolve_config(tools_arg, preset_arg)
-    except ValueError as e:
+        transport = resolve_transport(transport_args)
+        retry = RetryPolicy(max_attempts=int(attempts_arg)) if attempts_arg else None
+        rate_limiter = build_rate_limiter(max_rps_arg, in_flight_arg)
+        cache = None
+        if cache_arg:
+            cache = ResponseCache(max_entries=int(cache_size_arg)) if cache_size_arg else ResponseCache()
+        sites, default_site = load_sites(sites_arg) if sites_arg else (None, None)
+        image_optimizer = None
+        if optimize_arg:
+            options = ImageOptions(format=optimize_arg.strip().lower())
+            if max_dimension_arg:
+                options.max_dimension = int(max_dimension_arg) or None
+            if quality_arg:
+                options.quality = int(quality_arg)
+            image_optimizer = ImageOptimizer(options)
+        mcp = create_server(
+            url,
+            key,
+            tools=tools,
+            readonly=readonly,
+            transport=transport,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            mirror=mirror_arg,
+            mirror_staleness=float(staleness_arg) if staleness_arg else 60.0,
+            image_index=image_index_arg,
+            image_optimizer=image_optimizer,
+            metrics_port=int(metrics_port_arg) if metrics_port_arg else None,
+            metrics_host=metrics_host_arg or "127.0.0.1",
+            tracer=build_tracer(trace_arg) if trace_arg else None,
+            host=host_arg or "127.0.0.1",
+            port=int(port_arg) if port_arg else 8000,
+            sites=sites,
+            default_site=default_site,
+            site_idle_timeout=float(idle_timeout_arg) if idle_timeout_arg else DEFAULT_IDLE_TIMEOUT,
+            max_open_sites=int(max_open_arg) if max_open_arg else None,
+        )
+    except (ValueError, ImportError, OSError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    mcp = create_server(url, key, tools=tools, readonly=readonly)
-    mcp.run()
+    asyncio.run(serve(mcp, transport_arg))
 
 
 if __name__ == "__main__":
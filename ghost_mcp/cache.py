@@ -0,0 +1,336 @@
+"""In-process caches for Ghost Admin API responses."""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from ghost_mcp import tracing
+from ghost_mcp.ratelimit import endpoint_family
+
+DEFAULT_TTLS = {"posts": 30.0, "pages": 30.0, "tags": 60.0, "site": 300.0}
+
+# Writing to one family changes what others return: post/page writes can create
+# tags and change their post counts, tag writes change embedded post tags.
+RELATED_FAMILIES = {
+    "posts": {"tags"},
+    "pages": {"tags"},
+    "tags": {"posts", "pages"},
+}
+
+LIST_PARAMS = {"include", "fields", "formats"}
+
+VERSIONED_FAMILIES = ("posts", "pages", "tags")
+TAG_KEYS = ("id", "name", "slug", "updated_at")
+BODY_FIELDS = {"html", "lexical", "mobiledoc"}
+
+
+def cache_key(endpoint: str, params: dict | None) -> tuple:
+    """Key on the endpoint plus params, ignoring key order and comma-list order."""
+    items = []
+    for name, value in (params or {}).items():
+        value = str(value)
+        if name in LIST_PARAMS:
+            value = ",".join(sorted(v.strip() for v in value.split(",")))
+        items.append((name, value))
+    return endpoint.strip("/"), tuple(sorted(items))
+
+
+class ResponseCache:
+    """TTL + LRU cache with single-flight loading and write invalidation.
+
+    Cached responses are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 30.0,
+    ):
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[float, str, dict]] = OrderedDict()
+        self._pending: dict[tuple, asyncio.Future] = {}
+        self._generations: dict[str, int] = {}
+
+    async def get_or_fetch(
+        self,
+        endpoint: str,
+        params: dict | None,
+        fetch: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        key = cache_key(endpoint, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                tracing.current().set(cache="hit")
+                return value
+            del self._entries[key]
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            tracing.current().set(cache="coalesced")
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # Only the leader was cancelled; fetch again rather than fail a caller nobody cancelled.
+                return await self.get_or_fetch(endpoint, params, fetch)
+
+        self.misses += 1
+        tracing.current().set(cache="miss")
+        family = endpoint_family(endpoint)
+        generation = self._generations.get(family, 0)
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[key] = fut
+        try:
+            value = await fetch()
+        except Exception as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved when nobody else was waiting
+            raise
+        except BaseException:
+            fut.cancel()
+            raise
+        finally:
+            del self._pending[key]
+
+        fut.set_result(value)
+        # Skip storing if a write to this family landed while we were fetching.
+        if self._generations.get(family, 0) == generation:
+            self._store(key, family, value)
+        return value
+
+    def _store(self, key: tuple, family: str, value: dict) -> None:
+        ttl = self.ttls.get(family, self.default_ttl)
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, family, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, family: str) -> None:
+        """Drop cached responses for ``family`` and the families it affects."""
+        families = {family} | RELATED_FAMILIES.get(family, set())
+        for name in families:
+            self._generations[name] = self._generations.get(name, 0) + 1
+        stale = [key for key, (_, fam, _) in self._entries.items() if fam in families]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+        }
+
+
+class VersionMap:
+    """Last known ``updated_at`` and ``status`` per resource, learned from API responses.
+
+    Lets writes send Ghost's optimistic-locking ``updated_at`` without first
+    re-reading the resource.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._versions: OrderedDict[tuple[str, str], dict] = OrderedDict()
+
+    def record(self, payload: dict) -> None:
+        """Remember versions of every post/page/tag contained in a response."""
+        for family in VERSIONED_FAMILIES:
+            for item in payload.get(family) or ():
+                if not isinstance(item, dict) or "id" not in item or not item.get("updated_at"):
+                    continue
+                key = (family, item["id"])
+                known = self._versions.get(key)
+                # ISO-8601 timestamps compare correctly as strings; ignore older snapshots.
+                if known is not None and known["updated_at"] > item["updated_at"]:
+                    continue
+                version = {"updated_at": item["updated_at"], "status": item.get("status")}
+                if version["status"] is None and known is not None:
+                    version["status"] = known["status"]
+                self._versions[key] = version
+                self._versions.move_to_end(key)
+        while len(self._versions) > self.max_entries:
+            self._versions.popitem(last=False)
+
+    def get(self, family: str, id: str) -> dict | None:
+        return self._versions.get((family, id))
+
+    def forget(self, family: str, id: str) -> None:
+        self._versions.pop((family, id), None)
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+
+class TagIndex:
+    """Tag id, name and slug, learned from API responses and tag listings.
+
+    Lets writes reference existing tags by id, sparing Ghost a lookup (or a
+    duplicate) by name. Only what is already known is used; nothing here
+    makes requests. ``GhostClient.refresh_tags()`` loads the full list.
+    """
+
+    def __init__(self):
+        self._tags: dict[str, dict] = {}
+        self._ids: dict[str, str] = {}  # lower-case name or slug -> id
+        self.watermark: str | None = None  # newest updated_at seen by a refresh
+        self.full_loaded_at = 0.0
+
+    def add(self, tag: dict) -> None:
+        if not tag.get("id") or not tag.get("name"):
+            return
+        known = self._tags.get(tag["id"])
+        if known is not None:
+            if tag.get("updated_at") and (known["updated_at"] or "") > tag["updated_at"]:
+                return  # an older snapshot, e.g. embedded in a stale post
+            self._unlink(known)
+        entry = dict.fromkeys(TAG_KEYS) if known is None else dict(known)
+        entry.update((key, tag[key]) for key in TAG_KEYS if tag.get(key) is not None)
+        self._tags[tag["id"]] = entry
+        self._ids[entry["name"].lower()] = entry["id"]
+        if entry["slug"]:
+            self._ids[entry["slug"].lower()] = entry["id"]
+
+    def _unlink(self, entry: dict) -> None:
+        for key in (entry["name"], entry["slug"]):
+            if key and self._ids.get(key.lower()) == entry["id"]:
+                del self._ids[key.lower()]
+
+    def record(self, payload: dict) -> None:
+        """Remember tags listed in a response or embedded in its posts/pages."""
+        for tag in payload.get("tags") or ():
+            if isinstance(tag, dict):
+                self.add(tag)
+        for family in ("posts", "pages"):
+            for item in payload.get(family) or ():
+                if isinstance(item, dict):
+                    for tag in item.get("tags") or ():
+                        self.add(tag)
+
+    def forget(self, id: str) -> None:
+        entry = self._tags.pop(id, None)
+        if entry is not None:
+            self._unlink(entry)
+
+    def get(self, name_or_slug: str) -> dict | None:
+        """A known tag by id, name or slug (case-insensitive)."""
+        if name_or_slug in self._tags:
+            return self._tags[name_or_slug]
+        id = self._ids.get(name_or_slug.lower())
+        return self._tags[id] if id else None
+
+    def references(self, names: list[str]) -> list[dict]:
+        """Tag references for a post/page write: ``{"id"}`` when known, else ``{"name"}``."""
+        refs = []
+        for name in names:
+            tag = self.get(name)
+            refs.append({"id": tag["id"]} if tag else {"name": name})
+        return refs
+
+    def ids(self) -> set[str]:
+        return set(self._tags)
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+
+def source_hash(markdown: str) -> str:
+    return hashlib.sha256(markdown.encode()).hexdigest()
+
+
+class SourceMap:
+    """Markdown and field values last written per post/page, tied to the ``updated_at`` the write produced.
+
+    Lets an update skip re-rendering an unchanged body and send only the
+    fields that differ. An entry is only used while that ``updated_at`` is
+    still the latest version seen; writes built from it send the same
+    ``updated_at``, so Ghost rejects them if the resource changed unseen.
+    Bounded by entry count and by the total size of the Markdown held.
+    """
+
+    def __init__(self, max_entries: int = 1_000, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[tuple[str, str], dict] = OrderedDict()
+
+    def record(self, family: str, id: str, updated_at: str | None, fields: dict, markdown: str | None = None) -> None:
+        self.forget(family, id)
+        if not updated_at:
+            return
+        encoded = None if markdown is None else markdown.encode()
+        if encoded is not None and len(encoded) > self.max_bytes:
+            markdown = encoded = None  # keep the fields; the body is rendered afresh next time
+        size = 0 if encoded is None else len(encoded)
+        key = (family, id)
+        self._entries[key] = {
+            "updated_at": updated_at,
+            "fields": fields,
+            "markdown": markdown,
+            "hash": None if encoded is None else hashlib.sha256(encoded).hexdigest(),
+            "size": size,
+        }
+        self.size += size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted["size"]
+
+    def advance(self, family: str, id: str, updated_at: str, new_updated_at: str | None, fields: dict) -> None:
+        """Carry the entry recorded at ``updated_at`` over this server's write of ``fields``.
+
+        The write produced ``new_updated_at``. A write that replaced the body
+        drops the entry, since its Markdown no longer matches.
+        """
+        key = (family, id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        if entry["updated_at"] != updated_at or not new_updated_at or not BODY_FIELDS.isdisjoint(fields):
+            self.forget(family, id)
+            return
+        entry["updated_at"] = new_updated_at
+        entry["fields"] = {**entry["fields"], **fields}
+        self._entries.move_to_end(key)
+
+    def get(self, family: str, id: str, updated_at: str | None) -> dict | None:
+        """The entry for a resource if it was recorded at ``updated_at``; a stale entry is dropped."""
+        key = (family, id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry["updated_at"] != updated_at:
+            self.forget(family, id)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def forget(self, family: str, id: str) -> None:
+        entry = self._entries.pop((family, id), None)
+        if entry is not None:
+            self.size -= entry["size"]
+
+    def __len__(self) -> int:
+        return len(self._entries)
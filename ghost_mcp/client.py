@@ -1,39 +1,114 @@
 """Ghost Admin API client."""
 
-from datetime import datetime, timezone
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
 
 import httpx
-import jwt
+
+from ghost_mcp import tracing
+from ghost_mcp.cache import ResponseCache, SourceMap, TagIndex, VersionMap
+from ghost_mcp.multipart import MultipartFile
+from ghost_mcp.ratelimit import RateLimiter, endpoint_family
+from ghost_mcp.retry import RetryPolicy, is_idempotent, last_attempts
+
+TOKEN_TTL = 300  # Ghost rejects Admin API tokens that live longer than 5 minutes
+TOKEN_REFRESH_MARGIN = 60  # re-sign this many seconds before the token expires
+# Incremental tag refreshes can't see tags deleted outside this server; reload fully this often.
+TAG_FULL_RELOAD_INTERVAL = 3600.0
 
 
 class GhostAPIError(Exception):
     """Ghost API error."""
 
-    def __init__(self, status_code: int, message: str):
+    def __init__(self, status_code: int, message: str, attempts: int = 1):
         self.status_code = status_code
         self.message = message
+        self.attempts = attempts
         super().__init__(f"Ghost API Error {status_code}: {message}")
 
 
+@dataclass
+class TransportConfig:
+    """Connection pool, keep-alive and timeout settings for the HTTP client."""
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 10.0
+    warm_connections: int = 0
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
 class GhostClient:
     """Ghost Admin API client with JWT authentication."""
 
-    def __init__(self, url: str, admin_key: str):
+    def __init__(
+        self,
+        url: str,
+        admin_key: str,
+        transport: TransportConfig | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: ResponseCache | None = None,
+    ):
         parts = admin_key.split(":")
         if len(parts) != 2:
             raise ValueError("Invalid API key format. Expected: {id}:{secret}")
         self.base_url = f"{url.rstrip('/')}/ghost/api/admin"
         self.key_id = parts[0]
         self.key_secret = bytes.fromhex(parts[1])
+        self.transport = transport or TransportConfig()
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.versions = VersionMap()
+        self.tags = TagIndex()
+        self.sources = SourceMap()
+        self.mirror = None  # ContentMirror, attached by create_server when enabled
+        self.search_index = None  # in-memory ContentMirror built by the first search without a mirror
+        self.image_index = None  # UploadIndex, attached by create_server
+        self.image_optimizer = None  # ImageOptimizer, attached by create_server when enabled
+        self.metrics = None  # Metrics, attached by create_server
+        self._write_listeners: list[Callable[[str, str, dict], None]] = []
         self._client = httpx.AsyncClient(
-            timeout=30.0,
+            timeout=self.transport.timeout(),
+            limits=self.transport.limits(),
+            http2=self.transport.http2,
             follow_redirects=False,
         )
+        self._json_headers: dict[str, str] = {}
+        self._multipart_headers: dict[str, str] = {}
+        self._token_refresh_at = 0.0
 
-    def _generate_token(self) -> str:
+    def _generate_token(self, now: int | None = None) -> str:
         """Generate a short-lived JWT token for Ghost Admin API."""
-        now = int(datetime.now(timezone.utc).timestamp())
-        payload = {"iat": now, "exp": now + 300, "aud": "/admin/"}
+        import jwt  # deferred: it loads the cryptography backends, a large share of startup time
+
+        if now is None:
+            now = int(time.time())
+        payload = {"iat": now, "exp": now + TOKEN_TTL, "aud": "/admin/"}
         return jwt.encode(
             payload,
             self.key_secret,
@@ -41,43 +116,387 @@ class GhostClient:
             headers={"kid": self.key_id},
         )
 
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Ghost {self._generate_token()}",
+    def _rotate_token(self, now: float) -> None:
+        """Sign a fresh token and rebuild the cached header dicts around it."""
+        issued_at = int(now)
+        authorization = f"Ghost {self._generate_token(issued_at)}"
+        self._multipart_headers = {
+            "Authorization": authorization,
             "Accept-Version": "v5.0",
+        }
+        self._json_headers = {
+            **self._multipart_headers,
             "Content-Type": "application/json",
         }
+        self._token_refresh_at = issued_at + TOKEN_TTL - TOKEN_REFRESH_MARGIN
+
+    def _headers(self, multipart: bool = False) -> dict[str, str]:
+        """Return request headers, reusing one signed token until it nears expiry.
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> dict:
+        The returned dict is shared between requests and must not be mutated.
+        """
+        now = time.time()
+        if now >= self._token_refresh_at:
+            self._rotate_token(now)
+        return self._multipart_headers if multipart else self._json_headers
+
+    def on_write(self, listener: Callable[[str, str, dict], None]) -> None:
+        """Call ``listener(method, endpoint, result)`` after every successful write."""
+        self._write_listeners.append(listener)
+
+    @property
+    def last_attempts(self) -> int:
+        """Attempts taken by the most recent request made from the current task."""
+        return last_attempts.get()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: bool | None = None,
+        **kwargs,
+    ) -> dict:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        headers = self._headers()
-        if "files" in kwargs:
-            del headers["Content-Type"]
-        response = await self._client.request(method, url, headers=headers, **kwargs)
-        if response.status_code >= 400:
-            try:
-                error_data = response.json()
-                message = error_data.get("errors", [{}])[0].get("message", response.text)
-            except Exception:
-                message = response.text
-            raise GhostAPIError(response.status_code, message)
+        multipart = "files" in kwargs or isinstance(kwargs.get("content"), MultipartFile)
+        if idempotent is None:
+            idempotent = is_idempotent(method, kwargs.get("json"))
+            if method == "POST" and self.retry.retry_post:
+                idempotent = True
+
+        family = endpoint_family(endpoint)
+        if method == "GET":
+            return await self._attempt(family, method, url, multipart, idempotent, **kwargs)
+
+        # Invalidate before and after: reads overlapping the write must not be cached.
+        if self.cache is not None:
+            self.cache.invalidate(family)
+        try:
+            result = await self._attempt(family, method, url, multipart, idempotent, **kwargs)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(family)
+        for listener in self._write_listeners:
+            listener(method, endpoint, result)
+        return result
+
+    async def _attempt(
+        self,
+        family: str,
+        method: str,
+        url: str,
+        multipart: bool,
+        idempotent: bool,
+        **kwargs,
+    ) -> dict:
+        """Send a request, retrying per the retry policy."""
+        self.retry.budget.deposit()
+        attempt = 0
+        with tracing.span(f"{method} {family}", **{"http.method": method, "http.url": url}) as request_span:
+            while True:
+                attempt += 1
+                try:
+                    response = await self._send(family, method, url, multipart, **kwargs)
+                except httpx.TransportError as e:
+                    delay = self.retry.retry_delay(attempt, idempotent, error=e)
+                    if delay is None:
+                        last_attempts.set(attempt)
+                        raise
+                    request_span.event(f"retry in {delay:.2f}s")
+                    await asyncio.sleep(delay)
+                    continue
+
+                if response.status_code < 400:
+                    break
+                delay = self.retry.retry_delay(attempt, idempotent, response=response)
+                if delay is None:
+                    last_attempts.set(attempt)
+                    raise self._error(response, attempt)
+                request_span.event(f"retry in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+            request_span.set(attempts=attempt)
+        last_attempts.set(attempt)
         if response.status_code == 204:
             return {}
-        return response.json()
+        data = response.json()
+        self.versions.record(data)
+        self.tags.record(data)
+        return data
+
+    async def _send(self, family: str, method: str, url: str, multipart: bool, **kwargs) -> httpx.Response:
+        """Send a single attempt, recording it in ``metrics`` when attached."""
+        headers = self._headers(multipart=multipart)
+        extra = kwargs.pop("headers", None)
+        if extra:
+            headers = {**headers, **extra}
+        with tracing.span("http.attempt") as attempt:
+            if attempt.traceparent is not None:
+                headers = {**headers, "traceparent": attempt.traceparent}
+                kwargs["extensions"] = {"trace": tracing.httpx_hook(attempt)}
+            metrics = self.metrics
+            if metrics is None:
+                response = await self._dispatch(family, method, url, headers, **kwargs)
+            else:
+                started = metrics.http_started(family)
+                response = None
+                try:
+                    response = await self._dispatch(family, method, url, headers, **kwargs)
+                finally:
+                    metrics.http_finished(method, family, started, response)
+            attempt.set(**{"http.status_code": response.status_code})
+            return response
+
+    async def _dispatch(self, family: str, method: str, url: str, headers: dict, **kwargs) -> httpx.Response:
+        """Send the request, holding a rate limiter slot if one is configured."""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await self._client.request(method, url, headers=headers, **kwargs)
+
+        with tracing.span("ratelimit.wait"):
+            await limiter.acquire(family)
+        status = None
+        started = time.monotonic()
+        try:
+            response = await self._client.request(method, url, headers=headers, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            limiter.release(status, time.monotonic() - started)
 
-    async def get(self, endpoint: str, params: dict | None = None) -> dict:
-        return await self._request("GET", endpoint, params=params)
+    @staticmethod
+    def _error(response: httpx.Response, attempts: int) -> GhostAPIError:
+        try:
+            error_data = response.json()
+            message = error_data.get("errors", [{}])[0].get("message", response.text)
+        except Exception:
+            message = response.text
+        return GhostAPIError(response.status_code, message, attempts=attempts)
 
-    async def post(self, endpoint: str, data: dict | None = None, files=None) -> dict:
+    async def get(self, endpoint: str, params: dict | None = None, cached: bool = True) -> dict:
+        """GET from the API, served from the response cache when one is configured."""
+        if self.cache is None or not cached:
+            return await self._request("GET", endpoint, params=params)
+        with tracing.span("cache.lookup", endpoint=endpoint):
+            return await self.cache.get_or_fetch(
+                endpoint,
+                params,
+                lambda: self._request("GET", endpoint, params=params),
+            )
+
+    async def iterate(
+        self,
+        resource: str,
+        filter: str | None = None,
+        fields: str | None = None,
+        page_size: int | str = 100,
+        params: dict | None = None,
+    ) -> AsyncIterator[dict]:
+        """Yield every item of a list endpoint (``posts``, ``pages``, ``tags``...).
+
+        Walks ``meta.pagination`` and requests the next page while the current
+        one is being consumed, so only two pages are held at a time. Pass
+        ``page_size="all"`` to fetch everything in one request where Ghost
+        allows it.
+        """
+        query = {**(params or {}), "limit": page_size}
+        if filter:
+            query["filter"] = filter
+        if fields:
+            query["fields"] = fields
+        endpoint = f"{resource}/"
+
+        def fetch(page: int) -> asyncio.Future:
+            return asyncio.ensure_future(self.get(endpoint, params={**query, "page": page}, cached=False))
+
+        pending: asyncio.Future | None = fetch(1)
+        try:
+            while pending is not None:
+                result = await pending
+                pending = None
+                next_page = result.get("meta", {}).get("pagination", {}).get("next")
+                if next_page:
+                    pending = fetch(next_page)
+                for item in result.get(resource, []):
+                    yield item
+        finally:
+            if pending is not None:
+                pending.cancel()
+                # Swallow the prefetch's outcome so an early exit doesn't log it.
+                pending.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    async def post(
+        self,
+        endpoint: str,
+        data: dict | None = None,
+        files=None,
+        idempotent: bool | None = None,
+    ) -> dict:
+        """POST to the API. Pass ``idempotent=True`` to allow retries on 5xx/network errors."""
         if files:
-            return await self._request("POST", endpoint, files=files)
-        return await self._request("POST", endpoint, json=data)
+            return await self._request("POST", endpoint, idempotent=idempotent, files=files)
+        return await self._request("POST", endpoint, idempotent=idempotent, json=data)
+
+    async def upload(
+        self,
+        endpoint: str,
+        path: str | os.PathLike,
+        content_type: str,
+        size: int | None = None,
+        filename: str | None = None,
+    ) -> dict:
+        """POST a file as multipart/form-data, streaming it from disk.
+
+        ``size`` saves a ``stat`` when the caller already has it.
+        """
+        if size is None:
+            size = (await asyncio.to_thread(os.stat, path)).st_size
+        body = MultipartFile(path, content_type, size, filename=filename)
+        return await self._request("POST", endpoint, content=body, headers=body.headers)
+
+    async def post_many(
+        self,
+        endpoint: str,
+        payloads: Iterable[dict | Awaitable[dict]],
+        concurrency: int = 4,
+        idempotent: bool | None = None,
+    ) -> list[dict | Exception]:
+        """POST many payloads with at most ``concurrency`` requests in flight.
+
+        Payloads may be awaitables (e.g. pending Markdown conversions and
+        image uploads). At most ``concurrency`` of them are resolved ahead of
+        the requests, so preparing the next items overlaps with submitting
+        others without starting every item's work at once. Results keep input
+        order, with the exception in place of any item that failed.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        preparing = asyncio.Semaphore(concurrency)
+
+        async def submit(payload: dict | Awaitable[dict]) -> dict:
+            if isinstance(payload, dict):
+                async with semaphore:
+                    return await self.post(endpoint, data=payload, idempotent=idempotent)
+            # The preparation slot is held until a request slot frees up, which
+            # also bounds how many finished payloads wait in memory.
+            async with preparing:
+                payload = await payload
+                await semaphore.acquire()
+            try:
+                return await self.post(endpoint, data=payload, idempotent=idempotent)
+            finally:
+                semaphore.release()
+
+        return await asyncio.gather(*(submit(p) for p in payloads), return_exceptions=True)
 
     async def put(self, endpoint: str, data: dict) -> dict:
         return await self._request("PUT", endpoint, json=data)
 
     async def delete(self, endpoint: str) -> dict:
-        return await self._request("DELETE", endpoint)
+        result = await self._request("DELETE", endpoint)
+        parts = endpoint.strip("/").split("/")
+        if len(parts) == 2:
+            self.versions.forget(parts[0], parts[1])
+            self.sources.forget(parts[0], parts[1])
+            if parts[0] == "tags":
+                self.tags.forget(parts[1])
+        return result
+
+    async def refresh_tags(self, full: bool = False) -> TagIndex:
+        """Bring ``self.tags`` up to date with Ghost and return it.
+
+        The first call (and one every TAG_FULL_RELOAD_INTERVAL seconds) pages
+        through every tag and drops the ones Ghost no longer has; later calls
+        only fetch tags updated since the last refresh.
+        """
+        index = self.tags
+        now = time.time()
+        if index.watermark is None or now - index.full_loaded_at > TAG_FULL_RELOAD_INTERVAL:
+            full = True
+        nql = None if full else f"updated_at:>='{index.watermark}'"
+        seen: set[str] = set()
+        newest = index.watermark or ""
+        # Each page is recorded into the index as it arrives (see _attempt).
+        async for tag in self.iterate("tags", filter=nql, fields="id,name,slug,updated_at"):
+            seen.add(tag["id"])
+            newest = max(newest, tag.get("updated_at") or "")
+        if full:
+            for id in index.ids() - seen:
+                index.forget(id)
+            index.full_loaded_at = now
+        index.watermark = newest or None
+        return index
+
+    async def current_version(self, family: str, id: str, refresh: bool = False) -> dict:
+        """Last known ``updated_at``/``status`` of a resource.
+
+        Falls back to a minimal ``fields=id,updated_at,status`` read when the
+        version is unknown or ``refresh`` is set.
+        """
+        if not refresh:
+            known = self.versions.get(family, id)
+            tracing.current().set(version_cached=known is not None)
+            if known is not None:
+                return known
+        result = await self.get(
+            f"{family}/{id}/",
+            params={"fields": "id,updated_at,status"},
+            cached=False,
+        )
+        item = result[family][0]
+        return {"updated_at": item["updated_at"], "status": item.get("status")}
+
+    async def put_versioned(
+        self,
+        family: str,
+        id: str,
+        data: dict,
+        query: str = "",
+        updated_at: str | None = None,
+    ) -> dict:
+        """PUT a resource using its cached (or given) ``updated_at``.
+
+        On a 409 update collision the version is re-read once and the write
+        retried. A Markdown source recorded at the version written over is
+        carried forward to the new one.
+        """
+        endpoint = f"{family}/{id}/{query}"
+        if updated_at is None:
+            updated_at = (await self.current_version(family, id))["updated_at"]
+        try:
+            result = await self.put(endpoint, {family: [{**data, "updated_at": updated_at}]})
+        except GhostAPIError as e:
+            if e.status_code != 409:
+                raise
+            updated_at = (await self.current_version(family, id, refresh=True))["updated_at"]
+            result = await self.put(endpoint, {family: [{**data, "updated_at": updated_at}]})
+        items = result.get(family) or [{}]
+        self.sources.advance(family, id, updated_at, items[0].get("updated_at"), data)
+        return result
+
+    async def warmup(self) -> None:
+        """Open ``transport.warm_connections`` pooled connections ahead of the first tool call.
+
+        Uses the unauthenticated ``site/`` endpoint; failures are ignored since
+        the first real request will surface any connectivity problem.
+        """
+        count = self.transport.warm_connections
+        if count <= 0:
+            return
+        if self.transport.http2:
+            count = 1  # a single HTTP/2 connection multiplexes every request
+        url = f"{self.base_url}/site/"
+        await asyncio.gather(
+            *(self._client.head(url) for _ in range(count)),
+            return_exceptions=True,
+        )
+
+    async def media_status(self, url: str) -> int:
+        """Status of an unauthenticated HEAD request for an uploaded file's URL."""
+        response = await self._client.head(url, follow_redirects=True)
+        return response.status_code
+
+    def stream_media(self, url: str) -> AbstractAsyncContextManager[httpx.Response]:
+        """Stream an uploaded file, e.g. ``async with client.stream_media(url) as response``."""
+        return self._client.stream("GET", url, follow_redirects=True)
 
     async def close(self):
         await self._client.aclose()
@@ -1,6 +1,72 @@
 """Markdown to HTML conversion for Ghost API."""
 
-import markdown
+import asyncio
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+from ghost_mcp import tracing
+
+EXTENSIONS = ["fenced_code", "tables", "toc"]
+CACHE_SIZE = 128
+# Documents at least this long (in characters) are converted in a worker thread.
+OFFLOAD_THRESHOLD = 4_000
+
+# Concurrent uploads while rewriting local images referenced from Markdown.
+IMAGE_UPLOAD_CONCURRENCY = 4
+FENCE_RE = re.compile(r"^ {0,3}(`{3,}|~{3,}).*?^ {0,3}\1[ \t]*$", re.MULTILINE | re.DOTALL)
+IMAGE_REF_RE = re.compile(r"(!\[[^\]]*\]\(\s*)(<[^>\n]+>|[^)\s]+)")
+HTML_IMG_RE = re.compile(r"""(<img\b[^>]*?\bsrc\s*=\s*["'])([^"']+)""", re.IGNORECASE)
+SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]+:")
+HEADING_RE = re.compile(r"^ {0,3}(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$", re.MULTILINE)
+
+_local = threading.local()
+_cache: OrderedDict[bytes, str] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _converter():
+    """Per-thread Markdown instance; building one loads every extension.
+
+    ``markdown`` is imported here rather than at module level so starting the
+    server doesn't pay for it until the first conversion.
+    """
+    converter = getattr(_local, "converter", None)
+    if converter is None:
+        import markdown
+
+        converter = _local.converter = markdown.Markdown(extensions=EXTENSIONS)
+    return converter
+
+
+def _content_key(md_content: str) -> bytes:
+    return hashlib.blake2b(md_content.encode(), digest_size=16).digest()
+
+
+def _cached(key: bytes) -> str | None:
+    with _cache_lock:
+        html = _cache.get(key)
+        if html is not None:
+            _cache.move_to_end(key)
+        return html
+
+
+def _convert(md_content: str, key: bytes) -> str:
+    converter = _converter()
+    try:
+        html = converter.convert(md_content)
+    finally:
+        converter.reset()
+    with _cache_lock:
+        _cache[key] = html
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return html
 
 
 def markdown_to_html(md_content: str) -> str:
@@ -9,7 +75,175 @@ def markdown_to_html(md_content: str) -> str:
     Ghost API accepts HTML via ?source=html parameter
     and automatically converts it to Lexical format.
     """
-    return markdown.markdown(
-        md_content,
-        extensions=["fenced_code", "tables", "toc"],
-    )
+    key = _content_key(md_content)
+    html = _cached(key)
+    if html is None:
+        html = _convert(md_content, key)
+    return html
+
+
+async def markdown_to_html_async(md_content: str) -> str:
+    """Convert Markdown to HTML without stalling the event loop on large documents."""
+    with tracing.span("markdown.convert", chars=len(md_content)) as span:
+        key = _content_key(md_content)
+        html = _cached(key)
+        span.set(cached=html is not None)
+        if html is not None:
+            return html
+        if len(md_content) < OFFLOAD_THRESHOLD:
+            return _convert(md_content, key)
+        return await asyncio.to_thread(_convert, md_content, key)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+def _rewrite_outside_code(md_content: str, replace: Callable[[str], str]) -> str:
+    """Apply ``replace`` to image targets everywhere except fenced code blocks."""
+
+    def sub(text: str) -> str:
+        text = IMAGE_REF_RE.sub(lambda m: m.group(1) + replace(m.group(2)), text)
+        return HTML_IMG_RE.sub(lambda m: m.group(1) + replace(m.group(2)), text)
+
+    parts = []
+    last = 0
+    for fence in FENCE_RE.finditer(md_content):
+        parts.append(sub(md_content[last:fence.start()]))
+        parts.append(fence.group(0))
+        last = fence.end()
+    parts.append(sub(md_content[last:]))
+    return "".join(parts)
+
+
+def image_targets(md_content: str) -> list[str]:
+    """Targets of every Markdown/HTML image outside code blocks, in order, without duplicates."""
+    found: dict[str, None] = {}
+
+    def collect(target: str) -> str:
+        found[target] = None
+        return target
+
+    _rewrite_outside_code(md_content, collect)
+    return list(found)
+
+
+def local_image_path(target: str, base_dir: str | None = None) -> Path | None:
+    """The file an image target points at, or None if it is a URL.
+
+    ``file://`` URLs, relative paths (when ``base_dir`` is given) and
+    absolute paths of existing files are local. An absolute path that
+    doesn't exist is taken to be a site-relative URL such as
+    ``/content/images/...``. Raises ValueError for a local target that is missing.
+    """
+    target = target.strip("<>")
+    if target.startswith("file://"):
+        path = Path(url2pathname(urlparse(target).path))
+        if not path.is_file():
+            raise ValueError(f"image not found: {target}")
+        return path
+    if target.startswith(("//", "#")) or SCHEME_RE.match(target):
+        return None
+    path = Path(target).expanduser()
+    if not path.is_file() and target != unquote(target):
+        path = Path(unquote(target)).expanduser()
+    if path.is_absolute():
+        return path if path.is_file() else None
+    if base_dir is None:
+        return None
+    path = Path(base_dir).expanduser() / path
+    if not path.is_file():
+        raise ValueError(f"image not found: {target} (in {base_dir})")
+    return path
+
+
+async def upload_local_images(
+    md_content: str,
+    upload: Callable[[Path], Awaitable[str]],
+    base_dir: str | None = None,
+) -> str:
+    """Upload images the Markdown references on local disk and point it at their URLs.
+
+    Each distinct file is uploaded once, ``IMAGE_UPLOAD_CONCURRENCY`` at a
+    time, via ``upload(path) -> url``. Raises ValueError naming every image
+    that is missing or failed to upload; Markdown without local images is
+    returned unchanged.
+    """
+    targets = image_targets(md_content)
+    if not targets:
+        return md_content
+
+    def resolve() -> tuple[dict[str, Path], list[str]]:
+        paths, errors = {}, []
+        for target in targets:
+            try:
+                path = local_image_path(target, base_dir)
+            except ValueError as e:
+                errors.append(str(e))
+                continue
+            if path is not None:
+                paths[target] = path.resolve()
+        return paths, errors
+
+    paths, errors = await asyncio.to_thread(resolve)
+    if errors:
+        raise ValueError("; ".join(errors))
+    if not paths:
+        return md_content
+
+    semaphore = asyncio.Semaphore(IMAGE_UPLOAD_CONCURRENCY)
+
+    async def upload_one(path: Path) -> str:
+        async with semaphore:
+            return await upload(path)
+
+    files = list(dict.fromkeys(paths.values()))
+    with tracing.span("markdown.upload_images", images=len(files)):
+        results = await asyncio.gather(*(upload_one(path) for path in files), return_exceptions=True)
+    failed = [f"{path}: {result}" for path, result in zip(files, results) if isinstance(result, BaseException)]
+    if failed:
+        raise ValueError(f"image upload failed: {'; '.join(failed)}")
+
+    urls = dict(zip(files, results))
+    return _rewrite_outside_code(md_content, lambda target: urls[paths[target]] if target in paths else target)
+
+
+def replace_text(md: str, find: str, replace: str, replace_all: bool = False) -> str:
+    """Replace ``find`` in Markdown; it must occur exactly once unless ``replace_all``.
+
+    Raises ValueError if it doesn't occur or is ambiguous.
+    """
+    if not find:
+        raise ValueError("find must not be empty")
+    count = md.count(find)
+    if count == 0:
+        raise ValueError("text to replace not found")
+    if count > 1 and not replace_all:
+        raise ValueError(f"text to replace occurs {count} times; make it unique or set replace_all")
+    return md.replace(find, replace)
+
+
+def replace_section(md: str, heading: str, content: str) -> str:
+    """Replace the body under a heading, up to the next heading of the same or a higher level.
+
+    The heading is matched by its text, case-insensitively; headings inside
+    fenced code blocks are ignored. Raises ValueError if it is missing or ambiguous.
+    """
+    fenced = [m.span() for m in FENCE_RE.finditer(md)]
+    headings = [m for m in HEADING_RE.finditer(md) if not any(start <= m.start() < end for start, end in fenced)]
+    title = heading.strip().lstrip("#").strip().lower()
+    matches = [m for m in headings if m.group(2).strip().lower() == title]
+    if not matches:
+        raise ValueError(f"section not found: {heading}")
+    if len(matches) > 1:
+        raise ValueError(f"section '{heading}' occurs {len(matches)} times")
+
+    match = matches[0]
+    level = len(match.group(1))
+    end = next((m.start() for m in headings if m.start() > match.start() and len(m.group(1)) <= level), len(md))
+    body = content.strip("\n")
+    replacement = f"\n\n{body}\n" if body else "\n"
+    if end < len(md):
+        replacement += "\n"
+    return md[:match.end()] + replacement + md[end:]
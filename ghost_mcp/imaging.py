@@ -0,0 +1,139 @@
+"""Optional image optimization before upload: downscale, strip metadata, re-encode.
+
+Needs Pillow (the ``images`` extra). Encoding runs in a process pool so it
+never holds the event loop or the GIL of the server process.
+"""
+
+import asyncio
+import os
+import tempfile
+import warnings
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+FORMATS = {"webp", "avif", "jpeg", "original"}
+# Formats whose encoder is optional in Pillow, by their PIL.features name.
+ENCODER_FEATURES = {"webp": "webp", "avif": "avif"}
+# Vector and multi-resolution formats are uploaded untouched.
+SKIPPED_EXTENSIONS = {".svg", ".ico"}
+EXTENSIONS = {"WEBP": ".webp", "AVIF": ".avif", "JPEG": ".jpg", "PNG": ".png", "GIF": ".gif"}
+MIME_TYPES = {"WEBP": "image/webp", "AVIF": "image/avif", "JPEG": "image/jpeg", "PNG": "image/png", "GIF": "image/gif"}
+
+
+@dataclass
+class ImageOptions:
+    """What to do to an image before it is uploaded."""
+
+    format: str = "webp"
+    max_dimension: int | None = 2000
+    quality: int = 82
+    strip_metadata: bool = True
+
+
+@dataclass
+class OptimizedImage:
+    """A re-encoded copy of an image in a temporary file the caller must delete."""
+
+    path: str
+    size: int
+    mime_type: str
+    extension: str
+
+
+def optimize_image(source: str, options: ImageOptions) -> OptimizedImage | None:
+    """Re-encode ``source`` per ``options``; None if the result wouldn't be smaller.
+
+    Runs in a worker process.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as original:
+        if getattr(original, "is_animated", False):
+            return None
+        exif = original.info.get("exif")
+        icc_profile = original.info.get("icc_profile")
+        source_format = original.format
+        # Bake in the EXIF rotation, since the EXIF block itself may be dropped.
+        image = ImageOps.exif_transpose(original)
+
+    if options.max_dimension and max(image.size) > options.max_dimension:
+        image.thumbnail((options.max_dimension, options.max_dimension), Image.Resampling.LANCZOS)
+
+    target = source_format if options.format == "original" else options.format.upper()
+    has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+    if target == "JPEG" and has_alpha:
+        target = "PNG"  # JPEG has no alpha channel
+    if target not in EXTENSIONS:
+        return None
+
+    save_args: dict = {"optimize": True}
+    if icc_profile:
+        save_args["icc_profile"] = icc_profile
+    if exif and not options.strip_metadata:
+        save_args["exif"] = exif
+    if target == "JPEG":
+        image = image.convert("RGB")
+        save_args.update(quality=options.quality, progressive=True)
+    elif target in ("WEBP", "AVIF"):
+        save_args["quality"] = options.quality
+        if target == "AVIF":
+            save_args["speed"] = 8  # the default (6) is several times slower for little gain
+
+    fd, output = tempfile.mkstemp(prefix="ghost-mcp-", suffix=EXTENSIONS[target])
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, format=target, **save_args)
+        size = os.path.getsize(output)
+        if size >= os.path.getsize(source):
+            os.unlink(output)
+            return None
+    except BaseException:
+        os.unlink(output)
+        raise
+    return OptimizedImage(output, size, MIME_TYPES[target], EXTENSIONS[target])
+
+
+class ImageOptimizer:
+    """Runs ``optimize_image`` in a lazily started process pool."""
+
+    def __init__(self, options: ImageOptions | None = None, max_workers: int | None = None):
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            raise ImportError("image optimization requires Pillow: pip install 'ghost-cms-mcp[images]'") from None
+        self.options = options or ImageOptions()
+        if self.options.format not in FORMATS:
+            raise ValueError(
+                f"invalid image format '{self.options.format}'. Must be one of: {', '.join(sorted(FORMATS))}"
+            )
+        if self.options.format in ENCODER_FEATURES:
+            from PIL import features
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # Pillow before 11.2 warns that it doesn't know "avif"
+                supported = features.check(ENCODER_FEATURES[self.options.format])
+            if not supported:
+                raise ValueError(
+                    f"this Pillow build can't encode {self.options.format}; "
+                    "upgrade Pillow (AVIF needs 11.2 or newer) or choose another format"
+                )
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._pool: Executor | None = None
+
+    async def optimize(self, path: str | os.PathLike) -> OptimizedImage | None:
+        """Optimized copy of ``path``, or None to upload the original."""
+        if os.path.splitext(path)[1].lower() in SKIPPED_EXTENSIONS:
+            return None
+        if self._pool is None:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+
+            # spawn: forking a process that runs an event loop and worker threads is unsafe.
+            self._pool = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, optimize_image, os.fspath(path), self.options)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
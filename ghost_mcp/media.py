@@ -0,0 +1,178 @@
+"""Content-hash index of uploaded images, so repeat uploads reuse the existing URL."""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from ghost_mcp.client import GhostClient
+
+# Originals only: Ghost serves resized copies under /content/images/size/wNNN/.
+IMAGE_URL_RE = re.compile(r"""https?://[^\s"'<>()]+?/content/images/(?!size/)[^\s"'<>()?#]+""")
+GONE_STATUSES = {404, 410}
+SEED_CONCURRENCY = 4
+
+
+def file_digest(path: str | os.PathLike) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+async def hash_file(path: str | os.PathLike) -> str:
+    return await asyncio.to_thread(file_digest, path)
+
+
+async def download_digest(client: GhostClient, url: str) -> tuple[str, int]:
+    """SHA-256 and size of a remote file, hashed as it streams in."""
+    digest = hashlib.sha256()
+    size = 0
+    async with client.stream_media(url) as response:
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+class UploadIndex:
+    """SHA-256 → URL map of images already uploaded to Ghost.
+
+    Hits are served without network I/O. An entry not confirmed for
+    ``verify_after`` seconds is checked with a HEAD request before reuse and
+    dropped if Ghost no longer has the file. The least recently used entries
+    are evicted past ``max_entries``. With a ``path`` the index is persisted
+    as JSON and survives restarts.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        max_entries: int = 10_000,
+        verify_after: float = 7 * 86400,
+    ):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.verify_after = verify_after
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._write_lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            self._entries.update(json.loads(self.path.read_text())["entries"])
+
+    def get(self, digest: str) -> dict | None:
+        entry = self._entries.get(digest)
+        if entry is not None:
+            self._entries.move_to_end(digest)
+        return entry
+
+    def add(self, digest: str, url: str, size: int | None = None) -> None:
+        now = time.time()
+        self._entries[digest] = {"url": url, "size": size, "uploaded_at": now, "checked_at": now}
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, digest: str) -> None:
+        self._entries.pop(digest, None)
+
+    def urls(self) -> set[str]:
+        return {entry["url"] for entry in self._entries.values()}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _write(self, text: str) -> None:
+        with self._write_lock:
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(text)
+            os.replace(tmp, self.path)
+
+    async def flush(self) -> None:
+        """Persist the index atomically; a no-op for in-memory indexes."""
+        if self.path is None:
+            return
+        # Serialize on the loop so the write thread never sees the dict mid-update.
+        text = json.dumps({"version": 1, "entries": self._entries})
+        await asyncio.to_thread(self._write, text)
+
+    async def resolve(self, client: GhostClient, digest: str) -> str | None:
+        """URL of an uploaded copy, re-verifying entries older than ``verify_after``."""
+        entry = self.get(digest)
+        if entry is None:
+            return None
+        if time.time() - entry["checked_at"] < self.verify_after:
+            return entry["url"]
+        try:
+            status = await client.media_status(entry["url"])
+        except Exception:
+            return entry["url"]  # can't tell; a stale URL is cheaper than a duplicate upload
+        if status in GONE_STATUSES:
+            self.discard(digest)
+            await self.flush()
+            return None
+        entry["checked_at"] = time.time()
+        return entry["url"]
+
+    async def upload_once(
+        self,
+        client: GhostClient,
+        digest: str,
+        upload: Callable[[], Awaitable[str]],
+        size: int | None = None,
+    ) -> tuple[str, bool]:
+        """Return ``(url, reused)``, calling ``upload()`` only if the content is unknown.
+
+        Concurrent calls for the same digest wait for the first upload.
+        """
+        lock = self._locks.setdefault(digest, asyncio.Lock())
+        try:
+            async with lock:
+                url = await self.resolve(client, digest)
+                if url is not None:
+                    return url, True
+                url = await upload()
+                self.add(digest, url, size)
+                await self.flush()
+                return url, False
+        finally:
+            # Safe to drop even with waiters queued: the entry is added before release.
+            if not lock.locked() and self._locks.get(digest) is lock:
+                del self._locks[digest]
+
+    async def seed(self, client: GhostClient, resources: tuple[str, ...] = ("posts", "pages")) -> int:
+        """Hash images already referenced by posts/pages; returns how many were added.
+
+        Feature images and images in post HTML are downloaded (streamed) and
+        indexed so that uploading the same file again reuses them.
+        """
+        known = self.urls()
+        found: dict[str, None] = {}
+        for resource in resources:
+            async for item in client.iterate(resource, fields="id,feature_image,html", params={"formats": "html"}):
+                for url in IMAGE_URL_RE.findall(f"{item.get('feature_image') or ''} {item.get('html') or ''}"):
+                    if url not in known:
+                        found[url] = None
+
+        semaphore = asyncio.Semaphore(SEED_CONCURRENCY)
+
+        async def index(url: str) -> bool:
+            async with semaphore:
+                try:
+                    digest, size = await download_digest(client, url)
+                except Exception:
+                    return False
+            if digest in self._entries:
+                return False
+            self.add(digest, url, size)
+            return True
+
+        added = sum(await asyncio.gather(*(index(url) for url in found)))
+        await self.flush()
+        return added
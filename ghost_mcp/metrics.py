@@ -0,0 +1,297 @@
+"""In-process metrics for tool calls and Ghost API requests, exported as OpenMetrics text."""
+
+import asyncio
+import functools
+import math
+import time
+from collections.abc import Callable, Iterable
+
+import httpx
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16_384, 65_536, 262_144, 1_048_576, 4_194_304, 16_777_216)
+SCRAPE_TIMEOUT = 5.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """Monotonic count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.values.items():
+            yield f"{self.name}_total{_labels(self.labels, labels)} {_number(value)}"
+
+
+class Gauge(Counter):
+    """Current value per label set."""
+
+    kind = "gauge"
+
+    def set(self, *labels, value: float) -> None:
+        self.values[labels] = value
+
+    def dec(self, *labels, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.values.items():
+            yield f"{self.name}{_labels(self.labels, labels)} {_number(value)}"
+
+
+class Histogram:
+    """Bucketed distribution per label set, plus sum and count."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = (*buckets, math.inf)
+        self.values: dict[tuple, list] = {}  # labels -> [per-bucket counts, sum, count]
+
+    def observe(self, value: float, *labels) -> None:
+        entry = self.values.get(labels)
+        if entry is None:
+            entry = self.values[labels] = [[0] * len(self.buckets), 0.0, 0]
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                entry[0][i] += 1
+                break
+        entry[1] += value
+        entry[2] += 1
+
+    def quantile(self, q: float, *labels) -> float | None:
+        """Estimate a quantile by interpolating within its bucket, as Prometheus does."""
+        entry = self.values.get(labels)
+        if entry is None or entry[2] == 0:
+            return None
+        rank = q * entry[2]
+        seen = 0
+        for i, count in enumerate(entry[0]):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i else 0.0
+                upper = self.buckets[i]
+                if upper == math.inf:
+                    return lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return None
+
+    def samples(self) -> Iterable[str]:
+        for labels, (counts, total, count) in self.values.items():
+            cumulative = 0
+            for bound, bucket in zip(self.buckets, counts):
+                cumulative += bucket
+                le = f'le="{_number(float(bound))}"'
+                yield f"{self.name}_bucket{_labels(self.labels, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labels, labels)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labels, labels)} {count}"
+
+
+def _latency(histogram: Histogram, *labels) -> str:
+    p50 = histogram.quantile(0.5, *labels)
+    p95 = histogram.quantile(0.95, *labels)
+    if p50 is None:
+        return "latency n/a"
+    return f"p50 {p50 * 1000:.0f}ms, p95 {p95 * 1000:.0f}ms"
+
+
+def render(metrics: Iterable[Counter | Gauge | Histogram]) -> str:
+    """OpenMetrics text exposition of ``metrics``."""
+    lines = []
+    for metric in metrics:
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.extend(metric.samples())
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class Metrics:
+    """Latency, size, outcome and concurrency of MCP tool calls and Ghost API requests.
+
+    Tool metrics are labelled by tool name, HTTP metrics by method, endpoint
+    family (``posts``, ``images``...) and status. Each HTTP attempt is
+    counted, so retries show up as extra requests.
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.tool_calls = Counter(
+            "ghost_mcp_tool_calls", "MCP tool calls by outcome: ok, error (an Error: result) or exception.",
+            ("tool", "outcome"),
+        )
+        self.tool_duration = Histogram("ghost_mcp_tool_duration_seconds", "MCP tool call latency.", ("tool",))
+        self.tool_result_size = Histogram(
+            "ghost_mcp_tool_result_bytes", "Size of MCP tool results.", ("tool",), SIZE_BUCKETS,
+        )
+        self.tools_in_flight = Gauge("ghost_mcp_tools_in_flight", "MCP tool calls in progress.", ("tool",))
+        self.http_requests = Counter(
+            "ghost_mcp_http_requests", "Ghost API request attempts by status, 'error' for network failures.",
+            ("method", "endpoint", "status"),
+        )
+        self.http_duration = Histogram(
+            "ghost_mcp_http_request_duration_seconds", "Ghost API request latency, including rate limiter waits.",
+            ("method", "endpoint"),
+        )
+        self.http_request_size = Counter(
+            "ghost_mcp_http_request_bytes", "Bytes sent in Ghost API request bodies.", ("method", "endpoint"),
+        )
+        self.http_response_size = Histogram(
+            "ghost_mcp_http_response_bytes", "Size of Ghost API response bodies.", ("method", "endpoint"), SIZE_BUCKETS,
+        )
+        self.http_in_flight = Gauge(
+            "ghost_mcp_http_requests_in_flight", "Ghost API requests in progress.", ("endpoint",),
+        )
+
+    def all(self) -> list[Counter | Gauge | Histogram]:
+        return [
+            self.tool_calls,
+            self.tool_duration,
+            self.tool_result_size,
+            self.tools_in_flight,
+            self.http_requests,
+            self.http_duration,
+            self.http_request_size,
+            self.http_response_size,
+            self.http_in_flight,
+        ]
+
+    def report(self) -> list[str]:
+        """Human-readable summary, tools and endpoints ordered by total time spent."""
+        lines = [f"Uptime: {time.time() - self.started_at:.0f}s", "Tool calls:"]
+        for (tool,), (_, seconds, count) in sorted(self.tool_duration.values.items(), key=lambda kv: -kv[1][1]):
+            ok = int(self.tool_calls.values.get((tool, "ok"), 0))
+            lines.append(
+                f"- {tool}: {count} calls ({count - ok} failed), {seconds:.2f}s total, "
+                f"{_latency(self.tool_duration, tool)}"
+            )
+        lines.append("API requests:")
+        for labels, (_, seconds, _) in sorted(self.http_duration.values.items(), key=lambda kv: -kv[1][1]):
+            statuses = ", ".join(
+                f"{status}: {int(n)}" for (*key, status), n in sorted(self.http_requests.values.items())
+                if tuple(key) == labels
+            )
+            received = self.http_response_size.values.get(labels, [None, 0])[1]
+            lines.append(
+                f"- {' '.join(labels)}: {statuses}, {seconds:.2f}s total, "
+                f"{_latency(self.http_duration, *labels)}, {received / 1024:.0f} KiB received"
+            )
+        lines.append(f"API requests in flight: {int(sum(self.http_in_flight.values.values()))}")
+        return lines
+
+    def instrument(self, fn: Callable) -> Callable:
+        """Wrap an async tool function to record its calls."""
+        tool = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            self.tools_in_flight.inc(tool)
+            started = time.perf_counter()
+            outcome = "exception"
+            try:
+                result = await fn(*args, **kwargs)
+                outcome = "error" if isinstance(result, str) and result.startswith("Error") else "ok"
+                if isinstance(result, str):
+                    self.tool_result_size.observe(len(result.encode()), tool)
+                return result
+            finally:
+                self.tools_in_flight.dec(tool)
+                self.tool_duration.observe(time.perf_counter() - started, tool)
+                self.tool_calls.inc(tool, outcome)
+
+        return wrapper
+
+    def http_started(self, endpoint: str) -> float:
+        self.http_in_flight.inc(endpoint)
+        return time.perf_counter()
+
+    def http_finished(self, method: str, endpoint: str, started: float, response: httpx.Response | None) -> None:
+        self.http_in_flight.dec(endpoint)
+        self.http_duration.observe(time.perf_counter() - started, method, endpoint)
+        if response is None:
+            self.http_requests.inc(method, endpoint, "error")
+            return
+        self.http_requests.inc(method, endpoint, str(response.status_code))
+        sent = int(response.request.headers.get("content-length") or 0)
+        if sent:
+            self.http_request_size.inc(method, endpoint, amount=sent)
+        self.http_response_size.observe(len(response.content), method, endpoint)
+
+
+def client_metrics(client) -> list[Gauge]:
+    """Point-in-time gauges for a GhostClient's cache and rate limiter."""
+    gauges = []
+    if client.cache is not None:
+        cache = Gauge("ghost_mcp_cache", "Response cache entries and lifetime hit/miss counts.", ("stat",))
+        for stat, value in client.cache.stats().items():
+            cache.set(stat, value=value)
+        gauges.append(cache)
+    if client.rate_limiter is not None:
+        rate = Gauge("ghost_mcp_rate_limit_rps", "Current adaptive request rate.")
+        rate.set(value=client.rate_limiter.rate)
+        gauges.append(rate)
+    return gauges
+
+
+def site_metrics(registry) -> list[Gauge]:
+    """Point-in-time gauges for a SiteRegistry's open clients."""
+    open_sites = Gauge("ghost_mcp_sites_open", "Tool calls in flight per site with an open client.", ("site",))
+    for name, in_flight in registry.open_sites().items():
+        open_sites.set(name, value=in_flight)
+    evicted = Counter("ghost_mcp_sites_evicted", "Site clients closed for being idle or over the open limit.")
+    evicted.inc(amount=registry.evicted)
+    return [open_sites, evicted]
+
+
+async def serve_metrics(exposition: Callable[[], str], host: str = "127.0.0.1", port: int = 9464) -> asyncio.Server:
+    """Serve ``exposition()`` at ``/metrics`` over plain HTTP/1.1, one request per connection."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), SCRAPE_TIMEOUT)
+            method, target = head.split(b" ", 2)[:2]
+            if method == b"GET" and target.split(b"?", 1)[0] == b"/metrics":
+                status, content_type, body = "200 OK", CONTENT_TYPE, exposition().encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain; charset=utf-8", b"Not Found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, OSError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
@@ -0,0 +1,293 @@
+"""SQLite-backed local mirror of Ghost posts, pages and tags with full-text search."""
+
+import asyncio
+import json
+import re
+import sqlite3
+import time
+
+from ghost_mcp.client import GhostClient
+from ghost_mcp.ratelimit import endpoint_family
+
+MIRRORED = ("posts", "pages", "tags")
+SEARCHABLE = ("posts", "pages")
+
+SYNC_PARAMS = {
+    "posts": {"include": "tags,authors", "formats": "html,plaintext"},
+    "pages": {"include": "tags", "formats": "html,plaintext"},
+    "tags": {"include": "count.posts"},
+}
+
+# Incremental syncs can't see deletions made outside this server, so re-crawl
+# everything this often and drop whatever Ghost no longer returns.
+FULL_SYNC_INTERVAL = 3600.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    resource TEXT NOT NULL,
+    id TEXT NOT NULL,
+    slug TEXT,
+    status TEXT,
+    published_at TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (resource, id)
+);
+CREATE INDEX IF NOT EXISTS items_slug ON items (resource, slug);
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL,
+    full_synced_at REAL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5 (
+    resource UNINDEXED,
+    id UNINDEXED,
+    title,
+    excerpt,
+    plaintext,
+    tags,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+"""
+
+# bm25() column weights: title, excerpt, plaintext, tags (resource/id are unindexed).
+SEARCH_WEIGHTS = "0, 0, 10.0, 4.0, 1.0, 6.0"
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, the last as a prefix."""
+    words = TOKEN_RE.findall(text)
+    if not words:
+        return ""
+    terms = [f'"{w}"' for w in words[:-1]] + [f'"{words[-1]}"*']
+    return " ".join(terms)
+
+
+class ContentMirror:
+    """Local copy of posts, pages and tags, kept fresh by incremental sync.
+
+    Reads trigger a sync when the mirror is older than ``max_staleness``
+    seconds; ``keep_fresh()`` can run alongside the server to sync on a
+    schedule instead. Writes made through the client mark the affected
+    resource for re-sync and deletions are applied immediately.
+    """
+
+    def __init__(self, client: GhostClient, path: str = ":memory:", max_staleness: float = 60.0):
+        self.client = client
+        self.path = path
+        self.max_staleness = max_staleness
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(SCHEMA)
+        self._locks = {resource: asyncio.Lock() for resource in MIRRORED}
+        self._dirty: set[str] = set()
+        client.on_write(self._on_write)
+
+    def _on_write(self, method: str, endpoint: str, result: dict) -> None:
+        resource = endpoint_family(endpoint)
+        if resource not in MIRRORED:
+            return
+        parts = endpoint.split("?", 1)[0].strip("/").split("/")
+        if method == "DELETE" and len(parts) == 2:
+            with self._db:
+                self._delete(resource, [parts[1]])
+        self._dirty.add(resource)
+        if resource in ("posts", "pages"):
+            self._dirty.add("tags")  # post counts and auto-created tags
+
+    def _state(self, resource: str) -> sqlite3.Row | None:
+        return self._db.execute("SELECT * FROM sync_state WHERE resource = ?", (resource,)).fetchone()
+
+    def is_fresh(self, resource: str) -> bool:
+        state = self._state(resource)
+        return (
+            resource not in self._dirty
+            and state is not None
+            and time.time() - state["synced_at"] <= self.max_staleness
+        )
+
+    async def ensure_fresh(self, resource: str) -> None:
+        """Sync ``resource`` if it is stale or was written to since the last sync."""
+        if self.is_fresh(resource):
+            return
+        async with self._locks[resource]:
+            if not self.is_fresh(resource):
+                await self.sync(resource)
+
+    async def sync(self, resource: str, full: bool = False) -> int:
+        """Fetch items changed since the last watermark; returns the number stored.
+
+        Runs a full crawl on first use, when ``full`` is set, or every
+        FULL_SYNC_INTERVAL seconds, removing items Ghost no longer has.
+        """
+        state = self._state(resource)
+        now = time.time()
+        if state is None or state["watermark"] is None or now - (state["full_synced_at"] or 0) > FULL_SYNC_INTERVAL:
+            full = True
+        self._dirty.discard(resource)
+
+        watermark = None if full else state["watermark"]
+        nql = f"updated_at:>='{watermark}'" if watermark else None
+        seen: set[str] = set()
+        batch: list[dict] = []
+        count = 0
+        async for item in self.client.iterate(resource, filter=nql, params=SYNC_PARAMS[resource]):
+            seen.add(item["id"])
+            batch.append(item)
+            if len(batch) >= 100:
+                count += self._upsert(resource, batch)
+                batch = []
+        count += self._upsert(resource, batch)
+
+        with self._db:
+            if full:
+                known = [row["id"] for row in self._db.execute("SELECT id FROM items WHERE resource = ?", (resource,))]
+                self._delete(resource, [id for id in known if id not in seen])
+            newest = self._db.execute(
+                "SELECT MAX(updated_at) FROM items WHERE resource = ?", (resource,)
+            ).fetchone()[0]
+            self._db.execute(
+                "INSERT INTO sync_state (resource, watermark, synced_at, full_synced_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (resource) DO UPDATE SET watermark = excluded.watermark, "
+                "synced_at = excluded.synced_at, "
+                "full_synced_at = COALESCE(excluded.full_synced_at, sync_state.full_synced_at)",
+                (resource, newest or watermark, now, now if full else None),
+            )
+        return count
+
+    def _upsert(self, resource: str, items: list[dict]) -> int:
+        if not items:
+            return 0
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO items (resource, id, slug, status, published_at, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        resource,
+                        item["id"],
+                        item.get("slug"),
+                        item.get("status"),
+                        item.get("published_at"),
+                        item.get("updated_at"),
+                        json.dumps(item),
+                    )
+                    for item in items
+                ],
+            )
+            if resource in SEARCHABLE:
+                self._db.executemany(
+                    "DELETE FROM search WHERE resource = ? AND id = ?",
+                    [(resource, item["id"]) for item in items],
+                )
+                self._db.executemany(
+                    "INSERT INTO search (resource, id, title, excerpt, plaintext, tags) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            resource,
+                            item["id"],
+                            item.get("title") or "",
+                            item.get("custom_excerpt") or item.get("excerpt") or "",
+                            item.get("plaintext") or "",
+                            " ".join(t["name"] for t in item.get("tags") or []),
+                        )
+                        for item in items
+                    ],
+                )
+        return len(items)
+
+    def _delete(self, resource: str, ids: list[str]) -> None:
+        rows = [(resource, id) for id in ids]
+        self._db.executemany("DELETE FROM items WHERE resource = ? AND id = ?", rows)
+        self._db.executemany("DELETE FROM search WHERE resource = ? AND id = ?", rows)
+
+    async def keep_fresh(self) -> None:
+        """Sync every mirrored resource each ``max_staleness`` seconds until cancelled."""
+        while True:
+            for resource in MIRRORED:
+                try:
+                    async with self._locks[resource]:
+                        await self.sync(resource)
+                except Exception:
+                    pass  # a failed round leaves the mirror stale; reads retry on demand
+            await asyncio.sleep(self.max_staleness)
+
+    async def list_items(
+        self,
+        resource: str,
+        status: str | None = None,
+        tag: str | None = None,
+        limit: int | None = 15,
+        page: int = 1,
+    ) -> dict:
+        """Query the mirror, returning a dict shaped like a Ghost list response."""
+        await self.ensure_fresh(resource)
+        where = ["resource = ?"]
+        args: list = [resource]
+        if status:
+            where.append("status = ?")
+            args.append(status)
+        if tag:
+            where.append("EXISTS (SELECT 1 FROM json_each(data, '$.tags') WHERE json_extract(value, '$.slug') = ?)")
+            args.append(tag)
+        clause = " AND ".join(where)
+
+        total = self._db.execute(f"SELECT COUNT(*) FROM items WHERE {clause}", args).fetchone()[0]
+        query = (
+            f"SELECT data FROM items WHERE {clause} "
+            "ORDER BY published_at IS NOT NULL, published_at DESC, updated_at DESC"
+        )
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            args += [limit, (page - 1) * limit]
+        items = [json.loads(row["data"]) for row in self._db.execute(query, args)]
+
+        pages = max(1, -(-total // limit)) if limit else 1
+        return {
+            resource: items,
+            "meta": {"pagination": {
+                "page": page,
+                "limit": limit or "all",
+                "pages": pages,
+                "total": total,
+                "next": page + 1 if page < pages else None,
+            }},
+        }
+
+    async def get_item(self, resource: str, id: str | None = None, slug: str | None = None) -> dict | None:
+        """A single item by id or slug, or None if the mirror doesn't have it."""
+        await self.ensure_fresh(resource)
+        column, value = ("id", id) if id else ("slug", slug)
+        row = self._db.execute(
+            f"SELECT data FROM items WHERE resource = ? AND {column} = ?", (resource, value)
+        ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    async def search(self, text: str, resource: str | None = None, limit: int = 10) -> list[dict]:
+        """Rank posts/pages matching ``text`` across title, excerpt, plaintext and tags.
+
+        Returns dicts with ``resource``, ``id``, ``title``, ``slug``, ``status``
+        and a highlighted ``snippet``, best match first.
+        """
+        resources = (resource,) if resource else SEARCHABLE
+        for name in resources:
+            await self.ensure_fresh(name)
+        query = fts_query(text)
+        if not query:
+            return []
+
+        placeholders = ", ".join("?" for _ in resources)
+        rows = self._db.execute(
+            f"SELECT s.resource, s.id, i.slug, i.status, s.title, "
+            f"snippet(search, -1, '**', '**', '…', 16) AS snippet "
+            f"FROM search s JOIN items i ON i.resource = s.resource AND i.id = s.id "
+            f"WHERE search MATCH ? AND s.resource IN ({placeholders}) "
+            f"ORDER BY bm25(search, {SEARCH_WEIGHTS}) LIMIT ?",
+            [query, *resources, limit],
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        self._db.close()
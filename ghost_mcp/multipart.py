@@ -0,0 +1,62 @@
+"""Streaming multipart/form-data bodies for file uploads."""
+
+import asyncio
+import os
+import secrets
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def _quote(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+class MultipartFile:
+    """A single-file multipart body read from disk in chunks as it is sent.
+
+    Only ``UPLOAD_CHUNK_SIZE`` bytes of the file are in memory at a time, and
+    the blocking ``open``/``read``/``close`` calls run in worker threads. The
+    body can be iterated more than once, so a retried request re-reads the
+    file from the start. ``headers`` carries the boundary and an exact
+    ``Content-Length``, computed from ``size``.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        content_type: str,
+        size: int,
+        filename: str | None = None,
+        field: str = "file",
+    ):
+        self.path = Path(path)
+        self.size = size
+        boundary = secrets.token_hex(16)
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_quote(field)}"; '
+            f'filename="{_quote(filename or self.path.name)}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self.headers = {
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(len(self._head) + size + len(self._tail)),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        f = await asyncio.to_thread(self.path.open, "rb")
+        try:
+            remaining = self.size
+            while remaining > 0:
+                chunk = await asyncio.to_thread(f.read, min(UPLOAD_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise OSError(f"{self.path} shrank while it was being uploaded")
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(f.close)
+        yield self._tail
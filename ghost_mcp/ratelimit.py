@@ -0,0 +1,117 @@
+"""Client-side adaptive rate limiting for Ghost Admin API calls."""
+
+import asyncio
+import time
+from collections import deque
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Resource family of an API endpoint: ``posts/abc/`` -> ``posts``."""
+    return endpoint.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+
+
+class RateLimiter:
+    """Token bucket plus max-in-flight cap with AIMD rate adaptation.
+
+    The refill rate grows additively (roughly ``increase`` requests/second per
+    second) while responses are fast and successful, and is cut
+    multiplicatively on 429s or slow responses. Waiting requests are granted
+    round-robin across endpoint families so a burst of image uploads cannot
+    starve post reads.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        max_in_flight: int = 8,
+        min_rate: float = 0.5,
+        max_rate: float = 50.0,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        latency_target: float = 2.0,
+        latency_decrease: float = 0.9,
+    ):
+        self.rate = min(rate, max_rate)
+        self.burst = burst
+        self.max_in_flight = max_in_flight
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.latency_decrease = latency_decrease
+        self.in_flight = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._waiters: dict[str, deque[asyncio.Future]] = {}
+        self._order: deque[str] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, family: str) -> None:
+        """Wait for a token and an in-flight slot for a request in ``family``."""
+        if not self._order and self.in_flight < self.max_in_flight:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.in_flight += 1
+                return
+
+        fut = asyncio.get_running_loop().create_future()
+        queue = self._waiters.get(family)
+        if queue is None:
+            queue = self._waiters[family] = deque()
+            self._order.append(family)
+        queue.append(fut)
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slot was granted just before cancellation: hand it back.
+                self.in_flight -= 1
+                self._dispatch()
+            else:
+                queue.remove(fut)
+                if not queue and self._waiters.get(family) is queue:
+                    del self._waiters[family]
+                    self._order.remove(family)
+            raise
+
+    def release(self, status: int | None, latency: float) -> None:
+        """Free the in-flight slot and adapt the rate from the response."""
+        self.in_flight -= 1
+        if status == 429:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+        elif latency > self.latency_target:
+            self.rate = max(self.min_rate, self.rate * self.latency_decrease)
+        elif status is not None and status < 500:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant waiting requests round-robin while tokens and slots allow."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._order and self.in_flight < self.max_in_flight:
+            self._refill()
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                self._timer = asyncio.get_running_loop().call_later(wait, self._dispatch)
+                return
+            family = self._order.popleft()
+            queue = self._waiters[family]
+            fut = queue.popleft()
+            if queue:
+                self._order.append(family)
+            else:
+                del self._waiters[family]
+            self._tokens -= 1
+            self.in_flight += 1
+            fut.set_result(None)
@@ -0,0 +1,121 @@
+"""Retry policy for Ghost Admin API requests."""
+
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Errors raised before the request reached the server: retrying is safe for any method.
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+last_attempts: ContextVar[int] = ContextVar("ghost_last_attempts", default=0)
+
+
+def is_idempotent(method: str, payload: dict | None = None) -> bool:
+    """Whether a request can be replayed without side effects.
+
+    PUTs are only treated as idempotent when every resource carries
+    ``updated_at``: Ghost then rejects a replayed write with a 409 collision
+    instead of applying it twice.
+    """
+    if method in IDEMPOTENT_METHODS:
+        return True
+    if method == "PUT" and payload:
+        items = [item for value in payload.values() if isinstance(value, list) for item in value]
+        return bool(items) and all(isinstance(item, dict) and "updated_at" in item for item in items)
+    return False
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """Token bucket capping retries to a fraction of overall traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so a
+    failing upstream sees at most ``ratio`` extra load once the initial
+    ``reserve`` is spent.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: int = 10):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = float(reserve)
+
+    def deposit(self) -> None:
+        self._tokens = min(float(self.reserve), self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request."""
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    max_retry_after: float = 30.0
+    retry_statuses: frozenset[int] = RETRYABLE_STATUSES
+    retry_post: bool = False
+    budget: RetryBudget = field(default_factory=RetryBudget)
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given (1-based) attempt."""
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    def retry_delay(
+        self,
+        attempt: int,
+        idempotent: bool,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Seconds to wait before the next attempt, or None to give up."""
+        if attempt >= self.max_attempts:
+            return None
+
+        if error is not None:
+            if not (idempotent or isinstance(error, NOT_SENT_ERRORS)):
+                return None
+            delay = self.backoff(attempt)
+        else:
+            status = response.status_code
+            if status not in self.retry_statuses:
+                return None
+            # A 429 is rejected before Ghost processes it, so even a POST can be replayed.
+            if not (idempotent or status == 429):
+                return None
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                delay = self.backoff(attempt)
+            elif retry_after > self.max_retry_after:
+                return None
+            else:
+                delay = retry_after
+
+        if not self.budget.withdraw():
+            return None
+        return delay
@@ -1,25 +1,163 @@
 """MCP server for Ghost CMS."""
 
-from collections.abc import AsyncIterator
+import asyncio
+import copy
+import importlib
+from collections.abc import AsyncIterator, Callable, Sequence
 from contextlib import asynccontextmanager
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
-from ghost_mcp.client import GhostClient
-from ghost_mcp.tools.images import register_image_tools
-from ghost_mcp.tools.pages import register_page_tools
-from ghost_mcp.tools.posts import register_post_tools
-from ghost_mcp.tools.tags import register_tag_tools
+from ghost_mcp import tracing
+from ghost_mcp.cache import ResponseCache
+from ghost_mcp.client import GhostClient, TransportConfig
+from ghost_mcp.imaging import ImageOptimizer
+from ghost_mcp.media import UploadIndex
+from ghost_mcp.metrics import Metrics, client_metrics, render, serve_metrics, site_metrics
+from ghost_mcp.ratelimit import RateLimiter
+from ghost_mcp.retry import RetryPolicy
+from ghost_mcp.sites import DEFAULT_IDLE_TIMEOUT, Site, SiteClient, SiteRegistry
 
-ALL_TOOL_GROUPS = {"posts", "pages", "tags", "images"}
+ALL_TOOL_GROUPS = {"posts", "pages", "tags", "images", "search"}
+
+# Tool group -> (module, register function). Modules are imported only for enabled groups.
+TOOL_MODULES: dict[str, tuple[str, str]] = {
+    "posts": ("ghost_mcp.tools.posts", "register_post_tools"),
+    "pages": ("ghost_mcp.tools.pages", "register_page_tools"),
+    "tags": ("ghost_mcp.tools.tags", "register_tag_tools"),
+    "images": ("ghost_mcp.tools.images", "register_image_tools"),
+    "search": ("ghost_mcp.tools.search", "register_search_tools"),
+}
 
 PRESETS: dict[str, dict] = {
     "all": {"tools": ALL_TOOL_GROUPS, "readonly": False},
-    "writer": {"tools": {"posts", "tags", "images"}, "readonly": False},
-    "content": {"tools": {"posts", "pages", "tags", "images"}, "readonly": False},
+    "writer": {"tools": {"posts", "tags", "images", "search"}, "readonly": False},
+    "content": {"tools": {"posts", "pages", "tags", "images", "search"}, "readonly": False},
     "readonly": {"tools": ALL_TOOL_GROUPS, "readonly": True},
 }
 
+TRANSPORT_OPTIONS: dict[str, type] = {
+    "max_connections": int,
+    "max_keepalive_connections": int,
+    "keepalive_expiry": float,
+    "http2": bool,
+    "connect_timeout": float,
+    "read_timeout": float,
+    "write_timeout": float,
+    "pool_timeout": float,
+    "warm_connections": int,
+}
+
+TRUE_VALUES = {"1", "true", "yes", "on"}
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
+
+class GhostMCP(FastMCP):
+    """FastMCP that passes every tool function through ``tool_wrappers`` as it is registered.
+
+    Wrappers must keep the function's name and signature (``functools.wraps``).
+    """
+
+    def __init__(
+        self,
+        *args,
+        tool_wrappers: Sequence[Callable[[Callable], Callable]] = (),
+        shared: "SharedClient | None" = None,
+        **kwargs,
+    ):
+        self.tool_wrappers = list(tool_wrappers)
+        self.shared = shared
+        super().__init__(*args, **kwargs)
+
+    def add_tool(self, fn: Callable, *args, **kwargs) -> None:
+        for wrap in self.tool_wrappers:
+            fn = wrap(fn)
+        super().add_tool(fn, *args, **kwargs)
+
+
+class SharedClient:
+    """Starts the client's background work for the first MCP session and shuts it down after the last.
+
+    Every session runs the server lifespan, and the HTTP transports run many
+    sessions at once. They all share one GhostClient, so its warm connection
+    pool, caches and rate limiter survive between sessions. ``serve`` holds a
+    session open for the whole process, so HTTP sessions coming and going
+    never close the client. With ``sites`` the clients belong to the registry,
+    which opens them on demand; the background work is its idle eviction.
+    """
+
+    def __init__(
+        self,
+        client: GhostClient | None,
+        metrics: Metrics,
+        sites: SiteRegistry | None = None,
+        image_optimizer: ImageOptimizer | None = None,
+        metrics_port: int | None = None,
+        metrics_host: str = "127.0.0.1",
+        tracer: tracing.Tracer | None = None,
+    ):
+        self.client = client
+        self.metrics = metrics
+        self.sites = sites
+        self.image_optimizer = image_optimizer
+        self.metrics_port = metrics_port
+        self.metrics_host = metrics_host
+        self.tracer = tracer
+        self.sessions = 0
+        self._lock = asyncio.Lock()
+        self._background_task: asyncio.Task | None = None
+        self._metrics_server: asyncio.Server | None = None
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[None]:
+        async with self._lock:
+            if self.sessions == 0:
+                await self._start()
+            self.sessions += 1
+        try:
+            yield
+        finally:
+            # Sessions end by cancellation; the shutdown must still run to completion.
+            with anyio.CancelScope(shield=True):
+                async with self._lock:
+                    self.sessions -= 1
+                    if self.sessions == 0:
+                        await self._stop()
+
+    def exposition(self) -> str:
+        gauges = site_metrics(self.sites) if self.sites is not None else client_metrics(self.client)
+        return render([*self.metrics.all(), *gauges])
+
+    async def _start(self) -> None:
+        if self.sites is not None:
+            self._background_task = asyncio.create_task(self.sites.evict_forever())
+        else:
+            await self.client.warmup()
+            if self.client.mirror is not None:
+                self._background_task = asyncio.create_task(self.client.mirror.keep_fresh())
+        if self.metrics_port is not None:
+            self._metrics_server = await serve_metrics(self.exposition, self.metrics_host, self.metrics_port)
+
+    async def _stop(self) -> None:
+        if self._metrics_server is not None:
+            self._metrics_server.close()
+            self._metrics_server = None
+        if self._background_task is not None:
+            self._background_task.cancel()
+            await asyncio.gather(self._background_task, return_exceptions=True)
+            self._background_task = None
+        if self.sites is not None:
+            await self.sites.close()
+        else:
+            if self.client.mirror is not None:
+                self.client.mirror.close()
+            await self.client.close()
+        if self.image_optimizer is not None:
+            self.image_optimizer.close()
+        if self.tracer is not None:
+            self.tracer.close()
+
 
 def resolve_config(
     tools: str | None = None,
@@ -47,41 +185,203 @@ def resolve_config(
     return ALL_TOOL_GROUPS, False
 
 
-def create_server(
+def resolve_transport(options: dict[str, str | bool | None]) -> TransportConfig:
+    """Build a TransportConfig from CLI/env values, keeping defaults for unset ones."""
+    values = {}
+    for name, value in options.items():
+        if value is None or value == "":
+            continue
+        kind = TRANSPORT_OPTIONS.get(name)
+        if kind is None:
+            raise ValueError(f"Unknown transport option '{name}'")
+        if kind is bool:
+            values[name] = value if isinstance(value, bool) else value.strip().lower() in TRUE_VALUES
+            continue
+        try:
+            values[name] = kind(value)
+        except ValueError:
+            raise ValueError(f"Invalid value for {name}: '{value}'") from None
+    return TransportConfig(**values)
+
+
+def build_client(
     url: str,
     admin_key: str,
+    transport: TransportConfig | None = None,
+    retry: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    cache: ResponseCache | None = None,
+    mirror: str | None = None,
+    mirror_staleness: float = 60.0,
+    image_index: str | None = None,
+    image_optimizer: ImageOptimizer | None = None,
+    metrics: Metrics | None = None,
+) -> GhostClient:
+    """A GhostClient with its mirror, image index, image optimizer and metrics attached."""
+    client = GhostClient(
+        url,
+        admin_key,
+        transport=transport,
+        retry=retry,
+        rate_limiter=rate_limiter,
+        cache=cache,
+    )
+    if mirror:
+        from ghost_mcp.mirror import ContentMirror
+
+        client.mirror = ContentMirror(client, mirror, max_staleness=mirror_staleness)
+    client.image_index = UploadIndex(image_index)
+    client.image_optimizer = image_optimizer
+    client.metrics = metrics
+    return client
+
+
+def _site_path(template: str | None, site: str) -> str | None:
+    """A per-site file from a ``--mirror``/``--image-index`` value, which must contain ``{site}``."""
+    if not template or template == ":memory:":
+        return template
+    if "{site}" not in template:
+        raise ValueError(f"'{template}' would be shared by every site; include {{site}} in the path")
+    return template.replace("{site}", site)
+
+
+def create_server(
+    url: str | None,
+    admin_key: str | None,
     tools: set[str] | None = None,
     readonly: bool = False,
-) -> FastMCP:
-    """Create and configure the MCP server."""
+    transport: TransportConfig | None = None,
+    retry: RetryPolicy | None = None,
+    rate_limiter: RateLimiter | None = None,
+    cache: ResponseCache | None = None,
+    mirror: str | None = None,
+    mirror_staleness: float = 60.0,
+    image_index: str | None = None,
+    image_optimizer: ImageOptimizer | None = None,
+    metrics_port: int | None = None,
+    metrics_host: str = "127.0.0.1",
+    tracer: tracing.Tracer | None = None,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    sites: dict[str, Site] | None = None,
+    default_site: str | None = None,
+    site_idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    max_open_sites: int | None = None,
+) -> "GhostMCP":
+    """Create and configure the MCP server.
+
+    ``mirror`` is a SQLite path (or ``:memory:``) for a local copy of posts,
+    pages and tags that list/get tools read from. ``image_index`` is a JSON
+    file persisting the content hashes of uploaded images; without it repeat
+    uploads are only deduplicated for the life of the process.
+    ``image_optimizer`` re-encodes images before they are uploaded.
+    Tool calls and API requests are always measured; ``metrics_port``
+    additionally serves them in OpenMetrics format at ``/metrics``.
+    ``tracer`` records a span tree for every tool call. ``host`` and
+    ``port`` are where the HTTP transports listen (see ``serve``).
+
+    With ``sites`` (see ``load_sites``) ``url`` and ``admin_key`` are ignored
+    and every tool takes an optional ``site`` argument. Each site gets its own
+    client, rate limiter, cache and retry budget, configured like
+    ``rate_limiter``, ``cache`` and ``retry``; ``mirror`` and ``image_index``
+    become per-site path templates containing ``{site}``.
+    """
     if tools is None:
         tools = ALL_TOOL_GROUPS
 
-    client = GhostClient(url, admin_key)
+    metrics = Metrics()
+    if tracer is not None:
+        tracing.set_tracer(tracer)
 
-    @asynccontextmanager
-    async def lifespan(server: FastMCP) -> AsyncIterator[None]:
-        try:
-            yield
-        finally:
-            await client.close()
+    wrappers = [metrics.instrument, tracing.instrument]
+    registry = None
+    if sites:
+        for site in sites.values():
+            _site_path(site.mirror or mirror, site.name)
+            _site_path(site.image_index or image_index, site.name)
+
+        def build_site(site: Site) -> GhostClient:
+            # The templates are never used directly: every site gets pristine copies so
+            # request rates, cached responses and retry budgets are tracked per host.
+            return build_client(
+                site.url,
+                site.admin_key,
+                transport=transport,
+                retry=copy.deepcopy(retry),
+                rate_limiter=copy.deepcopy(rate_limiter),
+                cache=copy.deepcopy(cache),
+                mirror=site.mirror or _site_path(mirror, site.name),
+                mirror_staleness=mirror_staleness,
+                image_index=site.image_index or _site_path(image_index, site.name),
+                image_optimizer=image_optimizer,
+                metrics=metrics,
+            )
+
+        registry = SiteRegistry(
+            sites, build_site, default=default_site, idle_timeout=site_idle_timeout, max_open=max_open_sites,
+        )
+        client = SiteClient(registry)
+        wrappers.insert(0, registry.route)
+    else:
+        if not url or not admin_key:
+            raise ValueError("url and admin_key are required without sites")
+        client = build_client(
+            url,
+            admin_key,
+            transport=transport,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            mirror=mirror,
+            mirror_staleness=mirror_staleness,
+            image_index=image_index,
+            image_optimizer=image_optimizer,
+            metrics=metrics,
+        )
 
-    mcp = FastMCP(
+    shared = SharedClient(
+        None if registry is not None else client,
+        metrics,
+        sites=registry,
+        image_optimizer=image_optimizer,
+        metrics_port=metrics_port,
+        metrics_host=metrics_host,
+        tracer=tracer,
+    )
+
+    mcp = GhostMCP(
         "Ghost CMS",
         instructions=(
             "MCP server for managing Ghost CMS content. "
             "Create, edit, delete posts and pages, manage tags, and upload images."
         ),
-        lifespan=lifespan,
+        lifespan=lambda server: shared.session(),
+        tool_wrappers=wrappers,
+        shared=shared,
+        host=host,
+        port=port,
     )
 
-    if "posts" in tools:
-        register_post_tools(mcp, client, readonly=readonly)
-    if "pages" in tools:
-        register_page_tools(mcp, client, readonly=readonly)
-    if "tags" in tools:
-        register_tag_tools(mcp, client, readonly=readonly)
-    if "images" in tools:
-        register_image_tools(mcp, client, readonly=readonly)
+    for group, (module, register) in TOOL_MODULES.items():
+        if group in tools:
+            getattr(importlib.import_module(module), register)(mcp, client, readonly=readonly)
 
     return mcp
+
+
+async def serve(mcp: GhostMCP, transport: str = "stdio") -> None:
+    """Run ``mcp`` over ``transport``: stdio, sse or streamable-http.
+
+    The HTTP transports serve any number of concurrent sessions from this
+    one process and client.
+    """
+    if transport not in TRANSPORTS:
+        raise ValueError(f"Unknown transport '{transport}'. Available: {', '.join(TRANSPORTS)}")
+    if transport == "stdio":
+        await mcp.run_stdio_async()
+        return
+    async with mcp.shared.session():
+        if transport == "sse":
+            await mcp.run_sse_async()
+        else:
+            await mcp.run_streamable_http_async()
@@ -0,0 +1,262 @@
+"""Many Ghost sites behind one server: a registry of lazily opened, idle-evicted clients.
+
+Tools are registered once against a ``SiteClient``, which forwards to the
+client of the site chosen for the current tool call. ``SiteRegistry.route``
+adds the optional ``site`` argument to every tool and selects the client.
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Annotated
+
+from pydantic import Field
+
+from ghost_mcp import tracing
+from ghost_mcp.client import GhostClient
+
+DEFAULT_IDLE_TIMEOUT = 300.0
+SITE_FIELDS = {"url", "key", "key_env", "mirror", "image_index"}
+
+_active: ContextVar[tuple[str, GhostClient] | None] = ContextVar("ghost_mcp_site", default=None)
+
+
+@dataclass
+class Site:
+    """One entry of the sites file."""
+
+    name: str
+    url: str
+    admin_key: str
+    mirror: str | None = None
+    image_index: str | None = None
+
+
+def load_sites(path: str) -> tuple[dict[str, Site], str | None]:
+    """Read a TOML sites file, returning the sites by name and the default site.
+
+    Each ``[sites.<name>]`` table has a ``url`` and either a ``key`` or a
+    ``key_env`` naming the environment variable holding it, plus optional
+    ``mirror`` and ``image_index`` paths. A top-level ``default`` names the
+    site used when a tool call has no ``site``. Raises ValueError describing
+    what is wrong.
+    """
+    import tomllib
+
+    try:
+        with open(path, "rb") as f:
+            config = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"Invalid sites file {path}: {e}") from None
+
+    tables = config.get("sites")
+    if not isinstance(tables, dict) or not tables:
+        raise ValueError(f"No [sites.<name>] tables in {path}")
+
+    sites = {}
+    for name, table in tables.items():
+        if not isinstance(table, dict):
+            raise ValueError(f"Site '{name}': expected a table")
+        unknown = set(table) - SITE_FIELDS
+        if unknown:
+            raise ValueError(f"Site '{name}': unknown fields {', '.join(sorted(unknown))}")
+        if not table.get("url"):
+            raise ValueError(f"Site '{name}': missing url")
+        key = table.get("key") or (os.environ.get(table["key_env"]) if table.get("key_env") else None)
+        if not key:
+            raise ValueError(f"Site '{name}': missing key (or key_env is not set)")
+        if len(key.split(":")) != 2:
+            raise ValueError(f"Site '{name}': invalid API key format. Expected: {{id}}:{{secret}}")
+        sites[name] = Site(name, table["url"], key, table.get("mirror"), table.get("image_index"))
+
+    default = config.get("default")
+    if default is not None and default not in sites:
+        raise ValueError(f"Default site '{default}' is not in {path}")
+    return sites, default
+
+
+class SiteRegistry:
+    """Opens one GhostClient per site on first use and closes it after ``idle_timeout`` seconds unused.
+
+    A client is never closed while a tool call is using it. ``max_open``
+    additionally caps how many clients are open at once by closing the least
+    recently used idle one, bounding memory however many sites are configured.
+    Closing a client drops its connection pool, caches and mirror sync; the
+    next call to that site starts from scratch.
+    """
+
+    def __init__(
+        self,
+        sites: dict[str, Site],
+        build: Callable[[Site], GhostClient],
+        default: str | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_open: int | None = None,
+    ):
+        self.sites = sites
+        self.build = build
+        self.default = default if default is not None or len(sites) != 1 else next(iter(sites))
+        self.idle_timeout = idle_timeout
+        self.max_open = max_open
+        self.opened = 0
+        self.evicted = 0
+        self._clients: dict[str, GhostClient] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._in_flight: dict[str, int] = {}
+        self._last_used: dict[str, float] = {}
+
+    def resolve(self, name: str | None) -> str:
+        """Site name for a tool call's ``site`` argument; raises ValueError if there is none."""
+        if not name:
+            if self.default is None:
+                raise ValueError(f"site is required. Available: {', '.join(sorted(self.sites))}")
+            return self.default
+        if name not in self.sites:
+            raise ValueError(f"unknown site '{name}'. Available: {', '.join(sorted(self.sites))}")
+        return name
+
+    def open_sites(self) -> dict[str, int]:
+        """Sites with an open client and their tool calls in flight."""
+        return {name: self._in_flight.get(name, 0) for name in self._clients}
+
+    def _open(self, name: str) -> GhostClient:
+        client = self._clients.get(name)
+        if client is None:
+            client = self._clients[name] = self.build(self.sites[name])
+            self.opened += 1
+            if client.mirror is not None:
+                self._tasks[name] = asyncio.create_task(client.mirror.keep_fresh())
+        return client
+
+    def _detach(self, name: str) -> tuple[GhostClient, asyncio.Task | None] | None:
+        """Forget ``name``'s client so no new call can pick it up; None if it is already gone."""
+        client = self._clients.pop(name, None)
+        if client is None:
+            return None
+        self._last_used.pop(name, None)
+        self._in_flight.pop(name, None)
+        self.evicted += 1
+        return client, self._tasks.pop(name, None)
+
+    async def _close(self, names: list[str]) -> list[str]:
+        """Close the clients of ``names``, returning the sites that were still open.
+
+        All of them are detached before the first await, so a call starting
+        while an earlier one is being closed opens a fresh client instead of
+        being handed one that is about to close.
+        """
+        detached = {name: self._detach(name) for name in names}
+        closed = [name for name, entry in detached.items() if entry is not None]
+        for name in closed:
+            client, task = detached[name]
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+            if client.mirror is not None:
+                client.mirror.close()
+            await client.close()
+        return closed
+
+    def _idle(self) -> list[str]:
+        """Open sites with no calls in flight, least recently used first."""
+        idle = [name for name in self._clients if not self._in_flight.get(name)]
+        return sorted(idle, key=lambda name: self._last_used.get(name, 0.0))
+
+    @asynccontextmanager
+    async def use(self, name: str) -> AsyncIterator[GhostClient]:
+        """Make ``name``'s client current for the duration of a tool call, opening it if needed."""
+        if name not in self._clients and self.max_open is not None:
+            await self._close(self._idle()[: max(0, len(self._clients) - self.max_open + 1)])
+        client = self._open(name)
+        self._in_flight[name] = self._in_flight.get(name, 0) + 1
+        token = _active.set((name, client))
+        try:
+            yield client
+        finally:
+            _active.reset(token)
+            if self._clients.get(name) is client:  # not closed by a shutdown meanwhile
+                self._in_flight[name] -= 1
+                self._last_used[name] = time.monotonic()
+
+    async def evict_idle(self, now: float | None = None) -> list[str]:
+        """Close clients unused for ``idle_timeout`` seconds, returning their site names."""
+        now = time.monotonic() if now is None else now
+        expired = [name for name in self._idle() if now - self._last_used.get(name, now) >= self.idle_timeout]
+        return await self._close(expired)
+
+    async def evict_forever(self) -> None:
+        """Run ``evict_idle`` periodically; cancel the task to stop."""
+        while True:
+            await asyncio.sleep(max(1.0, self.idle_timeout / 4))
+            await self.evict_idle()
+
+    async def close(self) -> None:
+        await self._close(list(self._clients))
+
+    def report(self) -> list[str]:
+        open_sites = self.open_sites()
+        lines = [
+            f"Sites: {len(open_sites)} open of {len(self.sites)} configured, "
+            f"{self.opened} opened and {self.evicted} evicted so far",
+        ]
+        lines.extend(f"- {name}: {in_flight} calls in flight" for name, in_flight in sorted(open_sites.items()))
+        return lines
+
+    def route(self, fn: Callable) -> Callable:
+        """Wrap an async tool function to take an optional ``site`` argument and run against that site.
+
+        Calls for an unknown site return an error without running the tool.
+        """
+        description = "Site name from the sites file"
+        if self.default is not None:
+            description += f" (default: {self.default})"
+        signature = inspect.signature(fn)
+        site = inspect.Parameter(
+            "site",
+            inspect.Parameter.KEYWORD_ONLY,
+            default=None,
+            annotation=Annotated[str | None, Field(description=description)],
+        )
+
+        @functools.wraps(fn)
+        async def wrapper(*args, site: str | None = None, **kwargs):
+            try:
+                name = self.resolve(site)
+            except ValueError as e:
+                return f"Error: {e}"
+            tracing.current().set(site=name)
+            async with self.use(name):
+                return await fn(*args, **kwargs)
+
+        wrapper.__signature__ = signature.replace(parameters=[*signature.parameters.values(), site])
+        wrapper.__annotations__ = {**fn.__annotations__, "site": site.annotation}
+        return wrapper
+
+
+class SiteClient:
+    """Stands in for a GhostClient in tool functions, forwarding to the current site's client.
+
+    Only usable inside a tool call routed by ``SiteRegistry.route``.
+    """
+
+    def __init__(self, registry: SiteRegistry):
+        object.__setattr__(self, "registry", registry)
+
+    @staticmethod
+    def current() -> tuple[str, GhostClient]:
+        active = _active.get()
+        if active is None:
+            raise RuntimeError("No Ghost site selected outside a routed tool call")
+        return active
+
+    def __getattr__(self, name: str):
+        return getattr(self.current()[1], name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self.current()[1], name, value)
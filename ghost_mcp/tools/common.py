@@ -0,0 +1,168 @@
+"""Helpers shared by the MCP tool modules."""
+
+import asyncio
+import json
+import re
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
+
+from ghost_mcp.cache import source_hash
+from ghost_mcp.client import GhostAPIError, GhostClient
+from ghost_mcp.converters import markdown_to_html_async, upload_local_images
+
+CONTENT_FORMATS = {"none", "html", "plaintext", "lexical"}
+CONTENT_LABELS = {"html": "HTML content", "plaintext": "Plaintext content", "lexical": "Lexical content"}
+RELATIONS = ("tags", "authors")
+FIELD_RE = re.compile(r"^[a-z_]+$")
+ID_RE = re.compile(r"^[a-zA-Z0-9]+$")
+MAX_BULK_CONCURRENCY = 16
+
+
+def read_params(content: str, fields: list[str] | None, include: tuple[str, ...], summary: str) -> dict:
+    """Build minimal ``fields``/``formats``/``include`` params for a single-resource read.
+
+    ``summary`` lists the columns of the tool's default output; a metadata-only
+    read without ``fields`` asks for just those, since with no ``formats`` Ghost
+    would return its default body formats. Raises ValueError for an unknown
+    content format or malformed field name.
+    """
+    if content not in CONTENT_FORMATS:
+        raise ValueError(f"invalid content '{content}'. Must be one of: {', '.join(sorted(CONTENT_FORMATS))}")
+
+    params: dict = {}
+    relations = include
+    if fields is not None:
+        invalid = [f for f in fields if not FIELD_RE.match(f)]
+        if invalid:
+            raise ValueError(f"invalid field names: {', '.join(invalid)}")
+        relations = tuple(r for r in include if r in fields)
+        columns = [f for f in fields if f not in RELATIONS]
+        if content != "none":
+            columns.append(content)
+        params["fields"] = ",".join(dict.fromkeys(["id", *columns]))
+    elif content == "none":
+        params["fields"] = summary
+
+    if relations:
+        params["include"] = ",".join(relations)
+    if content != "none":
+        params["formats"] = content
+    return params
+
+
+def selection_filter(ids: list[str] | None, filter: str | None) -> str:
+    """NQL selecting the given ids, narrowed by ``filter`` when both are given.
+
+    Raises ValueError if neither is given or an id is malformed.
+    """
+    if not ids and not filter:
+        raise ValueError("provide post_ids or filter")
+    if ids and not all(ID_RE.match(id) for id in ids):
+        raise ValueError("invalid post id")
+    nql = f"id:[{','.join(ids)}]" if ids else None
+    if filter:
+        nql = f"{nql}+({filter})" if nql else filter
+    return nql
+
+
+def field_lines(resource: dict, fields: list[str]) -> list[str]:
+    """Render the requested fields of a resource as ``name: value`` lines."""
+    lines = []
+    for name in fields:
+        value = resource.get(name)
+        if name in RELATIONS:
+            value = ", ".join(item["name"] for item in value or []) or None
+        lines.append(f"{name}: {'n/a' if value is None else value}")
+    return lines
+
+
+def content_lines(resource: dict, content: str) -> list[str]:
+    """Render the body of a resource in the requested format, if present."""
+    if content == "none" or not resource.get(content):
+        return []
+    value = resource[content]
+    if not isinstance(value, str):
+        value = json.dumps(value)
+    return [f"\n{CONTENT_LABELS[content]}:\n{value}"]
+
+
+async def render_markdown(client: GhostClient, markdown_content: str, base_dir: str | None = None) -> str:
+    """Upload local images the Markdown references, then convert it to HTML.
+
+    Raises ValueError if a referenced image is missing or can't be uploaded.
+    """
+    from ghost_mcp.tools.images import upload_image_file  # so the images group loads only when enabled
+
+    markdown_content = await upload_local_images(markdown_content, partial(upload_image_file, client), base_dir)
+    return await markdown_to_html_async(markdown_content)
+
+
+async def write_update(
+    client: GhostClient,
+    family: str,
+    id: str,
+    data: dict,
+    markdown_content: str | None = None,
+    base_dir: str | None = None,
+    overwrite: bool = True,
+) -> dict | None:
+    """PUT only what changed since this server last wrote the post/page; None if nothing did.
+
+    ``data`` holds the fields being set. Markdown is rendered and sent only
+    when it differs from the cached source. A cached no-op is confirmed with
+    a minimal version read; if the resource moved on, everything is sent. If the resource changed since
+    that write (a 409), the full update is sent instead, or with
+    ``overwrite=False`` the GhostAPIError is raised.
+    """
+    version = client.versions.get(family, id)
+    entry = client.sources.get(family, id, version["updated_at"] if version else None)
+    changes = data
+    render = markdown_content is not None
+    if entry is not None:
+        known = entry["fields"]
+        changes = {key: value for key, value in data.items() if key not in known or known[key] != value}
+        render = render and source_hash(markdown_content) != entry["hash"]
+        if not changes and not render:
+            # Confirm the no-op with Ghost: an edit made elsewhere since our write must be overwritten.
+            current = await client.current_version(family, id, refresh=True)
+            if current["updated_at"] == entry["updated_at"]:
+                return None
+            client.sources.forget(family, id)
+            entry, changes, render = None, data, markdown_content is not None
+
+    body = dict(changes)
+    if render:
+        body["html"] = await render_markdown(client, markdown_content, base_dir)
+    query = "?source=html" if render else ""
+    if entry is None:
+        result = await client.put_versioned(family, id, body, query=query)
+    else:
+        try:
+            result = await client.put(f"{family}/{id}/{query}", {family: [{**body, "updated_at": entry["updated_at"]}]})
+        except GhostAPIError as e:
+            client.sources.forget(family, id)
+            if e.status_code != 409 or not overwrite:
+                raise
+            await client.current_version(family, id, refresh=True)
+            return await write_update(client, family, id, data, markdown_content, base_dir)
+
+    item = result[family][0]
+    fields = {**entry["fields"], **data} if entry else dict(data)
+    if markdown_content is None and entry is not None:
+        markdown_content = entry["markdown"]
+    client.sources.record(family, id, item.get("updated_at"), fields, markdown_content)
+    return item
+
+
+async def run_bounded(items: Iterable, fn: Callable[..., Awaitable], concurrency: int) -> list:
+    """``fn(item)`` for every item with at most ``concurrency`` running (capped at MAX_BULK_CONCURRENCY).
+
+    Results keep input order, with the exception in place of any call that failed.
+    """
+    semaphore = asyncio.Semaphore(max(1, min(concurrency, MAX_BULK_CONCURRENCY)))
+
+    async def run(item):
+        async with semaphore:
+            return await fn(item)
+
+    return await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
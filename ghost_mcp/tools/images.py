@@ -1,13 +1,112 @@
 """MCP tools for Ghost image upload and site utilities."""
 
+import asyncio
+import glob
+import os
 from pathlib import Path
 
 from mcp.server.fastmcp import FastMCP
 
+from ghost_mcp import tracing
 from ghost_mcp.client import GhostClient
+from ghost_mcp.media import hash_file
+from ghost_mcp.sites import SiteClient
 
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".ico"}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
+MAX_BATCH_FILES = 100
+MAX_UPLOAD_CONCURRENCY = 16
+
+
+def _stats_lines(client: GhostClient) -> list[str]:
+    """Metrics report plus cache and rate limiter state."""
+    lines = client.metrics.report() if client.metrics is not None else ["Metrics: disabled"]
+    if isinstance(client, SiteClient):
+        lines.extend(client.registry.report())
+        lines.append(f"Current site: {client.current()[0]}")
+    if client.cache is not None:
+        lines.append("Response cache: " + ", ".join(f"{k} {v}" for k, v in client.cache.stats().items()))
+    if client.rate_limiter is not None:
+        lines.append(f"Rate limit: {client.rate_limiter.rate:.1f} req/s, {client.rate_limiter.in_flight} in flight")
+    lines.append(f"Known versions: {len(client.versions)} | Tags: {len(client.tags)} | Sources: {len(client.sources)}")
+    if client.image_index is not None:
+        lines.append(f"Image index: {len(client.image_index)} images")
+    return lines
+
+
+def _check_image(file_path: str) -> tuple[Path, int, str]:
+    """Resolve and validate an image file, returning its path, size and MIME type.
+
+    Does blocking filesystem calls; raises ValueError describing what is wrong.
+    """
+    path = Path(file_path).resolve()
+    try:
+        file_size = path.stat().st_size
+    except FileNotFoundError:
+        raise ValueError("file not found") from None
+
+    if path.suffix.lower() not in ALLOWED_EXTENSIONS:
+        raise ValueError(f"unsupported file type '{path.suffix}'. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}")
+
+    if file_size > MAX_FILE_SIZE:
+        raise ValueError(f"file too large ({file_size // 1024 // 1024}MB). Maximum: {MAX_FILE_SIZE // 1024 // 1024}MB")
+
+    import mimetypes
+    mime_type, _ = mimetypes.guess_type(str(path))
+    return path, file_size, mime_type or "application/octet-stream"
+
+
+def _expand_glob(pattern: str) -> list[str]:
+    """Image files matching a glob pattern (``**`` recurses), sorted."""
+    matches = glob.glob(os.path.expanduser(pattern), recursive=True)
+    return sorted(m for m in matches if Path(m).suffix.lower() in ALLOWED_EXTENSIONS and os.path.isfile(m))
+
+
+async def _upload_image(client: GhostClient, path: Path, size: int, mime_type: str) -> tuple[str, bool]:
+    """Upload one validated file; returns ``(url, reused)``, reusing known content.
+
+    Content is recognised by the hash of the original file, so a hit skips
+    optimization as well as the upload.
+    """
+
+    async def upload() -> str:
+        optimized = None
+        if client.image_optimizer is not None:
+            with tracing.span("image.optimize") as span:
+                try:
+                    optimized = await client.image_optimizer.optimize(path)
+                except Exception:
+                    optimized = None  # e.g. a file Pillow can't decode; let Ghost judge the original
+                span.set(optimized_bytes=optimized.size if optimized else None)
+        if optimized is None:
+            result = await client.upload("images/upload/", path, mime_type, size=size)
+        else:
+            try:
+                result = await client.upload(
+                    "images/upload/",
+                    optimized.path,
+                    optimized.mime_type,
+                    size=optimized.size,
+                    filename=path.stem + optimized.extension,
+                )
+            finally:
+                await asyncio.to_thread(os.unlink, optimized.path)
+        return result["images"][0]["url"]
+
+    with tracing.span("image.upload", file=path.name, bytes=size) as span:
+        if client.image_index is None:
+            return await upload(), False
+        digest = await hash_file(path)
+        image_url, reused = await client.image_index.upload_once(client, digest, upload, size=size)
+        span.set(reused=reused)
+        return image_url, reused
+
+
+async def upload_image_file(client: GhostClient, path: str | os.PathLike) -> str:
+    """Validate and upload one file, returning its URL; raises ValueError if it isn't acceptable."""
+    checked = await asyncio.to_thread(_check_image, os.fspath(path))
+    image_url, _ = await _upload_image(client, *checked)
+    return image_url
 
 
 def register_image_tools(mcp: FastMCP, client: GhostClient, readonly: bool = False):
@@ -22,30 +121,71 @@ def register_image_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fal
             Args:
                 file_path: Absolute path to the image file
             """
-            path = Path(file_path).resolve()
-
-            if not path.exists():
-                return "Error: file not found"
-
-            if path.suffix.lower() not in ALLOWED_EXTENSIONS:
-                return f"Error: unsupported file type '{path.suffix}'. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
-
-            file_size = path.stat().st_size
-            if file_size > MAX_FILE_SIZE:
-                return f"Error: file too large ({file_size // 1024 // 1024}MB). Maximum: {MAX_FILE_SIZE // 1024 // 1024}MB"
-
-            import mimetypes
-            mime_type, _ = mimetypes.guess_type(str(path))
-            if not mime_type:
-                mime_type = "application/octet-stream"
+            try:
+                path, file_size, mime_type = await asyncio.to_thread(_check_image, file_path)
+            except ValueError as e:
+                return f"Error: {e}"
+
+            image_url, reused = await _upload_image(client, path, file_size, mime_type)
+            if reused:
+                return f"Image already uploaded, reusing it.\nURL: {image_url}"
+            return f"Image uploaded!\nURL: {image_url}"
 
-            with path.open("rb") as f:
-                files = {"file": (path.name, f.read(), mime_type)}
+        @mcp.tool()
+        async def ghost_upload_images(
+            file_paths: list[str] | None = None,
+            pattern: str | None = None,
+            concurrency: int = 4,
+        ) -> str:
+            """Upload many images in one call and get a URL for each. Failed files don't stop the batch.
 
-            result = await client.post("images/upload/", files=files)
-            image_url = result["images"][0]["url"]
+            Args:
+                file_paths: Absolute paths to image files
+                pattern: Glob matching image files, e.g. /drafts/post/*.png (use ** to recurse)
+                concurrency: Files uploaded in parallel (max 16)
+            """
+            names = list(file_paths or [])
+            if pattern:
+                names.extend(await asyncio.to_thread(_expand_glob, pattern))
+            names = list(dict.fromkeys(names))
+            if not names:
+                return "Error: no image files given or matched"
+            if len(names) > MAX_BATCH_FILES:
+                return f"Error: too many files ({len(names)}). Maximum: {MAX_BATCH_FILES}"
+
+            # Validate everything before the first upload starts.
+            checks = await asyncio.gather(
+                *(asyncio.to_thread(_check_image, name) for name in names),
+                return_exceptions=True,
+            )
+            semaphore = asyncio.Semaphore(max(1, min(concurrency, MAX_UPLOAD_CONCURRENCY)))
+
+            async def upload(check: tuple[Path, int, str] | BaseException) -> tuple[str, bool]:
+                if isinstance(check, BaseException):
+                    raise check
+                async with semaphore:
+                    return await _upload_image(client, *check)
+
+            results = await asyncio.gather(*(upload(c) for c in checks), return_exceptions=True)
+
+            uploaded = sum(1 for r in results if not isinstance(r, BaseException))
+            lines = [f"Uploaded images: {uploaded}/{len(names)}"]
+            for name, result in zip(names, results):
+                if isinstance(result, BaseException):
+                    lines.append(f"- {name}: Error: {result}")
+                else:
+                    image_url, reused = result
+                    lines.append(f"- {name}: {image_url}{' (reused)' if reused else ''}")
+
+            return "\n".join(lines)
 
-            return f"Image uploaded!\nURL: {image_url}"
+        @mcp.tool()
+        async def ghost_index_uploaded_images() -> str:
+            """Hash images already used by posts and pages so re-uploading them reuses the existing URL."""
+            if client.image_index is None:
+                return "Error: the upload index is not enabled"
+            added = await client.image_index.seed(client)
+            return f"Indexed images: {added} new, {len(client.image_index)} total"
 
     @mcp.tool()
     async def ghost_site_info() -> str:
@@ -62,3 +202,8 @@ def register_image_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fal
         ]
 
         return "\n".join(lines)
+
+    @mcp.tool()
+    async def ghost_server_stats() -> str:
+        """Show this MCP server's tool and API latency, error counts and cache statistics."""
+        return "\n".join(_stats_lines(client))
@@ -3,9 +3,11 @@
 from mcp.server.fastmcp import FastMCP
 
 from ghost_mcp.client import GhostClient
-from ghost_mcp.converters import markdown_to_html
+from ghost_mcp.tools.common import content_lines, field_lines, read_params, render_markdown, write_update
 
 VALID_STATUSES = {"all", "published", "draft"}
+LIST_FIELDS = "id,title,slug,status,published_at,updated_at"
+SUMMARY_FIELDS = "id,title,slug,status,url"
 
 
 def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = False):
@@ -16,6 +18,7 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         status: str = "all",
         limit: int = 15,
         page: int = 1,
+        fetch_all: bool = False,
     ) -> str:
         """List Ghost pages.
 
@@ -23,6 +26,7 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             status: Filter by status (all, published, draft)
             limit: Pages per page (max 15)
             page: Page number
+            fetch_all: Walk every page and list all matching pages (ignores limit and page)
         """
         if status not in VALID_STATUSES:
             return f"Error: invalid status '{status}'. Must be one of: {', '.join(sorted(VALID_STATUSES))}"
@@ -31,12 +35,34 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             "limit": min(limit, 15),
             "page": page,
             "include": "tags",
-            "fields": "id,title,slug,status,published_at,updated_at",
+            "fields": LIST_FIELDS,
         }
         if status != "all":
             params["filter"] = f"status:{status}"
 
-        result = await client.get("pages/", params=params)
+        if fetch_all and client.mirror is None:
+            count = 0
+            lines = []
+            async for p in client.iterate(
+                "pages",
+                filter=params.get("filter"),
+                fields=LIST_FIELDS,
+                params={"include": "tags"},
+            ):
+                count += 1
+                lines.append(f"\n- [{p['status']}] {p['title']}")
+                lines.append(f"  ID: {p['id']} | Slug: {p['slug']}")
+            return "\n".join([f"Found pages: {count}"] + lines)
+
+        if client.mirror is not None:
+            result = await client.mirror.list_items(
+                "pages",
+                status=None if status == "all" else status,
+                limit=None if fetch_all else params["limit"],
+                page=1 if fetch_all else page,
+            )
+        else:
+            result = await client.get("pages/", params=params)
         pages = result.get("pages", [])
         meta = result.get("meta", {}).get("pagination", {})
 
@@ -51,30 +77,43 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
     async def ghost_get_page(
         id: str | None = None,
         slug: str | None = None,
+        content: str = "html",
+        fields: list[str] | None = None,
     ) -> str:
         """Get a page by ID or slug.
 
         Args:
             id: Page ID
             slug: Page slug
+            content: Body format to return: html, plaintext, lexical, or none for metadata only
+            fields: Only return these fields (e.g. title, status, tags, url); default is a standard summary
         """
         if not id and not slug:
             return "Error: provide either id or slug"
 
         endpoint = f"pages/{id}/" if id else f"pages/slug/{slug}/"
-        params = {"include": "tags", "formats": "html"}
-        result = await client.get(endpoint, params=params)
-        page = result["pages"][0]
-
-        lines = [
-            f"Title: {page['title']}",
-            f"ID: {page['id']}",
-            f"Slug: {page['slug']}",
-            f"Status: {page['status']}",
-            f"URL: {page.get('url', 'n/a')}",
-        ]
-        if page.get("html"):
-            lines.append(f"\nHTML content:\n{page['html']}")
+        try:
+            params = read_params(content, fields, include=("tags",), summary=SUMMARY_FIELDS)
+        except ValueError as e:
+            return f"Error: {e}"
+        page = None
+        if client.mirror is not None and content != "lexical":
+            page = await client.mirror.get_item("pages", id=id, slug=slug)
+        if page is None:
+            result = await client.get(endpoint, params=params)
+            page = result["pages"][0]
+
+        if fields is not None:
+            lines = field_lines(page, fields)
+        else:
+            lines = [
+                f"Title: {page['title']}",
+                f"ID: {page['id']}",
+                f"Slug: {page['slug']}",
+                f"Status: {page['status']}",
+                f"URL: {page.get('url', 'n/a')}",
+            ]
+        lines.extend(content_lines(page, content))
 
         return "\n".join(lines)
 
@@ -90,8 +129,9 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         slug: str | None = None,
         meta_title: str | None = None,
         meta_description: str | None = None,
+        base_dir: str | None = None,
     ) -> str:
-        """Create a new Ghost page from Markdown.
+        """Create a new Ghost page from Markdown, uploading local images it references.
 
         Args:
             title: Page title
@@ -101,12 +141,16 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             slug: URL slug
             meta_title: SEO title (recommended ~60 characters)
             meta_description: SEO description (recommended ~145 characters)
+            base_dir: Directory that relative image paths in markdown_content are relative to
         """
-        html = markdown_to_html(markdown_content)
+        try:
+            html = await render_markdown(client, markdown_content, base_dir)
+        except ValueError as e:
+            return f"Error: {e}"
         page_data: dict = {"title": title, "html": html, "status": status}
 
         if tags:
-            page_data["tags"] = [{"name": t} for t in tags]
+            page_data["tags"] = client.tags.references(tags)
         if slug:
             page_data["slug"] = slug
         if meta_title:
@@ -116,6 +160,8 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
 
         result = await client.post("pages/?source=html", data={"pages": [page_data]})
         page = result["pages"][0]
+        fields = {key: value for key, value in page_data.items() if key != "html"}
+        client.sources.record("pages", page["id"], page.get("updated_at"), fields, markdown_content)
 
         return f"Page created!\nID: {page['id']}\nSlug: {page['slug']}\nStatus: {page['status']}"
 
@@ -128,8 +174,11 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         slug: str | None = None,
         meta_title: str | None = None,
         meta_description: str | None = None,
+        base_dir: str | None = None,
     ) -> str:
-        """Update a page.
+        """Update a page. Local images in markdown_content are uploaded as in ghost_create_page.
+
+        Only fields that differ from this server's last write of the page are sent.
 
         Args:
             id: Page ID (required)
@@ -139,18 +188,14 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             slug: New slug
             meta_title: New SEO title (recommended ~60 characters)
             meta_description: New SEO description (recommended ~145 characters)
+            base_dir: Directory that relative image paths in markdown_content are relative to
         """
-        current = await client.get(f"pages/{id}/")
-        current_page = current["pages"][0]
-
-        page_data: dict = {"updated_at": current_page["updated_at"]}
+        page_data: dict = {}
 
         if title:
             page_data["title"] = title
-        if markdown_content:
-            page_data["html"] = markdown_to_html(markdown_content)
         if tags is not None:
-            page_data["tags"] = [{"name": t} for t in tags]
+            page_data["tags"] = client.tags.references(tags)
         if slug:
             page_data["slug"] = slug
         if meta_title is not None:
@@ -158,9 +203,12 @@ def register_page_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         if meta_description is not None:
             page_data["meta_description"] = meta_description
 
-        endpoint = f"pages/{id}/" + ("?source=html" if markdown_content else "")
-        result = await client.put(endpoint, data={"pages": [page_data]})
-        page = result["pages"][0]
+        try:
+            page = await write_update(client, "pages", id, page_data, markdown_content or None, base_dir)
+        except ValueError as e:
+            return f"Error: {e}"
+        if page is None:
+            return f"Page {id} is unchanged."
 
         return f"Page updated!\nID: {page['id']}\nTitle: {page['title']}"
 
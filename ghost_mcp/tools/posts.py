@@ -1,16 +1,123 @@
 """MCP tools for managing Ghost posts."""
 
 import re
+from datetime import datetime
 
 from mcp.server.fastmcp import FastMCP
 
-from ghost_mcp.client import GhostClient
-from ghost_mcp.converters import markdown_to_html
+from ghost_mcp.client import GhostAPIError, GhostClient
+from ghost_mcp.converters import replace_section, replace_text
+from ghost_mcp.tools.common import (
+    MAX_BULK_CONCURRENCY,
+    content_lines,
+    field_lines,
+    read_params,
+    render_markdown,
+    run_bounded,
+    selection_filter,
+    write_update,
+)
 
 VALID_STATUSES = {"all", "published", "draft", "scheduled"}
+LIST_FIELDS = "id,title,slug,status,published_at,updated_at,excerpt"
+SUMMARY_FIELDS = "id,title,slug,status,custom_excerpt,excerpt,url,published_at,updated_at"
+POST_SPEC_FIELDS = {
+    "base_dir",
+    "title",
+    "markdown_content",
+    "status",
+    "tags",
+    "excerpt",
+    "slug",
+    "meta_title",
+    "meta_description",
+    "featured_image_url",
+}
+TRANSITION_STATUSES = {"published", "draft", "scheduled"}
 TAG_SLUG_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
 
 
+def _post_lines(p: dict) -> list[str]:
+    """Render one post of a list result."""
+    lines = [f"\n- [{p['status']}] {p['title']}", f"  ID: {p['id']} | Slug: {p['slug']}"]
+    tags = ", ".join(t["name"] for t in p.get("tags", []))
+    if tags:
+        lines.append(f"  Tags: {tags}")
+    if p.get("published_at"):
+        lines.append(f"  Published: {p['published_at']}")
+    return lines
+
+
+async def _set_post_status(client: GhostClient, id: str, status: str) -> dict | None:
+    """Move a post to ``status``; returns None if it already has that status."""
+    was_cached = client.versions.get("posts", id) is not None
+    version = await client.current_version("posts", id)
+    if version["status"] == status and was_cached:
+        # Confirm a no-op against Ghost rather than a possibly stale cache entry.
+        version = await client.current_version("posts", id, refresh=True)
+    if version["status"] == status:
+        return None
+    result = await client.put_versioned(
+        "posts", id, {"status": status}, updated_at=version["updated_at"],
+    )
+    return result["posts"][0]
+
+
+async def _new_post_data(
+    client: GhostClient,
+    title: str,
+    markdown_content: str,
+    status: str = "draft",
+    tags: list[str] | None = None,
+    excerpt: str | None = None,
+    slug: str | None = None,
+    meta_title: str | None = None,
+    meta_description: str | None = None,
+    featured_image_url: str | None = None,
+    base_dir: str | None = None,
+) -> dict:
+    """Build the API payload for a new post, rendering its Markdown and uploading its local images."""
+    html = await render_markdown(client, markdown_content, base_dir)
+
+    post_data: dict = {
+        "title": title,
+        "html": html,
+        "status": status,
+    }
+
+    if tags:
+        post_data["tags"] = client.tags.references(tags)
+    if excerpt:
+        post_data["custom_excerpt"] = excerpt
+    if slug:
+        post_data["slug"] = slug
+    if meta_title:
+        post_data["meta_title"] = meta_title
+    if meta_description:
+        post_data["meta_description"] = meta_description
+    if featured_image_url:
+        post_data["feature_image"] = featured_image_url
+
+    return {"posts": [post_data]}
+
+
+async def _bulk_post_data(client: GhostClient, spec: dict) -> dict:
+    """Validate one ghost_bulk_create_posts item and build its payload."""
+    unknown = set(spec) - POST_SPEC_FIELDS
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}")
+    missing = {"title", "markdown_content"} - set(spec)
+    if missing:
+        raise ValueError(f"missing fields: {', '.join(sorted(missing))}")
+    return await _new_post_data(client, **spec)
+
+
+def _record_source(client: GhostClient, post: dict, post_data: dict, markdown_content: str) -> None:
+    """Remember what a new post was created from, so later updates and patches can send only changes."""
+    fields = {key: value for key, value in post_data["posts"][0].items() if key != "html"}
+    client.sources.record("posts", post["id"], post.get("updated_at"), fields, markdown_content)
+
+
 def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = False):
     """Register tools for working with posts."""
 
@@ -20,6 +127,7 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         tag: str | None = None,
         limit: int = 15,
         page: int = 1,
+        fetch_all: bool = False,
     ) -> str:
         """List Ghost posts.
 
@@ -28,6 +136,7 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             tag: Filter by tag slug
             limit: Posts per page (max 15)
             page: Page number
+            fetch_all: Walk every page and list all matching posts (ignores limit and page)
         """
         if status not in VALID_STATUSES:
             return f"Error: invalid status '{status}'. Must be one of: {', '.join(sorted(VALID_STATUSES))}"
@@ -36,7 +145,7 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             "limit": min(limit, 15),
             "page": page,
             "include": "tags,authors",
-            "fields": "id,title,slug,status,published_at,updated_at,excerpt",
+            "fields": LIST_FIELDS,
         }
         if status != "all":
             params["filter"] = f"status:{status}"
@@ -47,19 +156,35 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             tag_filter = f"tag:{tag}"
             params["filter"] = f"{existing_filter}+{tag_filter}" if existing_filter else tag_filter
 
-        result = await client.get("posts/", params=params)
+        if fetch_all and client.mirror is None:
+            count = 0
+            lines = []
+            async for p in client.iterate(
+                "posts",
+                filter=params.get("filter"),
+                fields=LIST_FIELDS,
+                params={"include": "tags,authors"},
+            ):
+                count += 1
+                lines.extend(_post_lines(p))
+            return "\n".join([f"Found posts: {count}"] + lines)
+
+        if client.mirror is not None:
+            result = await client.mirror.list_items(
+                "posts",
+                status=None if status == "all" else status,
+                tag=tag,
+                limit=None if fetch_all else params["limit"],
+                page=1 if fetch_all else page,
+            )
+        else:
+            result = await client.get("posts/", params=params)
         posts = result.get("posts", [])
         meta = result.get("meta", {}).get("pagination", {})
 
         lines = [f"Found posts: {meta.get('total', len(posts))} (page {meta.get('page', 1)}/{meta.get('pages', 1)})"]
         for p in posts:
-            tags = ", ".join(t["name"] for t in p.get("tags", []))
-            lines.append(f"\n- [{p['status']}] {p['title']}")
-            lines.append(f"  ID: {p['id']} | Slug: {p['slug']}")
-            if tags:
-                lines.append(f"  Tags: {tags}")
-            if p.get("published_at"):
-                lines.append(f"  Published: {p['published_at']}")
+            lines.extend(_post_lines(p))
 
         return "\n".join(lines)
 
@@ -67,12 +192,16 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
     async def ghost_get_post(
         id: str | None = None,
         slug: str | None = None,
+        content: str = "html",
+        fields: list[str] | None = None,
     ) -> str:
         """Get a post by ID or slug.
 
         Args:
             id: Post ID
             slug: Post slug
+            content: Body format to return: html, plaintext, lexical, or none for metadata only
+            fields: Only return these fields (e.g. title, status, tags, published_at); default is a standard summary
         """
         if not id and not slug:
             return "Error: provide either id or slug"
@@ -82,27 +211,36 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         else:
             endpoint = f"posts/slug/{slug}/"
 
-        params = {"include": "tags,authors", "formats": "html,lexical"}
-        result = await client.get(endpoint, params=params)
-        post = result["posts"][0]
-
-        tags = ", ".join(t["name"] for t in post.get("tags", []))
-        authors = ", ".join(a["name"] for a in post.get("authors", []))
-
-        lines = [
-            f"Title: {post['title']}",
-            f"ID: {post['id']}",
-            f"Slug: {post['slug']}",
-            f"Status: {post['status']}",
-            f"Tags: {tags or 'n/a'}",
-            f"Authors: {authors or 'n/a'}",
-            f"Excerpt: {post.get('custom_excerpt') or post.get('excerpt', 'n/a')}",
-            f"URL: {post.get('url', 'n/a')}",
-            f"Published: {post.get('published_at', 'n/a')}",
-            f"Updated: {post.get('updated_at', 'n/a')}",
-        ]
-        if post.get("html"):
-            lines.append(f"\nHTML content:\n{post['html']}")
+        try:
+            params = read_params(content, fields, include=("tags", "authors"), summary=SUMMARY_FIELDS)
+        except ValueError as e:
+            return f"Error: {e}"
+        post = None
+        if client.mirror is not None and content != "lexical":
+            post = await client.mirror.get_item("posts", id=id, slug=slug)
+        if post is None:
+            result = await client.get(endpoint, params=params)
+            post = result["posts"][0]
+
+        if fields is not None:
+            lines = field_lines(post, fields)
+        else:
+            tags = ", ".join(t["name"] for t in post.get("tags", []))
+            authors = ", ".join(a["name"] for a in post.get("authors", []))
+
+            lines = [
+                f"Title: {post['title']}",
+                f"ID: {post['id']}",
+                f"Slug: {post['slug']}",
+                f"Status: {post['status']}",
+                f"Tags: {tags or 'n/a'}",
+                f"Authors: {authors or 'n/a'}",
+                f"Excerpt: {post.get('custom_excerpt') or post.get('excerpt', 'n/a')}",
+                f"URL: {post.get('url', 'n/a')}",
+                f"Published: {post.get('published_at', 'n/a')}",
+                f"Updated: {post.get('updated_at', 'n/a')}",
+            ]
+        lines.extend(content_lines(post, content))
 
         return "\n".join(lines)
 
@@ -120,9 +258,13 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         meta_title: str | None = None,
         meta_description: str | None = None,
         featured_image_url: str | None = None,
+        base_dir: str | None = None,
     ) -> str:
         """Create a new Ghost post from Markdown.
 
+        Local images referenced in the Markdown (absolute paths, file:// URLs, or
+        paths relative to base_dir) are uploaded and their links replaced.
+
         Args:
             title: Post title
             markdown_content: Content in Markdown format
@@ -133,32 +275,66 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             meta_title: SEO title (recommended ~60 characters)
             meta_description: SEO description (recommended ~145 characters)
             featured_image_url: Cover image URL
+            base_dir: Directory that relative image paths in markdown_content are relative to
         """
-        html = markdown_to_html(markdown_content)
+        try:
+            post_data = await _new_post_data(
+                client,
+                title,
+                markdown_content,
+                status=status,
+                tags=tags,
+                excerpt=excerpt,
+                slug=slug,
+                meta_title=meta_title,
+                meta_description=meta_description,
+                featured_image_url=featured_image_url,
+                base_dir=base_dir,
+            )
+        except ValueError as e:
+            return f"Error: {e}"
+        result = await client.post("posts/?source=html", data=post_data)
+        post = result["posts"][0]
+        _record_source(client, post, post_data, markdown_content)
 
-        post_data: dict = {
-            "title": title,
-            "html": html,
-            "status": status,
-        }
+        return f"Post created!\nID: {post['id']}\nSlug: {post['slug']}\nStatus: {post['status']}\nURL: {post.get('url', 'n/a')}"
 
-        if tags:
-            post_data["tags"] = [{"name": t} for t in tags]
-        if excerpt:
-            post_data["custom_excerpt"] = excerpt
-        if slug:
-            post_data["slug"] = slug
-        if meta_title:
-            post_data["meta_title"] = meta_title
-        if meta_description:
-            post_data["meta_description"] = meta_description
-        if featured_image_url:
-            post_data["feature_image"] = featured_image_url
+    @mcp.tool()
+    async def ghost_bulk_create_posts(posts: list[dict], concurrency: int = 4) -> str:
+        """Create many posts in one call. Failed items are reported without stopping the batch.
 
-        result = await client.post("posts/?source=html", data={"posts": [post_data]})
-        post = result["posts"][0]
+        Args:
+            posts: Post specs, each with the ghost_create_post arguments (title and markdown_content required)
+            concurrency: Posts submitted in parallel (max 16)
+        """
+        if not posts:
+            return "Error: provide at least one post"
+
+        prepared: list[dict | None] = [None] * len(posts)
+
+        async def prepare(i: int, spec: dict) -> dict:
+            prepared[i] = await _bulk_post_data(client, spec)
+            return prepared[i]
+
+        payloads = [prepare(i, spec) for i, spec in enumerate(posts)]
+        results = await client.post_many(
+            "posts/?source=html",
+            payloads,
+            concurrency=max(1, min(concurrency, MAX_BULK_CONCURRENCY)),
+        )
+
+        created = sum(1 for r in results if not isinstance(r, BaseException))
+        lines = [f"Created posts: {created}/{len(posts)}"]
+        for i, (spec, post_data, result) in enumerate(zip(posts, prepared, results), 1):
+            title = spec.get("title", "n/a")
+            if isinstance(result, BaseException):
+                lines.append(f"{i}. Error: {title} — {result}")
+            else:
+                post = result["posts"][0]
+                _record_source(client, post, post_data, spec["markdown_content"])
+                lines.append(f"{i}. {title} — ID: {post['id']} | Slug: {post['slug']} | Status: {post['status']}")
 
-        return f"Post created!\nID: {post['id']}\nSlug: {post['slug']}\nStatus: {post['status']}\nURL: {post.get('url', 'n/a')}"
+        return "\n".join(lines)
 
     @mcp.tool()
     async def ghost_update_post(
@@ -171,8 +347,12 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         meta_title: str | None = None,
         meta_description: str | None = None,
         featured_image_url: str | None = None,
+        base_dir: str | None = None,
     ) -> str:
-        """Update an existing post.
+        """Update an existing post. Local images in markdown_content are uploaded as in ghost_create_post.
+
+        Only fields that differ from this server's last write of the post are
+        sent; an unchanged markdown_content is not re-rendered or re-sent.
 
         Args:
             id: Post ID (required)
@@ -184,18 +364,14 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
             meta_title: New SEO title (recommended ~60 characters)
             meta_description: New SEO description (recommended ~145 characters)
             featured_image_url: New cover image URL
+            base_dir: Directory that relative image paths in markdown_content are relative to
         """
-        current = await client.get(f"posts/{id}/")
-        current_post = current["posts"][0]
-
-        post_data: dict = {"updated_at": current_post["updated_at"]}
+        post_data: dict = {}
 
         if title:
             post_data["title"] = title
-        if markdown_content:
-            post_data["html"] = markdown_to_html(markdown_content)
         if tags is not None:
-            post_data["tags"] = [{"name": t} for t in tags]
+            post_data["tags"] = client.tags.references(tags)
         if excerpt is not None:
             post_data["custom_excerpt"] = excerpt
         if slug:
@@ -207,12 +383,69 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         if featured_image_url is not None:
             post_data["feature_image"] = featured_image_url
 
-        endpoint = f"posts/{id}/" + ("?source=html" if markdown_content else "")
-        result = await client.put(endpoint, data={"posts": [post_data]})
-        post = result["posts"][0]
+        try:
+            post = await write_update(client, "posts", id, post_data, markdown_content or None, base_dir)
+        except ValueError as e:
+            return f"Error: {e}"
+        if post is None:
+            return f"Post {id} is unchanged."
 
         return f"Post updated!\nID: {post['id']}\nTitle: {post['title']}\nStatus: {post['status']}"
 
+    @mcp.tool()
+    async def ghost_patch_post(
+        id: str,
+        find: str | None = None,
+        replace: str | None = None,
+        replace_all: bool = False,
+        section: str | None = None,
+        content: str | None = None,
+        base_dir: str | None = None,
+    ) -> str:
+        """Edit part of a post's Markdown without sending the whole document.
+
+        Works on the Markdown this server last wrote for the post (with
+        ghost_create_post or ghost_update_post). Give find/replace, or a
+        section heading and its new content.
+
+        Args:
+            id: Post ID
+            find: Exact text to replace; must occur once unless replace_all
+            replace: Replacement text
+            replace_all: Replace every occurrence of find
+            section: Heading text of the section whose body to replace, e.g. Installation
+            content: New Markdown body for the section (the heading itself is kept)
+            base_dir: Directory that relative image paths in the Markdown are relative to
+        """
+        if (find is None) == (section is None):
+            return "Error: provide either find/replace or section/content"
+        if (find is not None and replace is None) or (section is not None and content is None):
+            return "Error: provide replace with find, or content with section"
+
+        version = client.versions.get("posts", id)
+        entry = client.sources.get("posts", id, version["updated_at"] if version else None)
+        if entry is None or entry["markdown"] is None:
+            return (
+                f"Error: no Markdown source known for post {id}. "
+                "Send the full markdown_content with ghost_update_post first."
+            )
+        try:
+            if find is not None:
+                markdown_content = replace_text(entry["markdown"], find, replace, replace_all)
+            else:
+                markdown_content = replace_section(entry["markdown"], section, content)
+            post = await write_update(client, "posts", id, {}, markdown_content, base_dir, overwrite=False)
+        except ValueError as e:
+            return f"Error: {e}"
+        except GhostAPIError as e:
+            if e.status_code != 409:
+                raise
+            return f"Error: post {id} was changed elsewhere. Send the full markdown_content with ghost_update_post."
+        if post is None:
+            return f"Post {id} is unchanged."
+
+        return f"Post patched!\nID: {post['id']}\nTitle: {post['title']}\nStatus: {post['status']}"
+
     @mcp.tool()
     async def ghost_delete_post(id: str) -> str:
         """Delete a post by ID.
@@ -230,19 +463,10 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         Args:
             id: Post ID
         """
-        current = await client.get(f"posts/{id}/")
-        current_post = current["posts"][0]
-
-        if current_post["status"] == "published":
+        post = await _set_post_status(client, id, "published")
+        if post is None:
             return f"Post {id} is already published."
 
-        post_data = {
-            "status": "published",
-            "updated_at": current_post["updated_at"],
-        }
-        result = await client.put(f"posts/{id}/", data={"posts": [post_data]})
-        post = result["posts"][0]
-
         return f"Post published!\nID: {post['id']}\nURL: {post.get('url', 'n/a')}"
 
     @mcp.tool()
@@ -252,17 +476,73 @@ def register_post_tools(mcp: FastMCP, client: GhostClient, readonly: bool = Fals
         Args:
             id: Post ID
         """
-        current = await client.get(f"posts/{id}/")
-        current_post = current["posts"][0]
-
-        if current_post["status"] == "draft":
+        post = await _set_post_status(client, id, "draft")
+        if post is None:
             return f"Post {id} is already a draft."
 
-        post_data = {
-            "status": "draft",
-            "updated_at": current_post["updated_at"],
-        }
-        result = await client.put(f"posts/{id}/", data={"posts": [post_data]})
-        post = result["posts"][0]
-
         return f"Post unpublished.\nID: {post['id']}\nStatus: draft"
+
+    @mcp.tool()
+    async def ghost_set_posts_status(
+        status: str,
+        post_ids: list[str] | None = None,
+        filter: str | None = None,
+        published_at: str | None = None,
+        concurrency: int = 4,
+    ) -> str:
+        """Publish, unpublish or schedule many posts in one call.
+
+        Args:
+            status: Target status: published, draft or scheduled
+            post_ids: IDs of the posts to change
+            filter: Ghost NQL filter selecting posts instead of (or within) post_ids, e.g. tag:series-1
+            published_at: ISO 8601 date, e.g. 2025-06-01T09:00:00Z. Required for scheduled; backdates when publishing
+            concurrency: Posts updated in parallel (max 16)
+        """
+        if status not in TRANSITION_STATUSES:
+            return f"Error: invalid status '{status}'. Must be one of: {', '.join(sorted(TRANSITION_STATUSES))}"
+        if status == "scheduled" and not published_at:
+            return "Error: published_at is required to schedule posts"
+        if status == "draft" and published_at:
+            return "Error: published_at can't be set when reverting to draft"
+        if published_at:
+            try:
+                when = datetime.fromisoformat(published_at)
+            except ValueError:
+                return f"Error: invalid published_at '{published_at}'"
+            if status == "scheduled" and when.tzinfo is not None and when <= datetime.now(when.tzinfo):
+                return "Error: published_at must be in the future to schedule posts"
+        try:
+            nql = selection_filter(post_ids, filter)
+        except ValueError as e:
+            return f"Error: {e}"
+
+        # One paginated listing supplies every post's version; only the PUTs fan out.
+        posts = [p async for p in client.iterate("posts", filter=nql, fields="id,title,status,published_at,updated_at")]
+        changes = {"status": status}
+        if published_at:
+            changes["published_at"] = published_at
+
+        def unchanged(post: dict) -> bool:
+            if post["status"] != status:
+                return False
+            return not published_at or post.get("published_at") == published_at
+
+        pending = [p for p in posts if not unchanged(p)]
+
+        async def transition(post: dict) -> dict:
+            return await client.put_versioned("posts", post["id"], changes, updated_at=post["updated_at"])
+
+        results = await run_bounded(pending, transition, concurrency)
+
+        updated = sum(1 for r in results if not isinstance(r, BaseException))
+        lines = [f"Set {status} on posts: {updated}/{len(pending)} ({len(posts) - len(pending)} already {status})"]
+        for post, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                lines.append(f"- Error: {post.get('title', 'n/a')} ({post['id']}) — {result}")
+            else:
+                lines.append(f"- {post.get('title', 'n/a')} ({post['id']}): {post['status']} → {status}")
+        missing = [id for id in post_ids or [] if id not in {p["id"] for p in posts}]
+        if missing:
+            lines.append(f"Not found{' or not matching the filter' if filter else ''}: {', '.join(missing)}")
+        return "\n".join(lines)
@@ -0,0 +1,47 @@
+"""MCP tools for full-text search over Ghost content."""
+
+from mcp.server.fastmcp import FastMCP
+
+from ghost_mcp.client import GhostClient
+
+VALID_KINDS = {"all", "posts", "pages"}
+
+
+def register_search_tools(mcp: FastMCP, client: GhostClient, readonly: bool = False):
+    """Register tools for searching content.
+
+    Uses the client's content mirror when one is configured, otherwise keeps a
+    private in-memory index that is built on the first search.
+    """
+
+    @mcp.tool()
+    async def ghost_search_content(query: str, kind: str = "all", limit: int = 10) -> str:
+        """Full-text search over post and page titles, excerpts, text and tags.
+
+        Args:
+            query: Words to search for (all must match, the last one as a prefix)
+            kind: What to search (all, posts, pages)
+            limit: Maximum number of results (max 50)
+        """
+        if kind not in VALID_KINDS:
+            return f"Error: invalid kind '{kind}'. Must be one of: {', '.join(sorted(VALID_KINDS))}"
+
+        index = client.mirror or client.search_index
+        if index is None:
+            from ghost_mcp.mirror import ContentMirror
+
+            index = client.search_index = ContentMirror(client)
+        results = await index.search(
+            query,
+            resource=None if kind == "all" else kind,
+            limit=max(1, min(limit, 50)),
+        )
+
+        lines = [f"Found results: {len(results)}"]
+        for r in results:
+            lines.append(f"\n- [{r['resource'][:-1]}/{r['status']}] {r['title']}")
+            lines.append(f"  ID: {r['id']} | Slug: {r['slug']}")
+            if r["snippet"]:
+                lines.append(f"  {r['snippet']}")
+
+        return "\n".join(lines)
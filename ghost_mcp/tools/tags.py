@@ -3,26 +3,64 @@
 from mcp.server.fastmcp import FastMCP
 
 from ghost_mcp.client import GhostClient
+from ghost_mcp.tools.common import MAX_BULK_CONCURRENCY, run_bounded, selection_filter
+
+TAG_SPEC_FIELDS = {"name", "slug", "description"}
+
+
+def _tag_line(t: dict) -> str:
+    count = t.get("count", {}).get("posts", 0)
+    return f"- {t['name']} (slug: {t['slug']}, posts: {count}, id: {t['id']})"
+
+
+def _tag_spec(spec: dict) -> dict:
+    """Validate one ghost_bulk_create_tags item."""
+    unknown = set(spec) - TAG_SPEC_FIELDS
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(sorted(unknown))}")
+    if not spec.get("name"):
+        raise ValueError("missing fields: name")
+    return {key: value for key, value in spec.items() if value}
+
+
+def _retagged(tags: list[dict], remove: set[str], add: list[dict]) -> list[dict]:
+    """``tags`` without the ids in ``remove``, then every tag in ``add`` not already present."""
+    kept = [t for t in tags if t["id"] not in remove]
+    present = {t["id"] for t in kept}
+    return kept + [t for t in add if t.get("id") not in present]
 
 
 def register_tag_tools(mcp: FastMCP, client: GhostClient, readonly: bool = False):
     """Register tools for working with tags."""
 
     @mcp.tool()
-    async def ghost_list_tags(limit: int = 50) -> str:
-        """List all tags.
+    async def ghost_list_tags(limit: int = 50, page: int = 1, fetch_all: bool = False) -> str:
+        """List tags.
 
         Args:
-            limit: Maximum number of tags to return
+            limit: Tags per page (max 50)
+            page: Page number
+            fetch_all: Walk every page and list all tags (ignores limit and page)
         """
-        params = {"limit": min(limit, 50), "include": "count.posts"}
-        result = await client.get("tags/", params=params)
+        params = {"limit": min(limit, 50), "page": page, "include": "count.posts"}
+
+        if fetch_all and client.mirror is None:
+            tags = [t async for t in client.iterate("tags", params={"include": "count.posts"})]
+            return "\n".join([f"Found tags: {len(tags)}"] + [_tag_line(t) for t in tags])
+
+        if client.mirror is not None:
+            result = await client.mirror.list_items(
+                "tags",
+                limit=None if fetch_all else params["limit"],
+                page=1 if fetch_all else page,
+            )
+        else:
+            result = await client.get("tags/", params=params)
         tags = result.get("tags", [])
+        meta = result.get("meta", {}).get("pagination", {})
 
-        lines = [f"Found tags: {len(tags)}"]
-        for t in tags:
-            count = t.get("count", {}).get("posts", 0)
-            lines.append(f"- {t['name']} (slug: {t['slug']}, posts: {count}, id: {t['id']})")
+        lines = [f"Found tags: {meta.get('total', len(tags))} (page {meta.get('page', 1)}/{meta.get('pages', 1)})"]
+        lines.extend(_tag_line(t) for t in tags)
 
         return "\n".join(lines)
 
@@ -53,6 +91,184 @@ def register_tag_tools(mcp: FastMCP, client: GhostClient, readonly: bool = False
 
         return f"Tag created!\nID: {tag['id']}\nName: {tag['name']}\nSlug: {tag['slug']}"
 
+    @mcp.tool()
+    async def ghost_bulk_create_tags(tags: list[dict], concurrency: int = 4) -> str:
+        """Create many tags in one call, skipping ones that already exist.
+
+        Args:
+            tags: Tag specs, each with name (required), slug and description
+            concurrency: Tags submitted in parallel (max 16)
+        """
+        if not tags:
+            return "Error: provide at least one tag"
+
+        index = await client.refresh_tags()
+        outcomes: list = []
+        new: dict[str, dict] = {}
+        for spec in tags:
+            try:
+                data = _tag_spec(spec)
+            except ValueError as e:
+                outcomes.append(e)
+                continue
+            existing = index.get(data.get("slug") or data["name"]) or index.get(data["name"])
+            key = data["name"].lower()
+            if existing is not None:
+                outcomes.append(("exists", existing))
+            elif key in new:
+                outcomes.append(("duplicate", key))
+            else:
+                new[key] = data
+                outcomes.append(("new", key))
+
+        results = await client.post_many(
+            "tags/",
+            [{"tags": [data]} for data in new.values()],
+            concurrency=max(1, min(concurrency, MAX_BULK_CONCURRENCY)),
+        )
+        created = dict(zip(new, results))
+
+        count = sum(1 for r in results if not isinstance(r, BaseException))
+        lines = [f"Created tags: {count}/{len(tags)}"]
+        for i, (spec, outcome) in enumerate(zip(tags, outcomes), 1):
+            name = spec.get("name", "n/a")
+            if isinstance(outcome, BaseException):
+                lines.append(f"{i}. Error: {name} — {outcome}")
+                continue
+            kind, value = outcome
+            if kind == "exists":
+                lines.append(f"{i}. {name} — already exists, ID: {value['id']} | Slug: {value['slug']}")
+            elif kind == "duplicate":
+                lines.append(f"{i}. {name} — duplicate of an earlier item")
+            elif isinstance(created[value], BaseException):
+                lines.append(f"{i}. Error: {name} — {created[value]}")
+            else:
+                tag = created[value]["tags"][0]
+                lines.append(f"{i}. {name} — ID: {tag['id']} | Slug: {tag['slug']}")
+
+        return "\n".join(lines)
+
+    @mcp.tool()
+    async def ghost_merge_tags(
+        sources: list[str],
+        target: str,
+        delete_sources: bool = True,
+        concurrency: int = 4,
+    ) -> str:
+        """Move every post and page from the source tags to the target tag.
+
+        Args:
+            sources: Names, slugs or IDs of the tags to merge away
+            target: Name, slug or ID of the tag to keep
+            delete_sources: Delete the source tags once every post and page has moved
+            concurrency: Posts and pages updated in parallel (max 16)
+        """
+        index = await client.refresh_tags()
+        unknown = [name for name in [*sources, target] if index.get(name) is None]
+        if unknown:
+            return f"Error: unknown tags: {', '.join(unknown)}"
+        keep = index.get(target)
+        merged = {index.get(name)["id"]: index.get(name) for name in sources}
+        merged.pop(keep["id"], None)
+        if not merged:
+            return "Error: provide at least one source tag other than the target"
+
+        nql = f"tag:[{','.join(t['slug'] for t in merged.values())}]"
+        items = []
+        for resource in ("posts", "pages"):
+            async for item in client.iterate(
+                resource, filter=nql, fields="id,title,updated_at", params={"include": "tags"},
+            ):
+                items.append((resource, item))
+
+        async def move(entry: tuple[str, dict]) -> dict:
+            resource, item = entry
+            tags = []
+            for t in item.get("tags", []):
+                tag = keep if t["id"] in merged else t
+                if tag["id"] not in {x["id"] for x in tags}:
+                    tags.append(tag)
+            return await client.put_versioned(
+                resource,
+                item["id"],
+                {"tags": [{"id": t["id"]} for t in tags]},
+                updated_at=item["updated_at"],
+            )
+
+        results = await run_bounded(items, move, concurrency)
+        failed = [(entry, r) for entry, r in zip(items, results) if isinstance(r, BaseException)]
+
+        lines = [
+            f"Merged {', '.join(t['name'] for t in merged.values())} into {keep['name']}: "
+            f"updated {len(items) - len(failed)}/{len(items)} posts and pages"
+        ]
+        for (resource, item), error in failed:
+            lines.append(f"- Error: {resource[:-1]} {item['id']} ({item.get('title', 'n/a')}) — {error}")
+
+        if delete_sources and not failed:
+            deleted = await run_bounded(merged, lambda id: client.delete(f"tags/{id}/"), concurrency)
+            for id, result in zip(merged, deleted):
+                name = merged[id]["name"]
+                if isinstance(result, BaseException):
+                    lines.append(f"- Error deleting {name}: {result}")
+                else:
+                    lines.append(f"- Deleted {name}")
+        elif delete_sources:
+            lines.append("Source tags kept because some updates failed.")
+
+        return "\n".join(lines)
+
+    @mcp.tool()
+    async def ghost_retag_posts(
+        post_ids: list[str] | None = None,
+        filter: str | None = None,
+        add: list[str] | None = None,
+        remove: list[str] | None = None,
+        concurrency: int = 4,
+    ) -> str:
+        """Add and/or remove tags on many posts at once.
+
+        Args:
+            post_ids: IDs of the posts to retag
+            filter: Ghost NQL filter selecting posts instead of (or within) post_ids, e.g. tag:news+status:draft
+            add: Tag names, slugs or IDs to add; unknown names create new tags
+            remove: Tag names, slugs or IDs to remove
+            concurrency: Posts updated in parallel (max 16)
+        """
+        try:
+            nql = selection_filter(post_ids, filter)
+        except ValueError as e:
+            return f"Error: {e}"
+        if not add and not remove:
+            return "Error: provide tags to add or remove"
+
+        index = await client.refresh_tags()
+        removed = {index.get(name)["id"] for name in remove or [] if index.get(name)}
+        added = client.tags.references(add or [])
+
+        listing = client.iterate("posts", filter=nql, fields="id,title,updated_at", params={"include": "tags"})
+        posts = [p async for p in listing]
+
+        changes = []
+        for post in posts:
+            current = [{"id": t["id"]} for t in post.get("tags", [])]
+            tags = _retagged(current, removed, added)
+            if tags != current:
+                changes.append((post, tags))
+
+        async def retag(change: tuple[dict, list[dict]]) -> dict:
+            post, tags = change
+            return await client.put_versioned("posts", post["id"], {"tags": tags}, updated_at=post["updated_at"])
+
+        results = await run_bounded(changes, retag, concurrency)
+
+        updated = sum(1 for r in results if not isinstance(r, BaseException))
+        lines = [f"Retagged posts: {updated}/{len(changes)} ({len(posts) - len(changes)} already matched)"]
+        for (post, _), result in zip(changes, results):
+            if isinstance(result, BaseException):
+                lines.append(f"- Error: {post.get('title', 'n/a')} ({post['id']}) — {result}")
+        return "\n".join(lines)
+
     @mcp.tool()
     async def ghost_delete_tag(id: str) -> str:
         """Delete a tag by ID.
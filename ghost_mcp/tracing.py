@@ -0,0 +1,260 @@
+"""Lightweight tracing: nested spans for tool calls, conversions, cache lookups and HTTP attempts.
+
+Spans follow the OpenTelemetry model (W3C trace/span ids, parent links,
+attributes, events) without depending on it. Nothing is recorded until
+``set_tracer`` installs a Tracer; until then ``span()`` returns a shared
+no-op span.
+"""
+
+import functools
+import json
+import random
+import re
+import sys
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import TextIO
+
+TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+class Span:
+    """A timed operation; use as a context manager to make it the current span."""
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        trace_id: str,
+        parent_id: str | None,
+        root: bool,
+        attributes: dict,
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.root = root  # the first span of this trace in this process
+        self.attributes = attributes
+        self.events: list[tuple[int, str]] = []
+        self.status = "ok"
+        self.start = 0
+        self.end = 0
+        self._token = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) / 1e6
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def event(self, name: str) -> None:
+        self.events.append((time.time_ns(), name))
+
+    def fail(self, error: str) -> None:
+        self.status = "error"
+        self.attributes["error"] = error
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def __enter__(self) -> "Span":
+        self.start = time.time_ns()
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end = time.time_ns()
+        _current.reset(self._token)
+        if exc is not None and self.status == "ok":
+            self.fail(f"{exc_type.__name__}: {exc}")
+        self.tracer.export(self)
+
+
+class _NoopSpan:
+    """Stands in for a Span while tracing is off."""
+
+    root = False
+    traceparent = None
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def event(self, name: str) -> None:
+        pass
+
+    def fail(self, error: str) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+_current: ContextVar[Span | None] = ContextVar("ghost_mcp_span", default=None)
+_tracer: "Tracer | None" = None
+
+
+class ConsoleExporter:
+    """Prints each finished trace to ``stream`` (stderr) as an indented tree of spans."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream or sys.stderr
+        self._pending: dict[str, list[Span]] = {}
+
+    def export(self, span: Span) -> None:
+        spans = self._pending.setdefault(span.trace_id, [])
+        spans.append(span)
+        if not span.root:
+            return
+        del self._pending[span.trace_id]
+        children: dict[str | None, list[Span]] = {}
+        for s in spans:
+            children.setdefault(s.parent_id, []).append(s)
+
+        lines = [f"trace {span.trace_id}"]
+
+        def walk(s: Span, depth: int) -> None:
+            attributes = " ".join(f"{k}={v}" for k, v in s.attributes.items())
+            status = " ERROR" if s.status == "error" else ""
+            lines.append(f"{'  ' * depth}{s.name} {s.duration_ms:.1f}ms{status} {attributes}".rstrip())
+            if s.events:
+                events = ", ".join(f"{name} +{(at - s.start) / 1e6:.1f}ms" for at, name in s.events)
+                lines.append(f"{'  ' * depth}  events: {events}")
+            for child in sorted(children.get(s.span_id, ()), key=lambda c: c.start):
+                walk(child, depth + 1)
+
+        walk(span, 1)
+        print("\n".join(lines), file=self.stream, flush=True)
+
+    def close(self) -> None:
+        self._pending.clear()
+
+
+class JsonLinesExporter:
+    """Appends one JSON object per finished span to a file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", buffering=1, encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        record = {
+            "trace_id": span.trace_id,
+            "span_id": span.span_id,
+            "parent_span_id": span.parent_id,
+            "name": span.name,
+            "start_time_unix_nano": span.start,
+            "end_time_unix_nano": span.end,
+            "duration_ms": round(span.duration_ms, 3),
+            "status": span.status,
+            "attributes": span.attributes,
+            "events": [{"name": name, "time_unix_nano": at} for at, name in span.events],
+        }
+        self._file.write(json.dumps(record, default=str) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to every exporter."""
+
+    def __init__(self, exporters: list):
+        self.exporters = exporters
+
+    def start(self, name: str, parent: str | None = None, **attributes) -> Span:
+        """A new span under the current one, or under the W3C ``parent`` traceparent if there is none."""
+        current = _current.get()
+        if current is not None:
+            return Span(self, name, current.trace_id, current.span_id, False, attributes)
+        match = TRACEPARENT_RE.match(parent or "")
+        if match:
+            return Span(self, name, match.group(1), match.group(2), True, attributes)
+        return Span(self, name, f"{random.getrandbits(128):032x}", None, True, attributes)
+
+    def export(self, span: Span) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception:
+                pass  # tracing must never break a tool call
+
+    def close(self) -> None:
+        for exporter in self.exporters:
+            exporter.close()
+
+
+def build_tracer(target: str) -> Tracer:
+    """Tracer for a ``--trace`` value: ``stderr`` for the console, else a JSON lines file path."""
+    if target == "stderr":
+        return Tracer([ConsoleExporter()])
+    return Tracer([JsonLinesExporter(target)])
+
+
+def set_tracer(tracer: Tracer | None) -> None:
+    global _tracer
+    _tracer = tracer
+
+
+def span(name: str, **attributes) -> Span | _NoopSpan:
+    """A child of the current span, or a no-op span when tracing is off."""
+    if _tracer is None:
+        return NOOP_SPAN
+    return _tracer.start(name, **attributes)
+
+
+def current() -> Span | _NoopSpan:
+    """The current span, to annotate; a no-op span if there is none."""
+    return _current.get() or NOOP_SPAN
+
+
+def httpx_hook(span: Span) -> Callable:
+    """httpx ``trace`` extension recording connection and HTTP phases as span events.
+
+    The gap before the first event is time spent waiting for a pooled connection.
+    """
+
+    async def hook(event_name: str, info: dict) -> None:
+        if event_name.endswith(".started"):
+            span.event(event_name.removesuffix(".started"))
+
+    return hook
+
+
+def _request_traceparent() -> str | None:
+    """``traceparent`` from the ``_meta`` of the MCP request being handled, if any."""
+    from mcp.server.lowlevel.server import request_ctx
+
+    try:
+        meta = request_ctx.get().meta
+    except LookupError:
+        return None
+    if meta is None:
+        return None
+    value = (meta.model_extra or {}).get("traceparent")
+    return value if isinstance(value, str) else None
+
+
+def instrument(fn: Callable) -> Callable:
+    """Wrap an async tool function in a root span, continuing the caller's trace if it sent one."""
+    tool = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        if _tracer is None:
+            return await fn(*args, **kwargs)
+        with _tracer.start(tool, parent=_request_traceparent(), **{"mcp.tool": tool}) as s:
+            result = await fn(*args, **kwargs)
+            if isinstance(result, str) and result.startswith("Error"):
+                s.fail(result.splitlines()[0])
+            return result
+
+    return wrapper
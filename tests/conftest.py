@@ -7,6 +7,7 @@ from ghost_mcp.tools.posts import register_post_tools
 from ghost_mcp.tools.pages import register_page_tools
 from ghost_mcp.tools.tags import register_tag_tools
 from ghost_mcp.tools.images import register_image_tools
+from ghost_mcp.tools.search import register_search_tools
 
 TEST_URL = "http://test.ghost.io"
 TEST_KEY = "testid1234567890:aabbccddee112233445566778899aabb"
@@ -29,6 +30,7 @@ def tools(client):
     register_page_tools(mcp, client)
     register_tag_tools(mcp, client)
     register_image_tools(mcp, client)
+    register_search_tools(mcp, client)
 
     tool_fns = {}
     for name, tool in mcp._tool_manager._tools.items():
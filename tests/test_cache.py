@@ -0,0 +1,266 @@
+"""Tests for the GET response cache."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from ghost_mcp.cache import ResponseCache, SourceMap, TagIndex, VersionMap, cache_key
+from ghost_mcp.client import GhostAPIError, GhostClient
+from tests.conftest import BASE_API, TEST_KEY, TEST_URL
+
+
+@pytest.fixture
+def cached_client():
+    return GhostClient(TEST_URL, TEST_KEY, cache=ResponseCache(max_entries=2))
+
+
+def test_cache_key_normalizes_params():
+    a = cache_key("posts/", {"include": "tags,authors", "limit": 15})
+    b = cache_key("/posts", {"limit": "15", "include": "authors, tags"})
+    assert a == b
+
+
+@respx.mock
+async def test_repeated_get_hits_cache(cached_client):
+    route = respx.get(f"{BASE_API}/tags/").respond(json={"tags": []})
+    await cached_client.get("tags/", params={"limit": 50})
+    await cached_client.get("tags/", params={"limit": 50})
+    assert route.call_count == 1
+    assert cached_client.cache.hits == 1
+    assert cached_client.cache.misses == 1
+
+
+@respx.mock
+async def test_uncached_get_bypasses_cache(cached_client):
+    route = respx.get(f"{BASE_API}/tags/").respond(json={"tags": []})
+    await cached_client.get("tags/")
+    await cached_client.get("tags/", cached=False)
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_ttl_expiry(monkeypatch):
+    import ghost_mcp.cache as cache_module
+
+    now = 1000.0
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now)
+    c = GhostClient(TEST_URL, TEST_KEY, cache=ResponseCache(ttls={"site": 10.0}))
+    route = respx.get(f"{BASE_API}/site/").respond(json={"site": {}})
+
+    await c.get("site/")
+    now += 9
+    await c.get("site/")
+    now += 2
+    await c.get("site/")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_lru_eviction(cached_client):
+    for name in ("a", "b", "c"):
+        respx.get(f"{BASE_API}/posts/{name}/").respond(json={"posts": [{"id": name}]})
+
+    await cached_client.get("posts/a/")
+    await cached_client.get("posts/b/")
+    await cached_client.get("posts/a/")
+    await cached_client.get("posts/c/")
+    assert cached_client.cache.evictions == 1
+
+    await cached_client.get("posts/a/")
+    assert cached_client.cache.hits == 2
+
+
+@respx.mock
+async def test_concurrent_gets_coalesced(cached_client):
+    async def slow(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"posts": []})
+
+    route = respx.get(f"{BASE_API}/posts/").mock(side_effect=slow)
+    results = await asyncio.gather(*(cached_client.get("posts/") for _ in range(5)))
+    assert route.call_count == 1
+    assert all(r == {"posts": []} for r in results)
+    assert cached_client.cache.coalesced == 4
+
+
+async def test_cancelled_leader_does_not_cancel_followers():
+    cache = ResponseCache()
+    started = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.01)
+        return {"posts": []}
+
+    leader = asyncio.create_task(cache.get_or_fetch("posts/", None, fetch))
+    await started.wait()
+    follower = asyncio.create_task(cache.get_or_fetch("posts/", None, fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == {"posts": []}
+    assert leader.cancelled() and len(calls) == 2
+
+
+async def test_cancelled_follower_leaves_leader_running():
+    cache = ResponseCache()
+    started = asyncio.Event()
+
+    async def fetch():
+        started.set()
+        await asyncio.sleep(0.01)
+        return {"posts": []}
+
+    leader = asyncio.create_task(cache.get_or_fetch("posts/", None, fetch))
+    await started.wait()
+    follower = asyncio.create_task(cache.get_or_fetch("posts/", None, fetch))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert await leader == {"posts": []}
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+
+@respx.mock
+async def test_errors_not_cached(cached_client):
+    route = respx.get(f"{BASE_API}/posts/x/").mock(side_effect=[
+        httpx.Response(404, json={"errors": [{"message": "not found"}]}),
+        httpx.Response(200, json={"posts": [{"id": "x"}]}),
+    ])
+    with pytest.raises(GhostAPIError):
+        await cached_client.get("posts/x/")
+    await cached_client.get("posts/x/")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_write_invalidates_family(cached_client):
+    route = respx.get(f"{BASE_API}/tags/").respond(json={"tags": []})
+    respx.put(f"{BASE_API}/posts/p1/").respond(json={"posts": [{"id": "p1"}]})
+
+    await cached_client.get("tags/")
+    await cached_client.put("posts/p1/", data={"posts": [{"updated_at": "2024"}]})
+    await cached_client.get("tags/")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_write_keeps_unrelated_family(cached_client):
+    route = respx.get(f"{BASE_API}/site/").respond(json={"site": {}})
+    respx.delete(f"{BASE_API}/posts/p1/").respond(status_code=204)
+
+    await cached_client.get("site/")
+    await cached_client.delete("posts/p1/")
+    await cached_client.get("site/")
+    assert route.call_count == 1
+
+
+def test_version_map_keeps_newest():
+    versions = VersionMap()
+    versions.record({"posts": [{"id": "p1", "updated_at": "2024-01-02", "status": "draft"}]})
+    versions.record({"posts": [{"id": "p1", "updated_at": "2024-01-01", "status": "published"}]})
+    assert versions.get("posts", "p1") == {"updated_at": "2024-01-02", "status": "draft"}
+
+    versions.record({"posts": [{"id": "p1", "updated_at": "2024-01-03"}]})
+    assert versions.get("posts", "p1") == {"updated_at": "2024-01-03", "status": "draft"}
+
+
+def test_version_map_bounded():
+    versions = VersionMap(max_entries=2)
+    versions.record({"tags": [{"id": str(i), "updated_at": "2024"} for i in range(3)]})
+    assert len(versions) == 2
+    assert versions.get("tags", "0") is None
+
+
+@respx.mock
+async def test_delete_forgets_version(client):
+    respx.delete(f"{BASE_API}/posts/p1/").respond(status_code=204)
+    client.versions.record({"posts": [{"id": "p1", "updated_at": "2024"}]})
+    await client.delete("posts/p1/")
+    assert client.versions.get("posts", "p1") is None
+
+
+def test_tag_index_learns_from_responses():
+    tags = TagIndex()
+    tags.record({"posts": [{"id": "p1", "tags": [{"id": "t1", "name": "Tech", "slug": "tech"}]}]})
+    tags.record({"tags": [{"id": "t2", "name": "AI News", "slug": "ai-news", "updated_at": "2024-01-01"}]})
+
+    assert tags.get("tech")["id"] == "t1"
+    assert tags.get("ai news")["id"] == "t2"
+    assert tags.get("t2")["name"] == "AI News"
+    assert tags.references(["Tech", "ai-news", "New"]) == [{"id": "t1"}, {"id": "t2"}, {"name": "New"}]
+
+
+def test_tag_index_rename_and_forget():
+    tags = TagIndex()
+    tags.add({"id": "t1", "name": "Old", "slug": "old", "updated_at": "2024-01-01"})
+    tags.add({"id": "t1", "name": "New", "slug": "new", "updated_at": "2024-01-02"})
+    tags.add({"id": "t1", "name": "Stale", "slug": "stale", "updated_at": "2023-12-31"})
+    assert tags.get("old") is None and tags.get("stale") is None
+    assert tags.get("new")["updated_at"] == "2024-01-02"
+
+    tags.forget("t1")
+    assert tags.get("new") is None and len(tags) == 0
+
+
+@respx.mock
+async def test_refresh_tags_full_then_incremental(client):
+    route = respx.get(f"{BASE_API}/tags/").mock(side_effect=[
+        httpx.Response(200, json={"tags": [
+            {"id": "t1", "name": "A", "slug": "a", "updated_at": "2024-01-01"},
+            {"id": "t2", "name": "B", "slug": "b", "updated_at": "2024-01-02"},
+        ], "meta": {"pagination": {"next": None}}}),
+        httpx.Response(200, json={"tags": [
+            {"id": "t2", "name": "B2", "slug": "b", "updated_at": "2024-01-03"},
+        ], "meta": {"pagination": {"next": None}}}),
+        httpx.Response(200, json={"tags": [
+            {"id": "t2", "name": "B2", "slug": "b", "updated_at": "2024-01-03"},
+        ], "meta": {"pagination": {"next": None}}}),
+    ])
+    client.tags.add({"id": "gone", "name": "Gone", "slug": "gone"})
+
+    await client.refresh_tags()
+    assert client.tags.get("gone") is None
+    assert "filter" not in route.calls[0].request.url.params
+
+    await client.refresh_tags()
+    assert route.calls[1].request.url.params["filter"] == "updated_at:>='2024-01-02'"
+    assert client.tags.get("b")["name"] == "B2"
+    assert client.tags.watermark == "2024-01-03"
+
+    await client.refresh_tags(full=True)
+    assert client.tags.get("a") is None
+
+
+def test_source_map_drops_entries_for_other_versions():
+    sources = SourceMap(max_entries=1)
+    sources.record("posts", "p1", "2024-01-01", {"title": "T"}, "# Body")
+    entry = sources.get("posts", "p1", "2024-01-01")
+    assert entry["fields"] == {"title": "T"} and entry["markdown"] == "# Body"
+    assert sources.get("posts", "p1", "2024-01-02") is None
+    assert sources.get("posts", "p1", "2024-01-01") is None
+
+    sources.record("posts", "p1", "2024-01-01", {})
+    sources.record("posts", "p2", "2024-01-01", {})
+    assert len(sources) == 1 and sources.get("posts", "p1", "2024-01-01") is None
+
+
+def test_source_map_follows_own_writes_and_bounds_bytes():
+    sources = SourceMap(max_bytes=10)
+    sources.record("posts", "p1", "v1", {"title": "T"}, "# Body")
+    sources.advance("posts", "p1", "v1", "v2", {"status": "published"})
+    entry = sources.get("posts", "p1", "v2")
+    assert entry["fields"] == {"title": "T", "status": "published"} and entry["markdown"] == "# Body"
+    sources.advance("posts", "p1", "v2", "v3", {"html": "<p>x</p>"})
+    assert len(sources) == 0 and sources.size == 0
+
+    sources.record("posts", "p1", "v1", {}, "123456")
+    sources.record("posts", "p2", "v1", {}, "123456")
+    assert sources.get("posts", "p1", "v1") is None and sources.size == 6
+    sources.record("posts", "p3", "v1", {"title": "T"}, "x" * 11)
+    assert sources.get("posts", "p3", "v1")["markdown"] is None and sources.size == 6
@@ -4,7 +4,7 @@ import httpx
 import pytest
 import respx
 
-from ghost_mcp.client import GhostClient, GhostAPIError
+from ghost_mcp.client import GhostClient, GhostAPIError, TransportConfig
 from tests.conftest import TEST_URL, TEST_KEY, BASE_API
 
 
@@ -44,6 +44,28 @@ def test_headers(client):
     assert headers["Content-Type"] == "application/json"
 
 
+def test_headers_reuse_token(client):
+    first = client._headers()
+    second = client._headers()
+    assert first is second
+    assert "Content-Type" not in client._headers(multipart=True)
+    assert client._headers(multipart=True)["Authorization"] == first["Authorization"]
+
+
+def test_headers_rotate_before_expiry(client, monkeypatch):
+    import ghost_mcp.client as client_module
+
+    now = 1_700_000_000.0
+    monkeypatch.setattr(client_module.time, "time", lambda: now)
+    first = client._headers()["Authorization"]
+
+    now += client_module.TOKEN_TTL - client_module.TOKEN_REFRESH_MARGIN - 1
+    assert client._headers()["Authorization"] == first
+
+    now += 1
+    assert client._headers()["Authorization"] != first
+
+
 @respx.mock
 async def test_get_success(client):
     respx.get(f"{BASE_API}/posts/").respond(
@@ -111,3 +133,150 @@ async def test_post_with_files(client):
         "images/upload/", files={"file": ("img.png", b"data", "image/png")}
     )
     assert result["images"][0]["url"] == "http://test.ghost.io/img.png"
+
+
+def test_transport_config_applied():
+    config = TransportConfig(max_connections=7, read_timeout=5.0, connect_timeout=2.0)
+    c = GhostClient(TEST_URL, TEST_KEY, transport=config)
+    assert c._client.timeout.read == 5.0
+    assert c._client.timeout.connect == 2.0
+    assert c._client._transport._pool._max_connections == 7
+
+
+@respx.mock
+async def test_warmup_opens_connections():
+    route = respx.head(f"{BASE_API}/site/").respond(status_code=200)
+    c = GhostClient(TEST_URL, TEST_KEY, transport=TransportConfig(warm_connections=3))
+    await c.warmup()
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_warmup_ignores_errors():
+    respx.head(f"{BASE_API}/site/").mock(side_effect=httpx.ConnectError("down"))
+    c = GhostClient(TEST_URL, TEST_KEY, transport=TransportConfig(warm_connections=1))
+    await c.warmup()
+
+
+@respx.mock
+async def test_post_many_bounds_concurrency(client):
+    import asyncio
+
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(201, json={"tags": [{"id": "t"}]})
+
+    respx.post(f"{BASE_API}/tags/").mock(side_effect=handler)
+
+    async def deferred(i):
+        return {"tags": [{"name": f"tag-{i}"}]}
+
+    payloads = [{"tags": [{"name": "first"}]}] + [deferred(i) for i in range(9)]
+    results = await client.post_many("tags/", payloads, concurrency=3)
+    assert len(results) == 10
+    assert all(r == {"tags": [{"id": "t"}]} for r in results)
+    assert peak == 3
+
+
+@respx.mock
+async def test_post_many_bounds_payload_preparation(client):
+    import asyncio
+
+    preparing = 0
+    peak = 0
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(201, json={"tags": [{"id": "t"}]})
+
+    respx.post(f"{BASE_API}/tags/").mock(side_effect=handler)
+
+    async def prepare(i):
+        nonlocal preparing, peak
+        preparing += 1
+        peak = max(peak, preparing)
+        await asyncio.sleep(0.005)
+        preparing -= 1
+        return {"tags": [{"name": f"tag-{i}"}]}
+
+    results = await client.post_many("tags/", [prepare(i) for i in range(20)], concurrency=2)
+    assert all(r == {"tags": [{"id": "t"}]} for r in results)
+    assert peak == 2
+
+
+@respx.mock
+async def test_post_many_reports_failures_in_place(client):
+    respx.post(f"{BASE_API}/tags/").mock(side_effect=[
+        httpx.Response(201, json={"tags": [{"id": "1"}]}),
+        httpx.Response(422, json={"errors": [{"message": "Duplicate"}]}),
+    ])
+    results = await client.post_many("tags/", [{"tags": [{}]}, {"tags": [{}]}], concurrency=1)
+    assert results[0] == {"tags": [{"id": "1"}]}
+    assert isinstance(results[1], GhostAPIError)
+
+
+def _paged(resource, pages):
+    """respx side effect serving ``pages`` (lists of ids) by the ``page`` param."""
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json={
+            resource: [{"id": i} for i in pages[page - 1]],
+            "meta": {"pagination": {
+                "page": page,
+                "pages": len(pages),
+                "next": page + 1 if page < len(pages) else None,
+            }},
+        })
+
+    return handler
+
+
+@respx.mock
+async def test_iterate_walks_all_pages(client):
+    route = respx.get(f"{BASE_API}/posts/").mock(side_effect=_paged("posts", [["1", "2"], ["3", "4"], ["5"]]))
+    ids = [p["id"] async for p in client.iterate("posts", filter="status:draft", fields="id", page_size=2)]
+    assert ids == ["1", "2", "3", "4", "5"]
+    assert route.call_count == 3
+    params = route.calls[0].request.url.params
+    assert params["limit"] == "2"
+    assert params["filter"] == "status:draft"
+    assert params["fields"] == "id"
+
+
+@respx.mock
+async def test_iterate_prefetches_next_page(client):
+    import asyncio
+
+    route = respx.get(f"{BASE_API}/tags/").mock(side_effect=_paged("tags", [["1"], ["2"]]))
+    items = client.iterate("tags", page_size=1)
+    assert (await anext(items))["id"] == "1"
+    await asyncio.sleep(0.01)
+    assert route.call_count == 2
+    await items.aclose()
+
+
+@respx.mock
+async def test_iterate_early_exit_cancels_prefetch(client):
+    route = respx.get(f"{BASE_API}/tags/").mock(side_effect=_paged("tags", [["1"], ["2"], ["3"]]))
+    async for tag in client.iterate("tags", page_size=1):
+        break
+    assert route.call_count <= 2
+
+
+@respx.mock
+async def test_iterate_limit_all(client):
+    route = respx.get(f"{BASE_API}/tags/").respond(json={
+        "tags": [{"id": "1"}, {"id": "2"}],
+        "meta": {"pagination": {"page": 1, "pages": 1, "next": None}},
+    })
+    ids = [t["id"] async for t in client.iterate("tags", page_size="all")]
+    assert ids == ["1", "2"]
+    assert route.calls[0].request.url.params["limit"] == "all"
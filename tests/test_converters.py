@@ -1,6 +1,9 @@
 """Tests for Markdown to HTML conversion."""
 
-from ghost_mcp.converters import markdown_to_html
+import pytest
+
+from ghost_mcp import converters
+from ghost_mcp.converters import image_targets, markdown_to_html, markdown_to_html_async, upload_local_images
 
 
 def test_basic_paragraph():
@@ -56,3 +59,127 @@ def test_multiline_content():
     result = markdown_to_html(md)
     assert "<p>First paragraph.</p>" in result
     assert "<p>Second paragraph.</p>" in result
+
+
+def test_repeated_headings_do_not_leak_toc_state():
+    md = "# Title\n\nBody"
+    first = markdown_to_html(md + " one")
+    second = markdown_to_html(md + " two")
+    assert 'id="title"' in first
+    assert 'id="title"' in second
+
+
+def test_cached_result_reused():
+    converters.clear_cache()
+    first = markdown_to_html("cache me")
+    assert markdown_to_html("cache me") is first
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(converters, "CACHE_SIZE", 2)
+    converters.clear_cache()
+    for text in ("a", "b", "c"):
+        markdown_to_html(text)
+    assert len(converters._cache) == 2
+
+
+async def test_async_conversion_matches_sync():
+    md = "## Section\n\n" + "word " * 100
+    assert await markdown_to_html_async(md) == markdown_to_html(md)
+
+
+async def test_large_document_converted_off_loop(monkeypatch):
+    import threading
+
+    converters.clear_cache()
+    threads = []
+    original = converters._convert
+
+    def tracking_convert(md_content, key):
+        threads.append(threading.current_thread())
+        return original(md_content, key)
+
+    monkeypatch.setattr(converters, "_convert", tracking_convert)
+    large = "paragraph text\n\n" * (converters.OFFLOAD_THRESHOLD // 10)
+    html = await markdown_to_html_async(large)
+    assert html.startswith("<p>paragraph text</p>")
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_image_targets_skip_code_blocks():
+    md = (
+        '![a](a.png) ![b](<my pic.png> "title")\n\n'
+        "```\n![c](code.png)\n```\n\n"
+        '<img src="d.jpg" alt="d"> ![a again](a.png)'
+    )
+    assert image_targets(md) == ["a.png", "<my pic.png>", "d.jpg"]
+
+
+async def test_upload_local_images_rewrites_each_file_once(tmp_path):
+    (tmp_path / "a.png").write_bytes(b"a")
+    (tmp_path / "my pic.png").write_bytes(b"b")
+    absolute = tmp_path / "c.jpg"
+    absolute.write_bytes(b"c")
+    uploaded = []
+
+    async def upload(path):
+        uploaded.append(path.name)
+        return f"https://cdn.example/{path.name.replace(' ', '-')}"
+
+    md = (
+        f"![a](a.png) ![b](<my pic.png>) ![c]({absolute}) ![again](./a.png)\n"
+        "![remote](https://example.com/x.png) ![site](/content/images/y.png)\n"
+        "```\n![code](a.png)\n```"
+    )
+    result = await upload_local_images(md, upload, base_dir=str(tmp_path))
+
+    assert sorted(uploaded) == ["a.png", "c.jpg", "my pic.png"]
+    assert "![a](https://cdn.example/a.png)" in result
+    assert "![b](https://cdn.example/my-pic.png)" in result
+    assert "![c](https://cdn.example/c.jpg)" in result
+    assert "![again](https://cdn.example/a.png)" in result
+    assert "![remote](https://example.com/x.png) ![site](/content/images/y.png)" in result
+    assert "```\n![code](a.png)\n```" in result
+
+
+async def test_upload_local_images_leaves_relative_paths_without_base_dir():
+    async def upload(path):
+        raise AssertionError("nothing to upload")
+
+    md = "![a](images/a.png)"
+    assert await upload_local_images(md, upload) == md
+
+
+async def test_upload_local_images_reports_missing_and_failed(tmp_path):
+    (tmp_path / "bad.png").write_bytes(b"x")
+
+    async def upload(path):
+        raise ValueError("file too large")
+
+    with pytest.raises(ValueError, match=r"image not found: missing\.png"):
+        await upload_local_images("![m](missing.png) ![b](bad.png)", upload, base_dir=str(tmp_path))
+    with pytest.raises(ValueError, match=r"image upload failed: .*bad\.png: file too large"):
+        await upload_local_images("![b](bad.png)", upload, base_dir=str(tmp_path))
+
+
+def test_replace_text():
+    assert converters.replace_text("a b a", "b", "c") == "a c a"
+    assert converters.replace_text("a b a", "a", "x", replace_all=True) == "x b x"
+    with pytest.raises(ValueError, match="occurs 2 times"):
+        converters.replace_text("a b a", "a", "x")
+    with pytest.raises(ValueError, match="not found"):
+        converters.replace_text("a b a", "z", "x")
+
+
+def test_replace_section_stops_at_same_level_heading():
+    md = "# Doc\n\n## Setup\n\nold\n\n### Detail\n\nold too\n\n```\n## Setup\n```\n\n## Usage\n\nkeep\n"
+    result = converters.replace_section(md, "setup", "new\n")
+    assert result == "# Doc\n\n## Setup\n\nnew\n\n## Usage\n\nkeep\n"
+    assert converters.replace_section("# A\n\nx", "A", "y") == "# A\n\ny\n"
+
+
+def test_replace_section_missing_or_ambiguous():
+    with pytest.raises(ValueError, match="section not found"):
+        converters.replace_section("# A\n", "B", "x")
+    with pytest.raises(ValueError, match="occurs 2 times"):
+        converters.replace_section("## A\n\n## A\n", "A", "x")
@@ -3,6 +3,7 @@
 import tempfile
 from pathlib import Path
 
+import httpx
 import respx
 
 from tests.conftest import BASE_API
@@ -22,6 +23,22 @@ async def test_upload_image(tools, tmp_path):
     assert "http://test.ghost.io/content/images/photo.png" in result
 
 
+@respx.mock
+async def test_upload_image_streams_multipart_body(tools, tmp_path):
+    image_file = tmp_path / "photo.png"
+    image_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x01" * 100)
+
+    route = respx.post(f"{BASE_API}/images/upload/").respond(json={
+        "images": [{"url": "http://test.ghost.io/content/images/photo.png"}],
+    })
+
+    await tools["ghost_upload_image"](file_path=str(image_file))
+    request = route.calls[0].request
+    assert b'filename="photo.png"\r\nContent-Type: image/png\r\n\r\n' in request.content
+    assert image_file.read_bytes() in request.content
+    assert int(request.headers["Content-Length"]) == len(request.content)
+
+
 async def test_upload_image_file_not_found(tools):
     result = await tools["ghost_upload_image"](file_path="/nonexistent/file.png")
     assert "Error" in result
@@ -67,3 +84,76 @@ async def test_site_info_missing_fields(tools):
 
     result = await tools["ghost_site_info"]()
     assert "n/a" in result
+
+
+@respx.mock
+async def test_upload_images_batch_reports_per_file(tools, tmp_path):
+    good = tmp_path / "a.png"
+    good.write_bytes(b"\x89PNG" + b"\x00" * 10)
+    other = tmp_path / "b.jpg"
+    other.write_bytes(b"\xff\xd8\xff")
+    text = tmp_path / "notes.txt"
+    text.write_text("hi")
+
+    route = respx.post(f"{BASE_API}/images/upload/").respond(json={
+        "images": [{"url": "http://test.ghost.io/content/images/x"}],
+    })
+
+    result = await tools["ghost_upload_images"](
+        file_paths=[str(good), str(text), str(tmp_path / "missing.png"), str(other)],
+    )
+    assert "Uploaded images: 2/4" in result
+    assert f"- {good}: http://test.ghost.io/content/images/x" in result
+    assert f"- {text}: Error: unsupported file type '.txt'" in result
+    assert f"- {tmp_path / 'missing.png'}: Error: file not found" in result
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_upload_images_by_glob(tools, tmp_path):
+    for name in ("one.png", "two.png", "skip.txt"):
+        (tmp_path / name).write_bytes(b"\x00")
+    route = respx.post(f"{BASE_API}/images/upload/").respond(json={
+        "images": [{"url": "http://test.ghost.io/content/images/x"}],
+    })
+
+    result = await tools["ghost_upload_images"](pattern=str(tmp_path / "*"))
+    assert "Uploaded images: 2/2" in result
+    assert result.index("one.png") < result.index("two.png")
+    assert "skip.txt" not in result
+    assert route.call_count == 2
+
+
+async def test_upload_images_rejects_empty_and_oversized_batches(tools, tmp_path, monkeypatch):
+    from ghost_mcp.tools import images
+
+    assert "Error" in await tools["ghost_upload_images"](pattern=str(tmp_path / "*.png"))
+    monkeypatch.setattr(images, "MAX_BATCH_FILES", 1)
+    result = await tools["ghost_upload_images"](file_paths=["/a.png", "/b.png"])
+    assert "too many files" in result
+
+
+@respx.mock
+async def test_upload_images_respects_concurrency(tools, tmp_path):
+    import asyncio
+
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"{i}.png"
+        path.write_bytes(bytes([i]))
+        paths.append(str(path))
+
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(201, json={"images": [{"url": "http://test.ghost.io/content/images/x"}]})
+
+    respx.post(f"{BASE_API}/images/upload/").mock(side_effect=handler)
+    result = await tools["ghost_upload_images"](file_paths=paths, concurrency=2)
+    assert "Uploaded images: 6/6" in result
+    assert peak == 2
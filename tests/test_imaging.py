@@ -0,0 +1,102 @@
+"""Tests for image optimization before upload."""
+
+import os
+
+import pytest
+import respx
+
+from ghost_mcp.imaging import ImageOptimizer, ImageOptions, optimize_image
+from tests.conftest import BASE_API
+
+Image = pytest.importorskip("PIL.Image")
+features = pytest.importorskip("PIL.features")
+
+
+def photo(path, size=(1200, 800), mode="RGB", **save_args):
+    """A noisy gradient, which compresses about like a photo."""
+    image = Image.effect_noise(size, 40).convert(mode)
+    gradient = Image.linear_gradient("L").resize(size).convert(mode)
+    Image.blend(image, gradient, 0.5).save(path, **save_args)
+    return path
+
+
+def test_downscales_and_reencodes(tmp_path):
+    source = photo(tmp_path / "big.png")
+    result = optimize_image(str(source), ImageOptions(format="webp", max_dimension=600))
+    try:
+        assert result.mime_type == "image/webp" and result.extension == ".webp"
+        assert result.size < source.stat().st_size
+        with Image.open(result.path) as out:
+            assert out.format == "WEBP"
+            assert max(out.size) == 600
+    finally:
+        os.unlink(result.path)
+
+
+def test_strips_exif_but_applies_rotation(tmp_path):
+    exif = Image.Exif()
+    exif[0x0112] = 6  # orientation: rotate 90° clockwise
+    exif[0x010F] = "Camera Co"
+    source = photo(tmp_path / "rotated.jpg", size=(400, 200), exif=exif.tobytes(), quality=100)
+    result = optimize_image(str(source), ImageOptions(format="jpeg", max_dimension=None, quality=70))
+    try:
+        with Image.open(result.path) as out:
+            assert out.size == (200, 400)
+            assert not out.getexif()
+    finally:
+        os.unlink(result.path)
+
+
+def test_keeps_alpha_when_jpeg_requested(tmp_path):
+    source = photo(tmp_path / "alpha.png", mode="RGBA")
+    result = optimize_image(str(source), ImageOptions(format="jpeg", max_dimension=300))
+    try:
+        assert result.mime_type == "image/png"
+    finally:
+        os.unlink(result.path)
+
+
+@pytest.mark.skipif(not features.check("avif"), reason="Pillow built without AVIF")
+def test_skips_when_not_smaller(tmp_path):
+    source = tmp_path / "tiny.png"
+    Image.new("RGB", (4, 4), "white").save(source, optimize=True)
+    assert optimize_image(str(source), ImageOptions(format="avif")) is None
+    assert not [p for p in os.listdir(tmp_path) if p != "tiny.png"]
+
+
+def test_skips_animated_images(tmp_path):
+    source = tmp_path / "anim.gif"
+    frames = [Image.new("RGB", (64, 64), color) for color in ("red", "green", "blue")]
+    frames[0].save(source, save_all=True, append_images=frames[1:])
+    assert optimize_image(str(source), ImageOptions()) is None
+
+
+def test_rejects_unknown_format():
+    with pytest.raises(ValueError, match="invalid image format"):
+        ImageOptimizer(ImageOptions(format="bmp"))
+
+
+def test_rejects_format_pillow_cannot_encode(monkeypatch):
+    monkeypatch.setattr(features, "check", lambda feature: feature != "avif")
+    with pytest.raises(ValueError, match="can't encode avif"):
+        ImageOptimizer(ImageOptions(format="avif"))
+    ImageOptimizer(ImageOptions(format="webp")).close()
+
+
+@respx.mock
+async def test_upload_sends_optimized_copy(client, tools, tmp_path):
+    source = photo(tmp_path / "cover.png")
+    client.image_optimizer = ImageOptimizer(ImageOptions(format="webp", max_dimension=500), max_workers=1)
+    route = respx.post(f"{BASE_API}/images/upload/").respond(json={
+        "images": [{"url": "http://test.ghost.io/content/images/cover.webp"}],
+    })
+    try:
+        result = await tools["ghost_upload_image"](file_path=str(source))
+    finally:
+        client.image_optimizer.close()
+
+    assert "cover.webp" in result
+    request = route.calls[0].request
+    assert b'filename="cover.webp"\r\nContent-Type: image/webp' in request.content
+    assert len(request.content) < source.stat().st_size
+    assert sorted(os.listdir(tmp_path)) == ["cover.png"]
@@ -0,0 +1,134 @@
+"""Tests for the content-hash index of uploaded images."""
+
+import asyncio
+import hashlib
+
+import pytest
+import respx
+
+import ghost_mcp.media as media
+from ghost_mcp.media import UploadIndex, file_digest
+from tests.conftest import BASE_API, TEST_URL
+
+IMAGE_URL = f"{TEST_URL}/content/images/2024/01/photo.png"
+
+
+@pytest.fixture
+def index(client):
+    client.image_index = UploadIndex()
+    return client.image_index
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"\x89PNG" + b"\x01" * 100)
+    return path
+
+
+def test_file_digest_is_sha256(image):
+    assert file_digest(image) == hashlib.sha256(image.read_bytes()).hexdigest()
+
+
+@respx.mock
+async def test_repeat_upload_reuses_url(index, tools, image, tmp_path):
+    route = respx.post(f"{BASE_API}/images/upload/").respond(json={"images": [{"url": IMAGE_URL}]})
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(image.read_bytes())
+
+    first = await tools["ghost_upload_image"](file_path=str(image))
+    second = await tools["ghost_upload_image"](file_path=str(copy))
+
+    assert "Image uploaded!" in first
+    assert "already uploaded" in second and IMAGE_URL in second
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_concurrent_uploads_of_same_content_upload_once(index, tools, image):
+    route = respx.post(f"{BASE_API}/images/upload/").respond(json={"images": [{"url": IMAGE_URL}]})
+    results = await asyncio.gather(*(tools["ghost_upload_image"](file_path=str(image)) for _ in range(3)))
+    assert route.call_count == 1
+    assert all(IMAGE_URL in r for r in results)
+    assert index._locks == {}
+
+
+@respx.mock
+async def test_stale_entry_is_verified_and_dropped_when_gone(index, client, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(media.time, "time", lambda: now)
+    index.add("abc", IMAGE_URL)
+    head = respx.head(IMAGE_URL).respond(status_code=404)
+
+    assert await index.resolve(client, "abc") == IMAGE_URL
+    assert head.call_count == 0
+
+    now += index.verify_after + 1
+    assert await index.resolve(client, "abc") is None
+    assert head.call_count == 1
+    assert len(index) == 0
+
+
+@respx.mock
+async def test_stale_entry_kept_when_still_served(index, client, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(media.time, "time", lambda: now)
+    index.add("abc", IMAGE_URL)
+    now += index.verify_after + 1
+    respx.head(IMAGE_URL).respond(status_code=200)
+
+    assert await index.resolve(client, "abc") == IMAGE_URL
+    assert index.get("abc")["checked_at"] == now
+
+
+def test_least_recently_used_entries_are_evicted():
+    index = UploadIndex(max_entries=2)
+    index.add("a", "u1")
+    index.add("b", "u2")
+    index.get("a")
+    index.add("c", "u3")
+    assert index.get("b") is None
+    assert index.get("a") is not None and index.get("c") is not None
+
+
+async def test_index_persists_between_instances(tmp_path):
+    path = tmp_path / "images.json"
+    index = UploadIndex(path)
+    index.add("abc", IMAGE_URL, size=10)
+    await index.flush()
+
+    reloaded = UploadIndex(path)
+    assert reloaded.get("abc")["url"] == IMAGE_URL
+    assert not (tmp_path / "images.json.tmp").exists()
+
+
+@respx.mock
+async def test_seed_hashes_images_used_by_posts(index, tools, image):
+    respx.get(f"{BASE_API}/posts/").respond(json={
+        "posts": [{
+            "id": "p1",
+            "feature_image": IMAGE_URL,
+            "html": f'<img src="{TEST_URL}/content/images/size/w600/2024/01/photo.png">'
+                    f'<img src="{TEST_URL}/content/images/2024/01/other.jpg">',
+        }],
+        "meta": {"pagination": {"next": None}},
+    })
+    respx.get(f"{BASE_API}/pages/").respond(json={"pages": [], "meta": {"pagination": {"next": None}}})
+    respx.get(IMAGE_URL).respond(content=image.read_bytes())
+    respx.get(f"{TEST_URL}/content/images/2024/01/other.jpg").respond(content=b"other")
+    upload = respx.post(f"{BASE_API}/images/upload/")
+
+    result = await tools["ghost_index_uploaded_images"]()
+    assert "Indexed images: 2 new, 2 total" in result
+
+    reused = await tools["ghost_upload_image"](file_path=str(image))
+    assert IMAGE_URL in reused
+    assert upload.call_count == 0
+
+
+@respx.mock
+async def test_upload_without_index_always_uploads(tools, image):
+    route = respx.post(f"{BASE_API}/images/upload/").respond(json={"images": [{"url": IMAGE_URL}]})
+    await tools["ghost_upload_image"](file_path=str(image))
+    await tools["ghost_upload_image"](file_path=str(image))
+    assert route.call_count == 2
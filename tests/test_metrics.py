@@ -0,0 +1,128 @@
+"""Tests for tool and HTTP metrics."""
+
+import asyncio
+
+import pytest
+import respx
+
+from ghost_mcp.metrics import Counter, Gauge, Histogram, Metrics, render, serve_metrics
+from ghost_mcp.server import create_server
+from tests.conftest import BASE_API, TEST_KEY, TEST_URL
+
+
+def test_render_openmetrics():
+    calls = Counter("calls", "Calls.", ("tool",))
+    calls.inc("a")
+    calls.inc("a", amount=2)
+    gauge = Gauge("in_flight", "In flight.")
+    gauge.set(value=3)
+    latency = Histogram("latency_seconds", "Latency.", ("tool",), buckets=(0.1, 1.0))
+    latency.observe(0.05, 'say "hi"')
+    latency.observe(0.5, 'say "hi"')
+
+    assert render([calls, gauge, latency]).splitlines() == [
+        "# TYPE calls counter",
+        "# HELP calls Calls.",
+        'calls_total{tool="a"} 3',
+        "# TYPE in_flight gauge",
+        "# HELP in_flight In flight.",
+        "in_flight 3",
+        "# TYPE latency_seconds histogram",
+        "# HELP latency_seconds Latency.",
+        'latency_seconds_bucket{tool="say \\"hi\\"",le="0.1"} 1',
+        'latency_seconds_bucket{tool="say \\"hi\\"",le="1"} 2',
+        'latency_seconds_bucket{tool="say \\"hi\\"",le="+Inf"} 2',
+        'latency_seconds_sum{tool="say \\"hi\\""} 0.55',
+        'latency_seconds_count{tool="say \\"hi\\""} 2',
+        "# EOF",
+    ]
+
+
+def test_histogram_quantile():
+    histogram = Histogram("h", "H.", buckets=(1.0, 2.0))
+    assert histogram.quantile(0.5) is None
+    for value in (0.5, 1.5, 1.5, 5.0):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == pytest.approx(1.5)
+    assert histogram.quantile(0.99) == 2.0
+
+
+async def test_instrument_records_outcomes():
+    metrics = Metrics()
+
+    @metrics.instrument
+    async def tool(fail: str = "") -> str:
+        """Doc."""
+        if fail == "raise":
+            raise RuntimeError("boom")
+        return "Error: bad" if fail else "fine"
+
+    assert tool.__name__ == "tool" and tool.__doc__ == "Doc."
+    await tool()
+    await tool(fail="yes")
+    with pytest.raises(RuntimeError):
+        await tool(fail="raise")
+
+    assert metrics.tool_calls.values == {("tool", "ok"): 1, ("tool", "error"): 1, ("tool", "exception"): 1}
+    assert metrics.tool_duration.values[("tool",)][2] == 3
+    assert metrics.tools_in_flight.values[("tool",)] == 0
+
+
+@respx.mock
+async def test_client_records_http_metrics(client):
+    client.metrics = metrics = Metrics()
+    respx.get(f"{BASE_API}/posts/").respond(json={"posts": []})
+    respx.post(f"{BASE_API}/tags/").respond(status_code=422, json={"errors": [{"message": "bad"}]})
+
+    await client.get("posts/")
+    with pytest.raises(Exception):
+        await client.post("tags/", data={"tags": [{"name": "x"}]})
+
+    assert metrics.http_requests.values == {("GET", "posts", "200"): 1, ("POST", "tags", "422"): 1}
+    assert metrics.http_request_size.values[("POST", "tags")] == len('{"tags":[{"name":"x"}]}')
+    assert metrics.http_response_size.values[("GET", "posts")][1] == len('{"posts":[]}')
+    assert metrics.http_in_flight.values == {("posts",): 0, ("tags",): 0}
+
+
+@respx.mock
+async def test_create_server_instruments_every_tool():
+    mcp = create_server(TEST_URL, TEST_KEY, tools={"tags", "images"})
+    respx.get(f"{BASE_API}/tags/").respond(json={"tags": []})
+
+    tools = {tool.name: tool for tool in await mcp.list_tools()}
+    assert "limit" in tools["ghost_list_tags"].inputSchema["properties"]
+    await mcp.call_tool("ghost_list_tags", {"limit": 5})
+    content, _ = await mcp.call_tool("ghost_server_stats", {})
+
+    report = content[0].text
+    assert "- ghost_list_tags: 1 calls (0 failed)" in report
+    assert "- GET tags: 200: 1" in report
+    assert "Known versions: 0" in report
+
+
+async def test_server_stats_without_metrics(tools):
+    assert (await tools["ghost_server_stats"]()).startswith("Metrics: disabled")
+
+
+async def test_serve_metrics():
+    server = await serve_metrics(lambda: "# EOF\n", "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async def fetch(path: str) -> bytes:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response
+
+    try:
+        metrics = await fetch("/metrics")
+        missing = await fetch("/")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert metrics.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert b"application/openmetrics-text" in metrics and metrics.endswith(b"\r\n\r\n# EOF\n")
+    assert missing.startswith(b"HTTP/1.1 404")
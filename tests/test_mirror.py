@@ -0,0 +1,143 @@
+"""Tests for the local SQLite content mirror."""
+
+import httpx
+import pytest
+import respx
+
+from ghost_mcp.mirror import ContentMirror
+from tests.conftest import BASE_API
+
+POSTS = [
+    {
+        "id": "p1",
+        "title": "First",
+        "slug": "first",
+        "status": "published",
+        "published_at": "2024-01-01T00:00:00.000Z",
+        "updated_at": "2024-01-01T00:00:00.000Z",
+        "tags": [{"name": "Tech", "slug": "tech"}],
+        "html": "<p>One</p>",
+    },
+    {
+        "id": "p2",
+        "title": "Second",
+        "slug": "second",
+        "status": "draft",
+        "published_at": None,
+        "updated_at": "2024-01-02T00:00:00.000Z",
+        "tags": [],
+        "html": "<p>Two</p>",
+    },
+]
+
+
+def listing(resource, items):
+    return {resource: items, "meta": {"pagination": {"page": 1, "pages": 1, "next": None}}}
+
+
+@pytest.fixture
+def mirror(client):
+    client.mirror = ContentMirror(client)
+    return client.mirror
+
+
+@respx.mock
+async def test_full_sync_then_reads_are_local(mirror, tools):
+    route = respx.get(f"{BASE_API}/posts/").respond(json=listing("posts", POSTS))
+
+    result = await tools["ghost_list_posts"]()
+    assert "Found posts: 2" in result
+    assert "First" in result and "Second" in result
+
+    drafts = await tools["ghost_list_posts"](status="draft")
+    assert "Found posts: 1" in drafts and "Second" in drafts
+
+    tagged = await tools["ghost_list_posts"](tag="tech")
+    assert "Found posts: 1" in tagged and "First" in tagged
+
+    post = await tools["ghost_get_post"](slug="first")
+    assert "<p>One</p>" in post
+
+    assert route.call_count == 1
+    assert "filter" not in route.calls[0].request.url.params
+    assert route.calls[0].request.url.params["formats"] == "html,plaintext"
+
+
+@respx.mock
+async def test_stale_mirror_syncs_incrementally(mirror, monkeypatch):
+    import ghost_mcp.mirror as mirror_module
+
+    now = 1_000_000.0
+    monkeypatch.setattr(mirror_module.time, "time", lambda: now)
+    route = respx.get(f"{BASE_API}/posts/").mock(side_effect=[
+        httpx.Response(200, json=listing("posts", POSTS)),
+        httpx.Response(200, json=listing("posts", [{**POSTS[1], "title": "Second v2", "updated_at": "2024-01-03"}])),
+    ])
+
+    await mirror.list_items("posts")
+    now += mirror.max_staleness + 1
+    result = await mirror.list_items("posts")
+
+    assert route.call_count == 2
+    assert route.calls[1].request.url.params["filter"] == "updated_at:>='2024-01-02T00:00:00.000Z'"
+    titles = {p["title"] for p in result["posts"]}
+    assert titles == {"First", "Second v2"}
+
+
+@respx.mock
+async def test_full_resync_drops_deleted_items(mirror):
+    respx.get(f"{BASE_API}/posts/").mock(side_effect=[
+        httpx.Response(200, json=listing("posts", POSTS)),
+        httpx.Response(200, json=listing("posts", POSTS[:1])),
+    ])
+    await mirror.sync("posts")
+    await mirror.sync("posts", full=True)
+    assert await mirror.get_item("posts", id="p2") is None
+
+
+@respx.mock
+async def test_writes_mark_mirror_dirty(mirror, tools):
+    route = respx.get(f"{BASE_API}/posts/").respond(json=listing("posts", POSTS))
+    respx.delete(f"{BASE_API}/posts/p1/").respond(status_code=204)
+    respx.post(f"{BASE_API}/posts/").respond(json={
+        "posts": [{"id": "p3", "slug": "third", "status": "draft", "updated_at": "2024-01-04"}],
+    })
+
+    await mirror.list_items("posts")
+    await tools["ghost_delete_post"](id="p1")
+    ids = [row["id"] for row in mirror._db.execute("SELECT id FROM items WHERE resource = 'posts'")]
+    assert ids == ["p2"]
+    assert route.call_count == 1
+
+    await tools["ghost_create_post"](title="Third", markdown_content="x")
+    assert not mirror.is_fresh("posts")
+    assert not mirror.is_fresh("tags")
+
+
+@respx.mock
+async def test_get_missing_from_mirror_falls_back_to_api(mirror, tools):
+    respx.get(f"{BASE_API}/posts/").respond(json=listing("posts", []))
+    api = respx.get(f"{BASE_API}/posts/p9/").respond(json={
+        "posts": [{"id": "p9", "title": "Fresh", "slug": "fresh", "status": "draft"}],
+    })
+    result = await tools["ghost_get_post"](id="p9")
+    assert "Fresh" in result
+    assert api.call_count == 1
+
+
+@respx.mock
+async def test_lexical_reads_bypass_mirror(mirror, tools):
+    api = respx.get(f"{BASE_API}/pages/pg1/").respond(json={
+        "pages": [{"id": "pg1", "title": "About", "slug": "about", "status": "published", "lexical": "{}"}],
+    })
+    await tools["ghost_get_page"](id="pg1", content="lexical")
+    assert api.call_count == 1
+
+
+@respx.mock
+async def test_paginated_listing(mirror):
+    items = [{**POSTS[1], "id": f"p{i}", "slug": f"s{i}", "updated_at": f"2024-01-{i + 1:02d}"} for i in range(5)]
+    respx.get(f"{BASE_API}/posts/").respond(json=listing("posts", items))
+    result = await mirror.list_items("posts", limit=2, page=3)
+    assert [p["id"] for p in result["posts"]] == ["p0"]
+    assert result["meta"]["pagination"] == {"page": 3, "limit": 2, "pages": 3, "total": 5, "next": None}
@@ -0,0 +1,71 @@
+"""Tests for streaming multipart upload bodies."""
+
+import httpx
+import pytest
+import respx
+
+import ghost_mcp.multipart as multipart
+from ghost_mcp.multipart import MultipartFile
+from tests.conftest import BASE_API
+
+
+async def collect(body: MultipartFile) -> list[bytes]:
+    return [chunk async for chunk in body]
+
+
+async def test_body_is_read_in_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr(multipart, "UPLOAD_CHUNK_SIZE", 10)
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"x" * 35)
+    body = MultipartFile(path, "image/png", 35)
+
+    chunks = await collect(body)
+
+    assert [len(c) for c in chunks[1:-1]] == [10, 10, 10, 5]
+    assert int(body.headers["Content-Length"]) == sum(len(c) for c in chunks)
+    boundary = body.headers["Content-Type"].split("boundary=")[1]
+    assert chunks[0].startswith(f"--{boundary}\r\n".encode())
+    assert b'name="file"; filename="photo.png"' in chunks[0]
+    assert chunks[-1] == f"\r\n--{boundary}--\r\n".encode()
+
+
+async def test_body_can_be_iterated_again(tmp_path):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"abc")
+    body = MultipartFile(path, "image/png", 3)
+    assert await collect(body) == await collect(body)
+
+
+async def test_truncated_file_fails_instead_of_sending_short_body(tmp_path):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"abc")
+    body = MultipartFile(path, "image/png", 10)
+    with pytest.raises(OSError, match="shrank"):
+        await collect(body)
+
+
+def test_filename_is_escaped(tmp_path):
+    body = MultipartFile(tmp_path / "x.png", "image/png", 0, filename='a"b.png')
+    assert b'filename="a%22b.png"' in body._head
+
+
+@respx.mock
+async def test_upload_replays_body_after_connect_error(client, tmp_path):
+    path = tmp_path / "photo.png"
+    path.write_bytes(b"\x89PNG" + b"\x00" * 100)
+    client.retry.backoff_base = 0
+    route = respx.post(f"{BASE_API}/images/upload/").mock(side_effect=[
+        httpx.ConnectError("refused"),
+        httpx.Response(201, json={"images": [{"url": "http://test.ghost.io/photo.png"}]}),
+    ])
+
+    result = await client.upload("images/upload/", path, "image/png")
+
+    assert result["images"][0]["url"] == "http://test.ghost.io/photo.png"
+    assert route.call_count == 2
+    request = route.calls[1].request
+    assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert "Transfer-Encoding" not in request.headers
+    assert int(request.headers["Content-Length"]) == len(request.content)
+    assert b"\x89PNG" + b"\x00" * 100 + b"\r\n--" in request.content
+    assert request.headers["Authorization"].startswith("Ghost ")
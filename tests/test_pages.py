@@ -135,6 +135,25 @@ async def test_update_page(tools):
     assert "source=html" in str(put_request.url)
 
 
+@respx.mock
+async def test_update_page_uploads_absolute_image_path(tools, tmp_path):
+    image = tmp_path / "team.png"
+    image.write_bytes(b"\x89PNG team")
+    respx.get(f"{BASE_API}/pages/pg1/").respond(json={
+        "pages": [{"id": "pg1", "updated_at": "2024-01-01T00:00:00.000Z"}],
+    })
+    respx.post(f"{BASE_API}/images/upload/").respond(json={
+        "images": [{"url": "http://test.ghost.io/content/images/team.png"}],
+    })
+    put = respx.put(f"{BASE_API}/pages/pg1/").respond(json={
+        "pages": [{"id": "pg1", "title": "About"}],
+    })
+
+    result = await tools["ghost_update_page"](id="pg1", markdown_content=f"![Team]({image})")
+    assert "Page updated" in result
+    assert b'src=\\"http://test.ghost.io/content/images/team.png\\"' in put.calls[0].request.content
+
+
 @respx.mock
 async def test_update_page_title_only(tools):
     respx.get(f"{BASE_API}/pages/pg1/").respond(json={
@@ -158,3 +177,60 @@ async def test_delete_page(tools):
     result = await tools["ghost_delete_page"](id="pg1")
     assert "pg1" in result
     assert "deleted" in result
+
+
+@respx.mock
+async def test_list_pages_fetch_all(tools):
+    respx.get(f"{BASE_API}/pages/").respond(json={
+        "pages": [{"id": "pg1", "title": "About", "slug": "about", "status": "published"}],
+        "meta": {"pagination": {"page": 1, "pages": 1, "next": None}},
+    })
+
+    result = await tools["ghost_list_pages"](fetch_all=True)
+    assert "Found pages: 1" in result
+    assert "About" in result
+
+
+@respx.mock
+async def test_get_page_lexical(tools):
+    route = respx.get(f"{BASE_API}/pages/pg1/").respond(json={
+        "pages": [{
+            "id": "pg1",
+            "title": "About",
+            "slug": "about",
+            "status": "published",
+            "lexical": '{"root":{}}',
+        }],
+    })
+    result = await tools["ghost_get_page"](id="pg1", content="lexical")
+    assert route.calls[0].request.url.params["formats"] == "lexical"
+    assert 'Lexical content:\n{"root":{}}' in result
+
+
+@respx.mock
+async def test_get_page_metadata_only(tools):
+    route = respx.get(f"{BASE_API}/pages/pg1/").respond(json={
+        "pages": [{"id": "pg1", "title": "About", "slug": "about", "status": "published"}],
+    })
+    result = await tools["ghost_get_page"](id="pg1", content="none")
+    params = route.calls[0].request.url.params
+    assert params["fields"] == "id,title,slug,status,url"
+    assert "formats" not in params
+    assert result.startswith("Title: About")
+
+
+@respx.mock
+async def test_update_page_skips_unchanged_fields(tools):
+    respx.post(f"{BASE_API}/pages/").respond(json={
+        "pages": [{"id": "pg1", "slug": "about", "status": "draft", "updated_at": "2024-01-01T00:00:00.000Z"}],
+    })
+    put = respx.put(f"{BASE_API}/pages/pg1/")
+    await tools["ghost_create_page"](title="About", markdown_content="Hi", slug="about")
+
+    respx.get(f"{BASE_API}/pages/pg1/").respond(json={
+        "pages": [{"id": "pg1", "status": "draft", "updated_at": "2024-01-01T00:00:00.000Z"}],
+    })
+
+    result = await tools["ghost_update_page"](id="pg1", title="About", markdown_content="Hi", slug="about")
+    assert result == "Page pg1 is unchanged."
+    assert put.call_count == 0
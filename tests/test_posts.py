@@ -1,5 +1,8 @@
 """Tests for Ghost post tools."""
 
+import json
+
+import httpx
 import respx
 
 from tests.conftest import BASE_API
@@ -124,6 +127,41 @@ async def test_create_post(tools):
     assert "source=html" in str(request.url)
 
 
+@respx.mock
+async def test_create_post_uploads_local_images(tools, tmp_path):
+    (tmp_path / "chart.png").write_bytes(b"\x89PNG chart")
+    (tmp_path / "photo.jpg").write_bytes(b"\xff\xd8 photo")
+    upload = respx.post(f"{BASE_API}/images/upload/").mock(side_effect=lambda request: httpx.Response(201, json={
+        "images": [{"url": "http://test.ghost.io/content/images/chart.png"
+                    if b"chart" in request.content else "http://test.ghost.io/content/images/photo.jpg"}],
+    }))
+    create = respx.post(f"{BASE_API}/posts/").respond(json={
+        "posts": [{"id": "new3", "slug": "pics", "status": "draft"}],
+    })
+
+    result = await tools["ghost_create_post"](
+        title="Pics",
+        markdown_content="![chart](chart.png)\n\n![photo](photo.jpg)\n\n![chart again](./chart.png)",
+        base_dir=str(tmp_path),
+    )
+
+    assert "Post created" in result
+    assert upload.call_count == 2
+    html = json.loads(create.calls[0].request.content)["posts"][0]["html"]
+    assert html.count('src="http://test.ghost.io/content/images/chart.png"') == 2
+    assert 'src="http://test.ghost.io/content/images/photo.jpg"' in html
+
+
+@respx.mock
+async def test_create_post_with_missing_local_image_creates_nothing(tools, tmp_path):
+    create = respx.post(f"{BASE_API}/posts/")
+    result = await tools["ghost_create_post"](
+        title="Broken", markdown_content="![x](missing.png)", base_dir=str(tmp_path),
+    )
+    assert result.startswith("Error: image not found: missing.png")
+    assert create.call_count == 0
+
+
 @respx.mock
 async def test_create_post_minimal(tools):
     respx.post(f"{BASE_API}/posts/").respond(json={
@@ -230,3 +268,404 @@ async def test_unpublish_already_draft(tools):
 
     result = await tools["ghost_unpublish_post"](id="p1")
     assert "already a draft" in result
+
+
+@respx.mock
+async def test_update_post_uses_known_version(tools):
+    respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{
+            "id": "p1",
+            "title": "Old",
+            "slug": "old",
+            "status": "draft",
+            "updated_at": "2024-01-01T00:00:00.000Z",
+        }],
+    })
+    put_route = respx.put(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "New", "status": "draft", "updated_at": "2024-01-02T00:00:00.000Z"}],
+    })
+
+    await tools["ghost_get_post"](id="p1")
+    await tools["ghost_update_post"](id="p1", title="New")
+    await tools["ghost_update_post"](id="p1", title="Newer")
+
+    assert len(respx.calls) == 3
+    assert b"2024-01-02T00:00:00.000Z" in put_route.calls[1].request.content
+
+
+@respx.mock
+async def test_update_post_version_lookup_is_minimal(tools):
+    respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "status": "draft", "updated_at": "2024-01-01T00:00:00.000Z"}],
+    })
+    respx.put(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "New", "status": "draft"}],
+    })
+
+    await tools["ghost_update_post"](id="p1", title="New")
+    get_request = respx.calls[0].request
+    assert get_request.url.params["fields"] == "id,updated_at,status"
+
+
+@respx.mock
+async def test_update_post_retries_on_conflict(tools):
+    respx.get(f"{BASE_API}/posts/p1/").mock(side_effect=[
+        httpx.Response(200, json={"posts": [{"id": "p1", "updated_at": "2024-01-01T00:00:00.000Z"}]}),
+        httpx.Response(200, json={"posts": [{"id": "p1", "updated_at": "2024-01-05T00:00:00.000Z"}]}),
+    ])
+    put_route = respx.put(f"{BASE_API}/posts/p1/").mock(side_effect=[
+        httpx.Response(409, json={"errors": [{"message": "Saving failed! Someone else is editing this post."}]}),
+        httpx.Response(200, json={"posts": [{"id": "p1", "title": "New", "status": "draft"}]}),
+    ])
+
+    result = await tools["ghost_update_post"](id="p1", title="New")
+    assert "Post updated" in result
+    assert put_route.call_count == 2
+    assert b"2024-01-05T00:00:00.000Z" in put_route.calls[1].request.content
+
+
+@respx.mock
+async def test_publish_post_without_prefetch(tools):
+    respx.post(f"{BASE_API}/posts/").respond(json={
+        "posts": [{"id": "p9", "slug": "s", "status": "draft", "updated_at": "2024-01-01T00:00:00.000Z"}],
+    })
+    put_route = respx.put(f"{BASE_API}/posts/p9/").respond(json={
+        "posts": [{"id": "p9", "status": "published", "url": "http://test.ghost.io/s/"}],
+    })
+
+    await tools["ghost_create_post"](title="T", markdown_content="Body")
+    result = await tools["ghost_publish_post"](id="p9")
+    assert "Post published" in result
+    assert len(respx.calls) == 2
+    assert put_route.call_count == 1
+
+
+@respx.mock
+async def test_publish_confirms_cached_noop(tools):
+    route = respx.get(f"{BASE_API}/posts/p1/").mock(side_effect=[
+        httpx.Response(200, json={"posts": [{
+            "id": "p1", "title": "T", "slug": "t", "status": "published", "updated_at": "2024-01-01",
+        }]}),
+        httpx.Response(200, json={"posts": [{"id": "p1", "status": "draft", "updated_at": "2024-01-02"}]}),
+    ])
+    respx.put(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "status": "published", "url": "/p1/"}],
+    })
+
+    await tools["ghost_get_post"](id="p1")
+    result = await tools["ghost_publish_post"](id="p1")
+    assert "Post published" in result
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_bulk_create_posts(tools):
+    def create(request):
+        import json
+
+        post = json.loads(request.content)["posts"][0]
+        if post["title"] == "Broken":
+            return httpx.Response(422, json={"errors": [{"message": "Validation error"}]})
+        slug = post["title"].lower()
+        return httpx.Response(201, json={"posts": [{"id": f"id-{slug}", "slug": slug, "status": post["status"]}]})
+
+    route = respx.post(f"{BASE_API}/posts/").mock(side_effect=create)
+
+    result = await tools["ghost_bulk_create_posts"](posts=[
+        {"title": "One", "markdown_content": "# One", "tags": ["a"]},
+        {"title": "Broken", "markdown_content": "x"},
+        {"title": "Three", "markdown_content": "Three", "status": "published"},
+        {"title": "Bad spec", "body": "x"},
+    ])
+
+    assert route.call_count == 3
+    assert "Created posts: 2/4" in result
+    assert "1. One — ID: id-one" in result
+    assert "2. Error: Broken" in result and "Validation error" in result
+    assert "3. Three — ID: id-three | Slug: three | Status: published" in result
+    assert "4. Error: Bad spec" in result and "unknown fields: body" in result
+
+
+async def test_bulk_create_posts_empty(tools):
+    result = await tools["ghost_bulk_create_posts"](posts=[])
+    assert "Error" in result
+
+
+@respx.mock
+async def test_list_posts_fetch_all(tools):
+    def handler(request):
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json={
+            "posts": [{"id": f"p{page}", "title": f"Post {page}", "slug": f"post-{page}", "status": "draft"}],
+            "meta": {"pagination": {"page": page, "pages": 2, "next": 2 if page == 1 else None}},
+        })
+
+    route = respx.get(f"{BASE_API}/posts/").mock(side_effect=handler)
+    result = await tools["ghost_list_posts"](status="draft", fetch_all=True)
+    assert "Found posts: 2" in result
+    assert "Post 1" in result and "Post 2" in result
+    assert route.call_count == 2
+    assert "status%3Adraft" in str(route.calls[0].request.url)
+
+
+@respx.mock
+async def test_get_post_default_skips_lexical(tools):
+    route = respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "T", "slug": "t", "status": "draft", "html": "<p>x</p>"}],
+    })
+    await tools["ghost_get_post"](id="p1")
+    params = route.calls[0].request.url.params
+    assert params["formats"] == "html"
+    assert params["include"] == "tags,authors"
+    assert "fields" not in params
+
+
+@respx.mock
+async def test_get_post_metadata_only(tools):
+    route = respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "T", "status": "draft", "tags": [{"name": "ai"}]}],
+    })
+    result = await tools["ghost_get_post"](id="p1", content="none", fields=["title", "status", "tags"])
+    params = route.calls[0].request.url.params
+    assert params["fields"] == "id,title,status"
+    assert params["include"] == "tags"
+    assert "formats" not in params
+    assert result == "title: T\nstatus: draft\ntags: ai"
+
+
+@respx.mock
+async def test_get_post_metadata_only_default_summary(tools):
+    route = respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "T", "slug": "t", "status": "draft", "tags": [], "authors": []}],
+    })
+    result = await tools["ghost_get_post"](id="p1", content="none")
+    params = route.calls[0].request.url.params
+    assert params["fields"] == "id,title,slug,status,custom_excerpt,excerpt,url,published_at,updated_at"
+    assert params["include"] == "tags,authors"
+    assert "formats" not in params
+    assert "Title: T" in result and "content:" not in result
+
+
+@respx.mock
+async def test_get_post_plaintext(tools):
+    route = respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "T", "plaintext": "Just text"}],
+    })
+    result = await tools["ghost_get_post"](id="p1", content="plaintext", fields=["title"])
+    params = route.calls[0].request.url.params
+    assert params["fields"] == "id,title,plaintext"
+    assert params["formats"] == "plaintext"
+    assert "include" not in params
+    assert "Plaintext content:\nJust text" in result
+
+
+async def test_get_post_invalid_content(tools):
+    result = await tools["ghost_get_post"](id="p1", content="pdf")
+    assert "Error: invalid content" in result
+
+
+@respx.mock
+async def test_set_posts_status_publishes_in_one_listing(tools):
+    listing = respx.get(f"{BASE_API}/posts/").respond(json={
+        "posts": [
+            {"id": "p1", "title": "One", "status": "draft", "updated_at": "2024-01-01"},
+            {"id": "p2", "title": "Two", "status": "published", "updated_at": "2024-01-02"},
+            {"id": "p3", "title": "Three", "status": "draft", "updated_at": "2024-01-03"},
+        ],
+        "meta": {"pagination": {"next": None}},
+    })
+    put1 = respx.put(f"{BASE_API}/posts/p1/").respond(json={"posts": [{"id": "p1"}]})
+    respx.put(f"{BASE_API}/posts/p3/").respond(status_code=422, json={"errors": [{"message": "Invalid"}]})
+
+    result = await tools["ghost_set_posts_status"](status="published", post_ids=["p1", "p2", "p3", "p4"])
+
+    assert listing.call_count == 1
+    assert listing.calls[0].request.url.params["filter"] == "id:[p1,p2,p3,p4]"
+    assert json.loads(put1.calls[0].request.content)["posts"][0] == {
+        "status": "published", "updated_at": "2024-01-01",
+    }
+    assert "Set published on posts: 1/2 (1 already published)" in result
+    assert "- One (p1): draft → published" in result
+    assert "- Error: Three (p3)" in result and "Invalid" in result
+    assert "Not found: p4" in result
+
+
+@respx.mock
+async def test_set_posts_status_schedules_by_filter(tools):
+    listing = respx.get(f"{BASE_API}/posts/").respond(json={
+        "posts": [{"id": "p1", "title": "One", "status": "draft", "updated_at": "2024-01-01"}],
+        "meta": {"pagination": {"next": None}},
+    })
+    put = respx.put(f"{BASE_API}/posts/p1/").respond(json={"posts": [{"id": "p1"}]})
+
+    result = await tools["ghost_set_posts_status"](
+        status="scheduled", filter="tag:series", published_at="2999-01-01T09:00:00Z",
+    )
+
+    assert listing.calls[0].request.url.params["filter"] == "tag:series"
+    assert json.loads(put.calls[0].request.content)["posts"][0] == {
+        "status": "scheduled", "published_at": "2999-01-01T09:00:00Z", "updated_at": "2024-01-01",
+    }
+    assert "Set scheduled on posts: 1/1" in result
+
+
+async def test_set_posts_status_validation(tools):
+    set_status = tools["ghost_set_posts_status"]
+    assert "invalid status" in await set_status(status="sent", post_ids=["p1"])
+    assert "published_at is required" in await set_status(status="scheduled", post_ids=["p1"])
+    assert "in the future" in await set_status(
+        status="scheduled", post_ids=["p1"], published_at="2000-01-01T00:00:00Z",
+    )
+    assert "invalid published_at" in await set_status(status="published", post_ids=["p1"], published_at="soon")
+    assert "can't be set" in await set_status(status="draft", post_ids=["p1"], published_at="2000-01-01")
+    assert "provide post_ids or filter" in await set_status(status="draft")
+    assert "invalid post id" in await set_status(status="draft", post_ids=["p1]"])
+
+
+def created_post(request):
+    post = json.loads(request.content)["posts"][0]
+    return httpx.Response(201, json={"posts": [{
+        "id": "p1", "slug": "s", "status": "draft", "title": post["title"], "updated_at": "2024-01-01T00:00:00.000Z",
+    }]})
+
+
+@respx.mock
+async def test_update_post_sends_only_changed_fields(tools):
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=created_post)
+    put = respx.put(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "Renamed", "status": "draft", "updated_at": "2024-01-02T00:00:00.000Z"}],
+    })
+    await tools["ghost_create_post"](title="Title", markdown_content="# Body", tags=["a"])
+
+    result = await tools["ghost_update_post"](id="p1", title="Renamed", markdown_content="# Body", tags=["a"])
+
+    assert "Post updated" in result
+    assert "source=html" not in str(put.calls[0].request.url)
+    assert json.loads(put.calls[0].request.content)["posts"][0] == {
+        "title": "Renamed", "updated_at": "2024-01-01T00:00:00.000Z",
+    }
+    version = respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "status": "draft", "updated_at": "2024-01-02T00:00:00.000Z"}],
+    })
+    result = await tools["ghost_update_post"](id="p1", title="Renamed", markdown_content="# Body")
+    assert result == "Post p1 is unchanged."
+    assert put.call_count == 1
+    assert version.calls[0].request.url.params["fields"] == "id,updated_at,status"
+
+
+@respx.mock
+async def test_update_post_restores_content_changed_elsewhere(tools):
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=created_post)
+    respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "status": "draft", "updated_at": "2024-01-05T00:00:00.000Z"}],
+    })
+    put = respx.put(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "Title", "status": "draft", "updated_at": "2024-01-06T00:00:00.000Z"}],
+    })
+    await tools["ghost_create_post"](title="Title", markdown_content="# Body")
+
+    result = await tools["ghost_update_post"](id="p1", title="Title", markdown_content="# Body")
+
+    assert "Post updated" in result
+    sent = json.loads(put.calls[0].request.content)["posts"][0]
+    assert sent["updated_at"] == "2024-01-05T00:00:00.000Z" and sent["title"] == "Title" and "<h1" in sent["html"]
+
+
+@respx.mock
+async def test_update_post_resends_body_after_unseen_change(tools):
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=created_post)
+    respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "Title", "status": "draft", "updated_at": "2024-01-03T00:00:00.000Z"}],
+    })
+    put = respx.put(f"{BASE_API}/posts/p1/").mock(side_effect=[
+        httpx.Response(409, json={"errors": [{"message": "Saving failed! Someone else is editing this post."}]}),
+        httpx.Response(200, json={"posts": [{"id": "p1", "title": "Title", "status": "draft"}]}),
+    ])
+    await tools["ghost_create_post"](title="Title", markdown_content="# Body")
+
+    result = await tools["ghost_update_post"](id="p1", title="New", markdown_content="# Body")
+
+    assert "Post updated" in result
+    assert json.loads(put.calls[0].request.content)["posts"][0] == {
+        "title": "New", "updated_at": "2024-01-01T00:00:00.000Z",
+    }
+    retry = json.loads(put.calls[1].request.content)["posts"][0]
+    assert retry["updated_at"] == "2024-01-03T00:00:00.000Z" and "<h1" in retry["html"]
+    assert "source=html" in str(put.calls[1].request.url)
+
+
+@respx.mock
+async def test_patch_post_replaces_text_and_sections(tools):
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=created_post)
+    put = respx.put(f"{BASE_API}/posts/p1/").mock(side_effect=[
+        httpx.Response(200, json={"posts": [
+            {"id": "p1", "title": "T", "status": "draft", "updated_at": f"2024-01-0{i}T00:00:00.000Z"},
+        ]})
+        for i in (2, 3)
+    ])
+    await tools["ghost_create_post"](title="T", markdown_content="# Intro\n\nHello wrld.\n\n## Usage\n\nOld\n")
+
+    result = await tools["ghost_patch_post"](id="p1", find="wrld", replace="world")
+    assert "Post patched" in result
+    first = json.loads(put.calls[0].request.content)["posts"][0]
+    assert first["updated_at"] == "2024-01-01T00:00:00.000Z"
+    assert "Hello world." in first["html"]
+    assert "source=html" in str(put.calls[0].request.url)
+
+    await tools["ghost_patch_post"](id="p1", section="usage", content="New")
+    second = json.loads(put.calls[1].request.content)["posts"][0]
+    assert second["updated_at"] == "2024-01-02T00:00:00.000Z"
+    assert "<p>New</p>" in second["html"] and "Old" not in second["html"] and "Hello world." in second["html"]
+
+
+@respx.mock
+async def test_patch_post_refuses_to_overwrite_unseen_changes(tools):
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=created_post)
+    put = respx.put(f"{BASE_API}/posts/p1/").respond(409, json={"errors": [{"message": "Update collision"}]})
+    await tools["ghost_create_post"](title="T", markdown_content="Hello")
+
+    result = await tools["ghost_patch_post"](id="p1", find="Hello", replace="Bye")
+
+    assert "changed elsewhere" in result
+    assert put.call_count == 1
+    assert "no Markdown source" in await tools["ghost_patch_post"](id="p1", find="Hello", replace="Bye")
+
+
+@respx.mock
+async def test_patch_bulk_created_post(tools):
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=created_post)
+    put = respx.put(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "title": "T", "status": "draft", "updated_at": "2024-01-02T00:00:00.000Z"}],
+    })
+    await tools["ghost_bulk_create_posts"](posts=[{"title": "T", "markdown_content": "Hello wrld"}])
+
+    assert "Post patched" in await tools["ghost_patch_post"](id="p1", find="wrld", replace="world")
+    sent = json.loads(put.calls[0].request.content)["posts"][0]
+    assert sent["updated_at"] == "2024-01-01T00:00:00.000Z" and "Hello world" in sent["html"]
+
+
+@respx.mock
+async def test_patch_post_after_publishing(tools):
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=created_post)
+    put = respx.put(f"{BASE_API}/posts/p1/").mock(side_effect=[
+        httpx.Response(200, json={"posts": [
+            {"id": "p1", "title": "T", "status": "published", "updated_at": f"2024-01-0{i}T00:00:00.000Z"},
+        ]})
+        for i in (2, 3, 4)
+    ])
+    await tools["ghost_create_post"](title="T", markdown_content="Hello wrld")
+    assert "published" in await tools["ghost_publish_post"](id="p1")
+
+    assert "Post patched" in await tools["ghost_patch_post"](id="p1", find="wrld", replace="world")
+    sent = json.loads(put.calls[1].request.content)["posts"][0]
+    assert sent["updated_at"] == "2024-01-02T00:00:00.000Z" and "Hello world" in sent["html"]
+
+    await tools["ghost_update_post"](id="p1", title="T", excerpt="Short")
+    sent = json.loads(put.calls[2].request.content)["posts"][0]
+    assert sent == {"custom_excerpt": "Short", "updated_at": "2024-01-03T00:00:00.000Z"}
+
+
+async def test_patch_post_validation(tools):
+    assert "either find/replace or section/content" in await tools["ghost_patch_post"](id="p1")
+    assert "provide replace" in await tools["ghost_patch_post"](id="p1", find="x")
+    assert "no Markdown source" in await tools["ghost_patch_post"](id="p9", section="x", content="y")
@@ -0,0 +1,120 @@
+"""Tests for the adaptive client-side rate limiter."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from ghost_mcp.__main__ import build_rate_limiter
+from ghost_mcp.client import GhostClient
+from ghost_mcp.ratelimit import RateLimiter, endpoint_family
+from ghost_mcp.retry import RetryPolicy
+from tests.conftest import BASE_API, TEST_KEY, TEST_URL
+
+
+def test_endpoint_family():
+    assert endpoint_family("posts/abc/") == "posts"
+    assert endpoint_family("/pages/slug/about/") == "pages"
+    assert endpoint_family("posts/?source=html") == "posts"
+    assert endpoint_family("images/upload/") == "images"
+
+
+async def test_burst_then_throttle():
+    limiter = RateLimiter(rate=50.0, burst=2, max_in_flight=10)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(4):
+        await limiter.acquire("posts")
+        limiter.release(200, 0.0)
+    # Two requests fit the burst, the other two wait ~1/50 s each.
+    assert loop.time() - started >= 0.03
+
+
+async def test_max_in_flight():
+    limiter = RateLimiter(rate=1000.0, burst=100, max_in_flight=2)
+    await limiter.acquire("posts")
+    await limiter.acquire("posts")
+    waiter = asyncio.create_task(limiter.acquire("posts"))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    limiter.release(200, 0.0)
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.in_flight == 2
+
+
+async def test_aimd_adaptation():
+    limiter = RateLimiter(rate=10.0, max_rate=20.0, min_rate=1.0, increase=1.0)
+    await limiter.acquire("posts")
+    limiter.release(429, 0.1)
+    assert limiter.rate == 5.0
+
+    await limiter.acquire("posts")
+    limiter.release(200, 0.1)
+    assert limiter.rate == 5.2
+
+    await limiter.acquire("posts")
+    limiter.release(200, limiter.latency_target + 1)
+    assert limiter.rate < 5.2
+
+
+async def test_round_robin_across_families():
+    limiter = RateLimiter(rate=1000.0, burst=100, max_in_flight=1)
+    await limiter.acquire("images")
+    granted = []
+
+    async def request(family):
+        await limiter.acquire(family)
+        granted.append(family)
+        limiter.release(200, 0.0)
+
+    tasks = [asyncio.create_task(request("images")) for _ in range(3)]
+    tasks.append(asyncio.create_task(request("posts")))
+    await asyncio.sleep(0)
+    limiter.release(200, 0.0)
+    await asyncio.gather(*tasks)
+    assert granted[:2] == ["images", "posts"]
+
+
+async def test_cancelled_waiter_is_removed():
+    limiter = RateLimiter(rate=1000.0, burst=100, max_in_flight=1)
+    await limiter.acquire("posts")
+    waiter = asyncio.create_task(limiter.acquire("tags"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    limiter.release(200, 0.0)
+    assert limiter.in_flight == 0
+    await limiter.acquire("posts")
+
+
+@respx.mock
+async def test_client_feeds_429_into_limiter():
+    limiter = RateLimiter(rate=10.0)
+    c = GhostClient(
+        TEST_URL,
+        TEST_KEY,
+        retry=RetryPolicy(max_attempts=2, backoff_base=0),
+        rate_limiter=limiter,
+    )
+    respx.get(f"{BASE_API}/tags/").mock(side_effect=[
+        httpx.Response(429, text="slow down"),
+        httpx.Response(200, json={"tags": []}),
+    ])
+    await c.get("tags/")
+    assert limiter.rate < 10.0
+    assert limiter.in_flight == 0
+
+
+def test_build_rate_limiter_keeps_rate_under_low_cap():
+    limiter = build_rate_limiter("0.2", None)
+    limiter.in_flight = 1
+    limiter.release(429, 0.0)
+    assert limiter.rate == limiter.min_rate == 0.2
+    assert build_rate_limiter("0", None) is None
+
+
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_build_rate_limiter_rejects_no_in_flight_slots(value):
+    with pytest.raises(ValueError, match="at least 1"):
+        build_rate_limiter(None, value)
@@ -0,0 +1,160 @@
+"""Tests for the retry policy around GhostClient._request."""
+
+import httpx
+import pytest
+import respx
+
+from ghost_mcp.client import GhostAPIError, GhostClient
+from ghost_mcp.retry import RetryBudget, RetryPolicy, is_idempotent, parse_retry_after
+from tests.conftest import BASE_API, TEST_KEY, TEST_URL
+
+
+@pytest.fixture
+def retry_client():
+    """GhostClient that retries without sleeping."""
+    return GhostClient(TEST_URL, TEST_KEY, retry=RetryPolicy(max_attempts=3, backoff_base=0))
+
+
+def test_is_idempotent():
+    assert is_idempotent("GET")
+    assert not is_idempotent("POST", {"posts": [{"title": "x"}]})
+    assert not is_idempotent("PUT", {"posts": [{"title": "x"}]})
+    assert is_idempotent("PUT", {"posts": [{"title": "x", "updated_at": "2024-01-01"}]})
+    assert not is_idempotent("DELETE")
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=4.0)
+    for attempt in range(1, 10):
+        assert 0 <= policy.backoff(attempt) <= 4.0
+
+
+def test_budget_exhaustion():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+@respx.mock
+async def test_get_retries_on_503(retry_client):
+    route = respx.get(f"{BASE_API}/posts/").mock(side_effect=[
+        httpx.Response(503, text="unavailable"),
+        httpx.Response(502, text="bad gateway"),
+        httpx.Response(200, json={"posts": []}),
+    ])
+    result = await retry_client.get("posts/")
+    assert result == {"posts": []}
+    assert route.call_count == 3
+    assert retry_client.last_attempts == 3
+
+
+@respx.mock
+async def test_get_gives_up_after_max_attempts(retry_client):
+    respx.get(f"{BASE_API}/posts/").respond(status_code=504, text="timeout")
+    with pytest.raises(GhostAPIError) as exc_info:
+        await retry_client.get("posts/")
+    assert exc_info.value.status_code == 504
+    assert exc_info.value.attempts == 3
+
+
+@respx.mock
+async def test_transport_error_retried_for_get(retry_client):
+    route = respx.get(f"{BASE_API}/site/").mock(side_effect=[
+        httpx.ReadTimeout("slow"),
+        httpx.Response(200, json={"site": {}}),
+    ])
+    await retry_client.get("site/")
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_post_not_retried_on_502(retry_client):
+    route = respx.post(f"{BASE_API}/posts/").respond(status_code=502, text="bad gateway")
+    with pytest.raises(GhostAPIError):
+        await retry_client.post("posts/", data={"posts": [{"title": "x"}]})
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_post_opt_in_retry(retry_client):
+    route = respx.post(f"{BASE_API}/posts/").mock(side_effect=[
+        httpx.Response(502, text="bad gateway"),
+        httpx.Response(200, json={"posts": [{"id": "1"}]}),
+    ])
+    await retry_client.post("posts/", data={"posts": [{"title": "x"}]}, idempotent=True)
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_post_retried_when_connection_failed(retry_client):
+    route = respx.post(f"{BASE_API}/posts/").mock(side_effect=[
+        httpx.ConnectError("refused"),
+        httpx.Response(200, json={"posts": [{"id": "1"}]}),
+    ])
+    await retry_client.post("posts/", data={"posts": [{"title": "x"}]})
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_post_not_retried_after_read_error(retry_client):
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=httpx.ReadError("reset"))
+    with pytest.raises(httpx.ReadError):
+        await retry_client.post("posts/", data={"posts": [{"title": "x"}]})
+    assert retry_client.last_attempts == 1
+
+
+@respx.mock
+async def test_429_honours_retry_after(retry_client, monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("ghost_mcp.client.asyncio.sleep", fake_sleep)
+    respx.post(f"{BASE_API}/posts/").mock(side_effect=[
+        httpx.Response(429, headers={"Retry-After": "2"}, text="slow down"),
+        httpx.Response(200, json={"posts": [{"id": "1"}]}),
+    ])
+    await retry_client.post("posts/", data={"posts": [{"title": "x"}]})
+    assert delays == [2.0]
+
+
+@respx.mock
+async def test_retry_after_too_long_gives_up(retry_client):
+    route = respx.get(f"{BASE_API}/posts/").respond(
+        status_code=429, headers={"Retry-After": "3600"}, text="slow down",
+    )
+    with pytest.raises(GhostAPIError):
+        await retry_client.get("posts/")
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_versioned_put_retried(retry_client):
+    route = respx.put(f"{BASE_API}/posts/p1/").mock(side_effect=[
+        httpx.Response(503, text="unavailable"),
+        httpx.Response(200, json={"posts": [{"id": "p1"}]}),
+    ])
+    await retry_client.put("posts/p1/", data={"posts": [{"title": "x", "updated_at": "2024"}]})
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_retry_budget_limits_retries():
+    policy = RetryPolicy(max_attempts=5, backoff_base=0, budget=RetryBudget(ratio=0, reserve=1))
+    c = GhostClient(TEST_URL, TEST_KEY, retry=policy)
+    route = respx.get(f"{BASE_API}/posts/").respond(status_code=503, text="down")
+    with pytest.raises(GhostAPIError) as exc_info:
+        await c.get("posts/")
+    assert route.call_count == 2
+    assert exc_info.value.attempts == 2
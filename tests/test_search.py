@@ -0,0 +1,107 @@
+"""Tests for the full-text search tool."""
+
+import respx
+
+from ghost_mcp.mirror import fts_query
+from tests.conftest import BASE_API
+
+
+def listing(resource, items):
+    return {resource: items, "meta": {"pagination": {"page": 1, "pages": 1, "next": None}}}
+
+
+POSTS = [
+    {
+        "id": "p1",
+        "title": "Async Python patterns",
+        "slug": "async-python",
+        "status": "published",
+        "updated_at": "2024-01-01T00:00:00.000Z",
+        "plaintext": "Event loops, tasks and structured concurrency explained.",
+        "tags": [{"name": "Programming", "slug": "programming"}],
+    },
+    {
+        "id": "p2",
+        "title": "Gardening notes",
+        "slug": "gardening",
+        "status": "draft",
+        "updated_at": "2024-01-02T00:00:00.000Z",
+        "plaintext": "Tomatoes need sun. Python snakes do not live in my garden.",
+        "tags": [],
+    },
+]
+
+PAGES = [
+    {
+        "id": "pg1",
+        "title": "About",
+        "slug": "about",
+        "status": "published",
+        "updated_at": "2024-01-01T00:00:00.000Z",
+        "plaintext": "A blog about programming and gardening.",
+        "tags": [],
+    },
+]
+
+
+def mock_content():
+    posts = respx.get(f"{BASE_API}/posts/").respond(json=listing("posts", POSTS))
+    pages = respx.get(f"{BASE_API}/pages/").respond(json=listing("pages", PAGES))
+    return posts, pages
+
+
+def test_fts_query():
+    assert fts_query("async python") == '"async" "python"*'
+    assert fts_query('title:"x" OR') == '"title" "x" "OR"*'
+    assert fts_query("  ") == ""
+
+
+@respx.mock
+async def test_search_ranks_title_matches_first(tools):
+    mock_content()
+    result = await tools["ghost_search_content"](query="python")
+    assert "Found results: 2" in result
+    assert result.index("Async Python patterns") < result.index("Gardening notes")
+    assert "[post/published]" in result
+    assert "**Python**" in result
+
+
+@respx.mock
+async def test_search_prefix_and_tags(tools):
+    mock_content()
+    result = await tools["ghost_search_content"](query="program")
+    assert "Async Python patterns" in result
+    assert "About" in result
+
+
+@respx.mock
+async def test_search_kind_filter(tools):
+    mock_content()
+    result = await tools["ghost_search_content"](query="gardening", kind="pages")
+    assert "Found results: 1" in result
+    assert "[page/published] About" in result
+
+
+@respx.mock
+async def test_search_index_reused_between_queries(tools):
+    posts, pages = mock_content()
+    await tools["ghost_search_content"](query="python")
+    await tools["ghost_search_content"](query="tomatoes")
+    assert posts.call_count == 1
+    assert pages.call_count == 1
+
+
+@respx.mock
+async def test_search_drops_deleted_posts(tools):
+    mock_content()
+    respx.delete(f"{BASE_API}/posts/p2/").respond(status_code=204)
+    await tools["ghost_search_content"](query="tomatoes")
+    await tools["ghost_delete_post"](id="p2")
+    respx.get(f"{BASE_API}/posts/").respond(json=listing("posts", POSTS[:1]))
+    result = await tools["ghost_search_content"](query="tomatoes")
+    assert "Found results: 0" in result
+
+
+async def test_search_invalid_kind(tools):
+    result = await tools["ghost_search_content"](query="x", kind="tags")
+    assert "Error" in result
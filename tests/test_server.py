@@ -0,0 +1,94 @@
+"""Tests for server configuration helpers and session handling."""
+
+import asyncio
+import socket
+
+import pytest
+import respx
+from mcp import ClientSession
+from mcp.client.streamable_http import streamable_http_client
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from ghost_mcp.server import create_server, resolve_transport, serve
+from tests.conftest import BASE_API, TEST_KEY, TEST_URL
+
+
+def test_resolve_transport_defaults():
+    config = resolve_transport({"max_connections": None, "http2": None})
+    assert config.max_connections == 100
+    assert config.http2 is False
+
+
+def test_resolve_transport_parses_values():
+    config = resolve_transport({
+        "max_connections": "50",
+        "keepalive_expiry": "12.5",
+        "http2": "true",
+        "warm_connections": "2",
+    })
+    assert config.max_connections == 50
+    assert config.keepalive_expiry == 12.5
+    assert config.http2 is True
+    assert config.warm_connections == 2
+
+
+def test_resolve_transport_invalid_value():
+    with pytest.raises(ValueError, match="max_connections"):
+        resolve_transport({"max_connections": "many"})
+
+
+@respx.mock
+async def test_sessions_share_one_client():
+    mcp = create_server(TEST_URL, TEST_KEY, tools={"tags"})
+    route = respx.get(f"{BASE_API}/tags/").respond(json={"tags": []})
+    client = mcp.shared.client
+
+    async with create_connected_server_and_client_session(mcp) as first:
+        async with create_connected_server_and_client_session(mcp) as second:
+            assert mcp.shared.sessions == 2
+            await asyncio.gather(first.call_tool("ghost_list_tags", {}), second.call_tool("ghost_list_tags", {}))
+        assert mcp.shared.sessions == 1
+        assert not client._client.is_closed
+        await first.call_tool("ghost_list_tags", {})
+
+    assert route.call_count == 3
+    assert mcp.shared.sessions == 0
+    assert client._client.is_closed
+
+
+async def test_serve_streamable_http_handles_concurrent_sessions():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    mcp = create_server(TEST_URL, TEST_KEY, tools={"images"}, port=port)
+    server = asyncio.create_task(serve(mcp, "streamable-http"))
+
+    async def call_stats() -> str:
+        async with streamable_http_client(f"http://127.0.0.1:{port}/mcp") as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool("ghost_server_stats", {})
+                return result.content[0].text
+
+    try:
+        for _ in range(100):
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+                writer.close()
+                break
+            except OSError:
+                await asyncio.sleep(0.05)
+        reports = await asyncio.gather(call_stats(), call_stats())
+        assert all(report.startswith("Uptime:") for report in reports)
+        assert mcp.shared.sessions >= 1
+        assert not mcp.shared.client._client.is_closed
+    finally:
+        server.cancel()
+        await asyncio.gather(server, return_exceptions=True)
+    assert mcp.shared.sessions == 0 and mcp.shared.client._client.is_closed
+
+
+async def test_serve_rejects_unknown_transport():
+    mcp = create_server(TEST_URL, TEST_KEY, tools={"images"})
+    with pytest.raises(ValueError, match="Unknown transport"):
+        await serve(mcp, "carrier-pigeon")
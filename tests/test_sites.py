@@ -0,0 +1,208 @@
+"""Tests for serving many Ghost sites from one server."""
+
+import asyncio
+import time
+
+import pytest
+import respx
+
+from ghost_mcp.cache import ResponseCache
+from ghost_mcp.ratelimit import RateLimiter
+from ghost_mcp.server import create_server
+from ghost_mcp.sites import Site, SiteClient, SiteRegistry, load_sites
+from tests.conftest import TEST_KEY
+
+BLOG = "http://blog.test"
+DOCS = "http://docs.test"
+SITES = {
+    "blog": Site("blog", BLOG, TEST_KEY),
+    "docs": Site("docs", DOCS, TEST_KEY),
+}
+
+
+def api(url: str) -> str:
+    return f"{url}/ghost/api/admin"
+
+
+def write_sites(tmp_path, text: str) -> str:
+    path = tmp_path / "sites.toml"
+    path.write_text(text)
+    return str(path)
+
+
+def test_load_sites(tmp_path, monkeypatch):
+    monkeypatch.setenv("DOCS_KEY", TEST_KEY)
+    path = write_sites(tmp_path, f"""
+default = "blog"
+
+[sites.blog]
+url = "{BLOG}"
+key = "{TEST_KEY}"
+mirror = "/tmp/blog.db"
+
+[sites.docs]
+url = "{DOCS}"
+key_env = "DOCS_KEY"
+""")
+
+    sites, default = load_sites(path)
+
+    assert default == "blog"
+    assert sites["blog"] == Site("blog", BLOG, TEST_KEY, mirror="/tmp/blog.db")
+    assert sites["docs"].admin_key == TEST_KEY
+
+
+@pytest.mark.parametrize(("text", "error"), [
+    ("", "No [sites.<name>] tables"),
+    ('[sites.a]\nkey = "id:secret"', "Site 'a': missing url"),
+    ('[sites.a]\nurl = "http://a"\nkey_env = "UNSET_GHOST_KEY"', "Site 'a': missing key"),
+    ('[sites.a]\nurl = "http://a"\nkey = "nocolon"', "Site 'a': invalid API key format"),
+    ('[sites.a]\nurl = "http://a"\nkey = "id:secret"\nport = 1', "Site 'a': unknown fields port"),
+    ('default = "b"\n[sites.a]\nurl = "http://a"\nkey = "id:secret"', "Default site 'b' is not in"),
+    ("[sites", "Invalid sites file"),
+])
+def test_load_sites_errors(tmp_path, text, error):
+    with pytest.raises(ValueError, match=error.replace("[", r"\[")):
+        load_sites(write_sites(tmp_path, text))
+
+
+@respx.mock
+async def test_tools_route_to_site():
+    mcp = create_server(None, None, tools={"tags"}, sites=SITES, cache=ResponseCache())
+    blog = respx.get(f"{api(BLOG)}/tags/").respond(json={"tags": [{"id": "t1", "name": "Blog tag", "slug": "b"}]})
+    docs = respx.get(f"{api(DOCS)}/tags/").respond(json={"tags": []})
+
+    tools = {tool.name: tool for tool in await mcp.list_tools()}
+    assert tools["ghost_list_tags"].inputSchema["properties"]["site"]["description"] == "Site name from the sites file"
+
+    content, _ = await mcp.call_tool("ghost_list_tags", {"site": "blog"})
+    assert "Blog tag" in content[0].text
+    await mcp.call_tool("ghost_list_tags", {"site": "docs"})
+    await mcp.call_tool("ghost_list_tags", {"site": "blog"})
+    assert blog.call_count == 1 and docs.call_count == 1  # each site has its own cache
+
+    content, _ = await mcp.call_tool("ghost_list_tags", {})
+    assert content[0].text == "Error: site is required. Available: blog, docs"
+    content, _ = await mcp.call_tool("ghost_list_tags", {"site": "shop"})
+    assert content[0].text == "Error: unknown site 'shop'. Available: blog, docs"
+
+    registry = mcp.shared.sites
+    assert sorted(registry.open_sites()) == ["blog", "docs"]
+    blog_client, docs_client = registry._clients["blog"], registry._clients["docs"]
+    assert blog_client.cache is not docs_client.cache and blog_client.metrics is docs_client.metrics
+
+    async with mcp.shared.session():
+        pass
+    assert registry.open_sites() == {} and blog_client._client.is_closed
+
+
+@respx.mock
+async def test_default_site_and_stats():
+    mcp = create_server(None, None, tools={"tags", "images"}, sites=SITES, default_site="docs")
+    respx.get(f"{api(DOCS)}/tags/").respond(json={"tags": []})
+
+    await mcp.call_tool("ghost_list_tags", {})
+    content, _ = await mcp.call_tool("ghost_server_stats", {})
+
+    report = content[0].text
+    assert "Sites: 1 open of 2 configured, 1 opened and 0 evicted so far" in report
+    assert "- docs: 1 calls in flight" in report and "Current site: docs" in report
+    await mcp.shared.sites.close()
+
+
+def test_site_paths_need_placeholder():
+    with pytest.raises(ValueError, match="include {site}"):
+        create_server(None, None, sites=SITES, mirror="/var/lib/mirror.db")
+    mcp = create_server(None, None, sites=SITES, mirror=":memory:", image_index="/tmp/{site}-images.json")
+    assert mcp.shared.sites is not None
+
+
+def test_single_site_requires_url():
+    with pytest.raises(ValueError, match="url and admin_key are required"):
+        create_server(None, None)
+
+
+async def test_idle_eviction_skips_busy_clients():
+    registry = SiteRegistry(SITES, lambda site: FakeClient(), idle_timeout=10)
+    async with registry.use("blog"):
+        pass
+    release = asyncio.Event()
+
+    async def busy():
+        async with registry.use("docs"):
+            await release.wait()
+
+    task = asyncio.create_task(busy())
+    await asyncio.sleep(0)
+    blog = registry._clients["blog"]
+
+    assert await registry.evict_idle(now=registry._last_used["blog"] + 5) == []
+    assert await registry.evict_idle(now=registry._last_used["blog"] + 3600) == ["blog"]
+    assert blog.closed and list(registry.open_sites()) == ["docs"]
+
+    release.set()
+    await task
+    assert await registry.evict_idle(now=registry._last_used["docs"] + 10) == ["docs"]
+    assert registry.evicted == 2
+
+
+async def test_call_during_eviction_gets_a_fresh_client():
+    gate = asyncio.Event()
+    registry = SiteRegistry(SITES, lambda site: FakeClient(gate), idle_timeout=10)
+    for name in ("blog", "docs"):
+        async with registry.use(name):
+            pass
+    old_docs = registry._clients["docs"]
+
+    eviction = asyncio.create_task(registry.evict_idle(now=time.monotonic() + 3600))
+    await asyncio.sleep(0)  # eviction is now waiting on the first close
+    async with registry.use("docs") as docs:
+        gate.set()
+        assert await eviction == ["blog", "docs"]
+        assert docs is not old_docs and old_docs.closed and not docs.closed
+    assert list(registry.open_sites()) == ["docs"]
+    assert await registry._close(["blog", "blog"]) == []  # already gone
+
+
+async def test_max_open_closes_least_recently_used():
+    sites = {name: Site(name, f"http://{name}.test", TEST_KEY) for name in "abc"}
+    registry = SiteRegistry(sites, lambda site: FakeClient(), default="a", max_open=2)
+    for name in ("a", "b", "a", "c"):
+        async with registry.use(name):
+            pass
+
+    assert sorted(registry.open_sites()) == ["a", "c"]
+    assert registry.opened == 3 and registry.evicted == 1
+
+
+async def test_site_client_forwards_to_current_site():
+    registry = SiteRegistry(SITES, lambda site: FakeClient())
+    client = SiteClient(registry)
+    with pytest.raises(RuntimeError):
+        client.mirror
+
+    async with registry.use("docs") as docs:
+        client.search_index = "index"
+        assert client.current() == ("docs", docs)
+    assert docs.search_index == "index"
+
+
+def test_rate_limiter_template_copied_per_site():
+    mcp = create_server(None, None, sites=SITES, rate_limiter=RateLimiter(max_rate=5))
+    build = mcp.shared.sites.build
+    blog, docs = build(SITES["blog"]), build(SITES["docs"])
+    assert blog.rate_limiter is not docs.rate_limiter and blog.rate_limiter.max_rate == 5
+
+
+class FakeClient:
+    mirror = None
+    search_index = None
+
+    def __init__(self, gate: asyncio.Event | None = None):
+        self.gate = gate
+        self.closed = False
+
+    async def close(self):
+        if self.gate is not None:
+            await self.gate.wait()
+        self.closed = True
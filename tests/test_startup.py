@@ -0,0 +1,59 @@
+"""Startup cost: what importing the server and registering tools pulls in, measured in a fresh interpreter."""
+
+import os
+import subprocess
+import sys
+
+# Self time of ghost_mcp's own modules at import, as a share of the time the
+# same interpreter spends importing FastMCP. It measures about 1.8%; the budget
+# is twice that, so doubling the import cost fails however fast the machine is.
+IMPORT_BUDGET = 0.036
+BASELINE = "mcp.server.fastmcp"
+# Imported on first use: Markdown conversion, request signing, the sites file, the mirror and tool groups.
+DEFERRED = ("markdown", "jwt", "tomllib", "ghost_mcp.mirror", "ghost_mcp.tools")
+
+
+def run(code: str, *flags: str, env: dict | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *flags, "-c", code], capture_output=True, text=True, check=True, env=env)
+
+
+def import_times(stderr: str) -> dict[str, tuple[int, int]]:
+    """Module -> (self, cumulative) time in microseconds, from ``python -X importtime`` output."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(self_us), int(cumulative_us)
+    return times
+
+
+def test_import_defers_heavy_dependencies(tmp_path):
+    # Time warm imports: a first run fills a private bytecode cache, since
+    # stale or unwritable .pyc files would otherwise be compiled every time.
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": str(tmp_path)}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    run("import ghost_mcp.__main__", env=env)
+    times = import_times(run("import ghost_mcp.__main__", "-X", "importtime", env=env).stderr)
+
+    assert "ghost_mcp.server" in times
+    assert [name for name in times if name.startswith(DEFERRED)] == []
+    own = sum(us for name, (us, _) in times.items() if name.split(".")[0] == "ghost_mcp")
+    baseline = times[BASELINE][1]
+    assert own < IMPORT_BUDGET * baseline, (
+        f"ghost_mcp modules took {own / 1000:.1f}ms to import, {own / baseline:.1%} of {BASELINE}"
+    )
+
+
+def test_excluded_tool_groups_are_not_imported():
+    code = (
+        "import sys\n"
+        "from ghost_mcp.server import create_server\n"
+        "create_server('http://test.ghost.io', 'id:aabb', tools={'tags'})\n"
+        "print('\\n'.join(sorted(m for m in sys.modules if m.startswith(('ghost_mcp', 'markdown', 'jwt')))))\n"
+    )
+    modules = run(code).stdout.split()
+
+    assert [m for m in modules if m.startswith(DEFERRED)] == [
+        "ghost_mcp.tools", "ghost_mcp.tools.common", "ghost_mcp.tools.tags",
+    ]
@@ -1,9 +1,22 @@
 """Tests for Ghost tag tools."""
 
+import json
+
+import httpx
 import respx
 
 from tests.conftest import BASE_API
 
+TAGS = [
+    {"id": "t1", "name": "Tech", "slug": "tech", "updated_at": "2024-01-01"},
+    {"id": "t2", "name": "Technology", "slug": "technology", "updated_at": "2024-01-01"},
+    {"id": "t3", "name": "AI", "slug": "ai", "updated_at": "2024-01-01"},
+]
+
+
+def tag_listing(tags):
+    return {"tags": tags, "meta": {"pagination": {"next": None}}}
+
 
 @respx.mock
 async def test_list_tags(tools):
@@ -75,3 +88,138 @@ async def test_delete_tag(tools):
     result = await tools["ghost_delete_tag"](id="t1")
     assert "t1" in result
     assert "deleted" in result
+
+
+@respx.mock
+async def test_list_tags_pagination(tools):
+    respx.get(f"{BASE_API}/tags/").respond(json={
+        "tags": [{"id": "t1", "name": "Tech", "slug": "tech"}],
+        "meta": {"pagination": {"page": 2, "pages": 3, "total": 120}},
+    })
+
+    result = await tools["ghost_list_tags"](page=2)
+    assert "Found tags: 120 (page 2/3)" in result
+    assert respx.calls[0].request.url.params["page"] == "2"
+
+
+@respx.mock
+async def test_list_tags_fetch_all(tools):
+    respx.get(f"{BASE_API}/tags/").mock(side_effect=[
+        httpx.Response(200, json={"tags": TAGS[:2], "meta": {"pagination": {"next": 2}}}),
+        httpx.Response(200, json={"tags": TAGS[2:], "meta": {"pagination": {"next": None}}}),
+    ])
+    result = await tools["ghost_list_tags"](fetch_all=True)
+    assert "Found tags: 3" in result and "AI" in result
+
+
+@respx.mock
+async def test_post_writes_reference_known_tags_by_id(client, tools):
+    client.tags.record({"tags": TAGS})
+    route = respx.post(f"{BASE_API}/posts/").respond(json={
+        "posts": [{"id": "p1", "slug": "x", "status": "draft"}],
+    })
+    await tools["ghost_create_post"](title="X", markdown_content="x", tags=["tech", "Brand New"])
+    sent = json.loads(route.calls[0].request.content)["posts"][0]["tags"]
+    assert sent == [{"id": "t1"}, {"name": "Brand New"}]
+    assert len(respx.calls) == 1
+
+
+@respx.mock
+async def test_bulk_create_tags_skips_existing(tools):
+    respx.get(f"{BASE_API}/tags/").respond(json=tag_listing(TAGS))
+    create = respx.post(f"{BASE_API}/tags/").mock(side_effect=lambda request: httpx.Response(201, json={
+        "tags": [{**json.loads(request.content)["tags"][0], "id": "new", "slug": "s"}],
+    }))
+
+    result = await tools["ghost_bulk_create_tags"](tags=[
+        {"name": "Rust"},
+        {"name": "tech"},
+        {"name": "rust"},
+        {"title": "oops"},
+        {"name": "Go", "description": "Gophers"},
+    ])
+
+    assert "Created tags: 2/5" in result
+    assert "2. tech — already exists, ID: t1" in result
+    assert "3. rust — duplicate" in result
+    assert "4. Error: n/a — unknown fields: title" in result
+    assert create.call_count == 2
+
+
+@respx.mock
+async def test_merge_tags_moves_posts_and_deletes_sources(tools):
+    respx.get(f"{BASE_API}/tags/").respond(json=tag_listing(TAGS))
+    posts = respx.get(f"{BASE_API}/posts/").respond(json={
+        "posts": [
+            {"id": "p1", "title": "One", "updated_at": "2024-02-01", "tags": [TAGS[1], TAGS[2]]},
+            {"id": "p2", "title": "Two", "updated_at": "2024-02-02", "tags": [TAGS[0], TAGS[1]]},
+        ],
+        "meta": {"pagination": {"next": None}},
+    })
+    respx.get(f"{BASE_API}/pages/").respond(json={"pages": [], "meta": {"pagination": {"next": None}}})
+    put1 = respx.put(f"{BASE_API}/posts/p1/").respond(json={"posts": [{"id": "p1"}]})
+    put2 = respx.put(f"{BASE_API}/posts/p2/").respond(json={"posts": [{"id": "p2"}]})
+    delete = respx.delete(f"{BASE_API}/tags/t2/").respond(status_code=204)
+
+    result = await tools["ghost_merge_tags"](sources=["Technology"], target="tech")
+
+    assert "Merged Technology into Tech: updated 2/2 posts and pages" in result
+    assert posts.calls[0].request.url.params["filter"] == "tag:[technology]"
+    assert json.loads(put1.calls[0].request.content)["posts"][0] == {
+        "tags": [{"id": "t1"}, {"id": "t3"}], "updated_at": "2024-02-01",
+    }
+    assert json.loads(put2.calls[0].request.content)["posts"][0]["tags"] == [{"id": "t1"}]
+    assert delete.call_count == 1 and "Deleted Technology" in result
+
+
+@respx.mock
+async def test_merge_tags_keeps_sources_when_an_update_fails(tools):
+    respx.get(f"{BASE_API}/tags/").respond(json=tag_listing(TAGS))
+    respx.get(f"{BASE_API}/posts/").respond(json={
+        "posts": [{"id": "p1", "title": "One", "updated_at": "2024-02-01", "tags": [TAGS[1]]}],
+        "meta": {"pagination": {"next": None}},
+    })
+    respx.get(f"{BASE_API}/pages/").respond(json={"pages": [], "meta": {"pagination": {"next": None}}})
+    respx.put(f"{BASE_API}/posts/p1/").respond(status_code=422, json={"errors": [{"message": "nope"}]})
+    delete = respx.delete(f"{BASE_API}/tags/t2/")
+
+    result = await tools["ghost_merge_tags"](sources=["technology"], target="tech")
+    assert "updated 0/1" in result and "nope" in result
+    assert "Source tags kept" in result
+    assert delete.call_count == 0
+
+
+async def test_merge_tags_unknown(tools):
+    with respx.mock:
+        respx.get(f"{BASE_API}/tags/").respond(json=tag_listing(TAGS))
+        result = await tools["ghost_merge_tags"](sources=["nope"], target="tech")
+    assert result == "Error: unknown tags: nope"
+
+
+@respx.mock
+async def test_retag_posts(tools):
+    respx.get(f"{BASE_API}/tags/").respond(json=tag_listing(TAGS))
+    posts = respx.get(f"{BASE_API}/posts/").respond(json={
+        "posts": [
+            {"id": "p1", "title": "One", "updated_at": "2024-02-01", "tags": [TAGS[0], TAGS[2]]},
+            {"id": "p2", "title": "Two", "updated_at": "2024-02-02", "tags": [TAGS[1]]},
+        ],
+        "meta": {"pagination": {"next": None}},
+    })
+    put1 = respx.put(f"{BASE_API}/posts/p1/").respond(json={"posts": [{"id": "p1"}]})
+    put2 = respx.put(f"{BASE_API}/posts/p2/").respond(json={"posts": [{"id": "p2"}]})
+
+    result = await tools["ghost_retag_posts"](
+        post_ids=["p1", "p2"], filter="status:draft", add=["technology", "Fresh"], remove=["ai", "tech"],
+    )
+
+    assert posts.calls[0].request.url.params["filter"] == "id:[p1,p2]+(status:draft)"
+    assert json.loads(put1.calls[0].request.content)["posts"][0]["tags"] == [{"id": "t2"}, {"name": "Fresh"}]
+    assert json.loads(put2.calls[0].request.content)["posts"][0]["tags"] == [{"id": "t2"}, {"name": "Fresh"}]
+    assert "Retagged posts: 2/2 (0 already matched)" in result
+
+
+async def test_retag_posts_needs_selection_and_changes(tools):
+    assert "Error" in await tools["ghost_retag_posts"](add=["x"])
+    assert "Error" in await tools["ghost_retag_posts"](post_ids=["p1"])
+    assert "invalid post id" in await tools["ghost_retag_posts"](post_ids=["p1]"], add=["x"])
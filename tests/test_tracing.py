@@ -0,0 +1,152 @@
+"""Tests for tracing spans and exporters."""
+
+import io
+import json
+
+import httpx
+import pytest
+import respx
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+from mcp.types import RequestParams
+
+from ghost_mcp import tracing
+from ghost_mcp.cache import ResponseCache
+from ghost_mcp.client import GhostClient
+from ghost_mcp.retry import RetryPolicy
+from ghost_mcp.server import create_server
+from tests.conftest import BASE_API, TEST_KEY, TEST_URL
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class Collector:
+    def __init__(self):
+        self.spans = []
+        self.closed = False
+
+    def export(self, span):
+        self.spans.append(span)
+
+    def close(self):
+        self.closed = True
+
+    def named(self, name):
+        return [s for s in self.spans if s.name == name]
+
+
+@pytest.fixture
+def collector():
+    collector = Collector()
+    tracing.set_tracer(tracing.Tracer([collector]))
+    yield collector
+    tracing.set_tracer(None)
+
+
+def test_span_is_noop_without_tracer():
+    assert tracing.span("anything") is tracing.NOOP_SPAN
+    with tracing.span("anything") as span:
+        span.set(a=1)
+    assert tracing.current() is tracing.NOOP_SPAN
+
+
+@respx.mock
+async def test_tool_call_span_tree(collector):
+    mcp = create_server(TEST_URL, TEST_KEY, tools={"posts"}, tracer=tracing.Tracer([collector]))
+    get = respx.get(f"{BASE_API}/posts/p1/").respond(json={
+        "posts": [{"id": "p1", "updated_at": "2024-01-01T00:00:00.000Z", "status": "draft"}],
+    })
+    respx.put(f"{BASE_API}/posts/p1/").respond(json={"posts": [{"id": "p1", "title": "T", "status": "draft"}]})
+
+    await mcp.call_tool("ghost_update_post", {"id": "p1", "markdown_content": "# Hello"})
+
+    (tool,) = collector.named("ghost_update_post")
+    assert tool.root and tool.parent_id is None and tool.attributes["version_cached"] is False
+    by_id = {s.span_id: s for s in collector.spans}
+    assert {s.name for s in collector.spans if s.parent_id == tool.span_id} == {
+        "markdown.convert", "GET posts", "PUT posts",
+    }
+    assert all(s.trace_id == tool.trace_id for s in collector.spans)
+    attempts = collector.named("http.attempt")
+    assert sorted(by_id[a.parent_id].name for a in attempts) == ["GET posts", "PUT posts"]
+    assert get.calls[0].request.headers["traceparent"] == attempts[0].traceparent
+
+
+@respx.mock
+async def test_retries_show_as_attempts(collector):
+    client = GhostClient(TEST_URL, TEST_KEY, retry=RetryPolicy(max_attempts=3, backoff_base=0))
+    respx.get(f"{BASE_API}/tags/").mock(side_effect=[httpx.Response(503), httpx.Response(200, json={"tags": []})])
+
+    await client.get("tags/")
+
+    (request,) = collector.named("GET tags")
+    assert request.attributes["attempts"] == 2
+    assert [name for _, name in request.events] == ["retry in 0.00s"]
+    assert [a.attributes["http.status_code"] for a in collector.named("http.attempt")] == [503, 200]
+
+
+@respx.mock
+async def test_cache_lookup_records_hit(collector):
+    client = GhostClient(TEST_URL, TEST_KEY, cache=ResponseCache())
+    respx.get(f"{BASE_API}/site/").respond(json={"site": {}})
+
+    await client.get("site/")
+    await client.get("site/")
+
+    assert [s.attributes["cache"] for s in collector.named("cache.lookup")] == ["miss", "hit"]
+    assert len(collector.named("GET site")) == 1
+
+
+async def test_tool_span_continues_request_traceparent(collector):
+    @tracing.instrument
+    async def ghost_tool() -> str:
+        with tracing.span("inner"):
+            return "Error: nope"
+
+    meta = RequestParams.Meta(traceparent=PARENT)
+    token = request_ctx.set(RequestContext(request_id=1, meta=meta, session=None, lifespan_context=None))
+    try:
+        await ghost_tool()
+    finally:
+        request_ctx.reset(token)
+
+    inner, tool = collector.spans
+    assert tool.trace_id == "0af7651916cd43dd8448eb211c80319c" and tool.parent_id == "b7ad6b7169203331"
+    assert tool.root and tool.status == "error"
+    assert inner.parent_id == tool.span_id and not inner.root
+
+
+def test_console_exporter_prints_tree():
+    stream = io.StringIO()
+    tracer = tracing.Tracer([tracing.ConsoleExporter(stream)])
+    tracing.set_tracer(tracer)
+    try:
+        with tracing.span("tool", a=1):
+            with tracing.span("child") as child:
+                child.event("connect")
+    finally:
+        tracing.set_tracer(None)
+
+    lines = stream.getvalue().splitlines()
+    assert lines[0].startswith("trace ")
+    assert lines[1].startswith("  tool ") and lines[1].endswith("ms a=1")
+    assert lines[2].startswith("    child ")
+    assert lines[3].startswith("      events: connect +")
+
+
+def test_json_lines_exporter(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    tracer = tracing.Tracer([tracing.JsonLinesExporter(str(path))])
+    tracing.set_tracer(tracer)
+    try:
+        with pytest.raises(RuntimeError):
+            with tracing.span("tool"):
+                raise RuntimeError("boom")
+    finally:
+        tracing.set_tracer(None)
+        tracer.close()
+
+    (record,) = [json.loads(line) for line in path.read_text().splitlines()]
+    assert record["name"] == "tool" and record["status"] == "error"
+    assert record["attributes"] == {"error": "RuntimeError: boom"}
+    assert record["parent_span_id"] is None and len(record["trace_id"]) == 32